@@ -0,0 +1,76 @@
+"""Benchmark: issue_auth_tokens and decode_token throughput per JWT codec.
+
+Run from the repository root, with the application settings (.env) in place:
+
+    PYTHONPATH=src/modules:src python benchmarks/jwt_codecs.py
+
+Codecs whose optional dependency is missing are skipped.
+"""
+
+import argparse
+import timeit
+import uuid
+
+from auth.domain.ports import TokenScope
+from auth.infrastructure.exceptions import JwtCodecUnavailableException
+from auth.infrastructure.services.jwt_codecs import (
+    HmacJwtCodec,
+    JoseJwtCodec,
+    JwtCodec,
+    PyJwtCodec,
+)
+from auth.infrastructure.services.token_manager import JWTTokenManager
+
+CODECS: dict[str, type[JwtCodec]] = {
+    "jose": JoseJwtCodec,
+    "pyjwt": PyJwtCodec,
+    "hmac": HmacJwtCodec,
+}
+
+
+def build_manager(codec: JwtCodec) -> JWTTokenManager:
+    return JWTTokenManager(
+        secret_key="benchmark-secret-key-of-32-bytes",  # noqa: S106
+        algorithm="HS256",
+        access_expire_minutes=15,
+        refresh_expire_days=7,
+        verification_expire_minutes=15,
+        password_reset_expire_minutes=15,
+        codec=codec,
+    )
+
+
+def bench(manager: JWTTokenManager, number: int) -> tuple[float, float]:
+    subject = str(uuid.uuid4())
+    token = manager.create_access_token(subject)
+
+    def issue() -> None:
+        manager.issue_auth_tokens(subject)
+
+    def decode() -> None:
+        manager.decode_token(token, TokenScope.ACCESS)
+
+    issue_seconds = min(timeit.repeat(issue, number=number, repeat=5))
+    decode_seconds = min(timeit.repeat(decode, number=number, repeat=5))
+    return number / issue_seconds, number / decode_seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="calls per repeat")
+    args = parser.parse_args()
+
+    print(f"{'codec':<8}{'issue_auth_tokens':>20}{'decode_token':>16}")
+    for name, codec_cls in CODECS.items():
+        try:
+            manager = build_manager(codec_cls())
+        except JwtCodecUnavailableException:
+            print(f"{name:<8}{'not installed':>20}")
+            continue
+
+        issue, decode = bench(manager, args.number)
+        print(f"{name:<8}{issue:>16,.0f}/s{decode:>12,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Micro-benchmark: per-call statement overhead of the account lookup.
+
+get_current_account loads the account with AccountRepository.get_by_id on
+every authenticated request. This compares a select() built on every call,
+as the repository used to do, with the cached lambda statement it uses now.
+
+By default no database is needed: the session resolves each statement the way
+Connection.execute does before calling the driver (cache key generation and
+compiled cache lookup) and returns no rows. With --live, lookups of unknown
+IDs run against the database from the application settings.
+
+Run from the repository root, with the application settings (.env) in place:
+
+    PYTHONPATH=src/modules:src python benchmarks/repository_statements.py [--live]
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Any
+
+from sqlalchemy import Executable, select
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from auth.domain.entities.account import Account
+from auth.infrastructure.database.models import AccountModel
+from auth.infrastructure.database.repositories import SqlAlchemyAccountRepository
+from config.database import engine
+
+
+class _EmptyResult:
+    def one_or_none(self) -> None:
+        return None
+
+
+class ResolvingSession:
+    """Stands in for AsyncSession up to the driver call."""
+
+    def __init__(self) -> None:
+        self._dialect = PGDialect_asyncpg()
+        self._compiled: dict[Any, Any] = {}
+
+    async def execute(self, stmt: Executable) -> _EmptyResult:
+        cache_key = stmt._generate_cache_key()
+        if cache_key.key not in self._compiled:
+            self._compiled[cache_key.key] = stmt.compile(dialect=self._dialect)
+        return _EmptyResult()
+
+
+class PerCallSelectAccountRepository(SqlAlchemyAccountRepository):
+    """get_by_id building its select() on every call."""
+
+    async def get_by_id(self, id: uuid.UUID) -> Account | None:
+        stmt = select(AccountModel).where(AccountModel.id == id)
+        return await self._execute(stmt)
+
+
+REPOSITORIES: dict[str, type[SqlAlchemyAccountRepository]] = {
+    "select() per call": PerCallSelectAccountRepository,
+    "lambda_stmt": SqlAlchemyAccountRepository,
+}
+
+
+async def bench(repository: SqlAlchemyAccountRepository, number: int) -> float:
+    ids = [uuid.uuid4() for _ in range(number)]
+    await repository.get_by_id(ids[0])  # warm up caches
+
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for account_id in ids:
+            await repository.get_by_id(account_id)
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1_000_000
+
+
+async def run(live: bool, number: int) -> None:
+    print(f"{'statement':<20}{'per call':>14}")
+    for name, repository_cls in REPOSITORIES.items():
+        if live:
+            async with AsyncSession(engine) as session:
+                repository = repository_cls(session, track_aggregates=False)
+                micros = await bench(repository, number)
+        else:
+            repository = repository_cls(ResolvingSession(), track_aggregates=False)
+            micros = await bench(repository, number)
+        print(f"{name:<20}{micros:>11.1f} us")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=5000, help="calls per repeat")
+    parser.add_argument(
+        "--live", action="store_true", help="run the lookups against the database"
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.live, args.number))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Micro-benchmark: cold vs cached access token decoding.
+
+Run from the repository root, with the application settings (.env) in place:
+
+    PYTHONPATH=src/modules:src python benchmarks/token_decode.py
+"""
+
+import argparse
+import timeit
+import uuid
+
+from auth.domain.ports import TokenScope
+from auth.infrastructure.services.token_manager import JWTTokenManager
+
+
+def build_manager(decode_cache_size: int) -> JWTTokenManager:
+    return JWTTokenManager(
+        secret_key="benchmark-secret",  # noqa: S106
+        algorithm="HS256",
+        access_expire_minutes=15,
+        refresh_expire_days=7,
+        verification_expire_minutes=15,
+        password_reset_expire_minutes=15,
+        decode_cache_size=decode_cache_size,
+    )
+
+
+def bench(manager: JWTTokenManager, tokens: list[str], number: int) -> float:
+    def decode_all() -> None:
+        for token in tokens:
+            manager.decode_token(token, TokenScope.ACCESS)
+
+    decode_all()  # warm-up, fills the cache when enabled
+    seconds = min(timeit.repeat(decode_all, number=number, repeat=5))
+    return number * len(tokens) / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=100, help="distinct tokens")
+    parser.add_argument("--number", type=int, default=50, help="passes per repeat")
+    args = parser.parse_args()
+
+    issuer = build_manager(decode_cache_size=0)
+    tokens = [issuer.create_access_token(str(uuid.uuid4())) for _ in range(args.tokens)]
+
+    cold = bench(build_manager(decode_cache_size=0), tokens, args.number)
+    cached = bench(build_manager(decode_cache_size=args.tokens), tokens, args.number)
+
+    print(f"cold decode:   {cold:>12,.0f} ops/s")
+    print(f"cached decode: {cached:>12,.0f} ops/s ({cached / cold:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,7 @@ from shared.domain.exceptions import (
     EntityNotFoundException,
     ValidationException,
 )
+from shared.infrastructure.database.replicas import ReadReplicaRouter
 from shared.infrastructure.exceptions.exception_handler import GlobalExceptionHandler
 from shared.infrastructure.exceptions.exception_registry import (
     ExceptionMetadata,
@@ -32,6 +33,10 @@ from shared.infrastructure.exceptions.exceptions import (
 from shared.infrastructure.messaging.event_producer import (
     KafkaIntegrationEventProducer,
 )
+from shared.infrastructure.metrics.metrics_registry import (
+    MetricsRegistry,
+    MetricsSource,
+)
 
 SHARED_EXCEPTION_MAPPINGS = {
     ValidationException: ExceptionMetadata(
@@ -96,6 +101,12 @@ class AppContainer(containers.DeclarativeContainer):
     settings = providers.Configuration()
 
     session_factory: providers.Provider[Callable[..., Any]] = providers.Dependency()
+    unscoped_session_factory: providers.Provider[Callable[..., Any]] = (
+        providers.Dependency()
+    )
+    replica_router: providers.Dependency[ReadReplicaRouter] = providers.Dependency()
+    listen_dsn: providers.Dependency[str] = providers.Dependency()
+    db_pool_stats: providers.Dependency[MetricsSource] = providers.Dependency()
 
     # --- Integration Events Publisher ----
     event_producer = providers.Resource(
@@ -107,6 +118,9 @@ class AppContainer(containers.DeclarativeContainer):
         AuthContainer,
         settings=settings,
         session_factory=session_factory,
+        unscoped_session_factory=unscoped_session_factory,
+        replica_router=replica_router,
+        listen_dsn=listen_dsn,
         event_producer=event_producer,
     )
 
@@ -114,6 +128,8 @@ class AppContainer(containers.DeclarativeContainer):
         UsersContainer,
         settings=settings,
         session_factory=session_factory,
+        replica_router=replica_router,
+        listen_dsn=listen_dsn,
         event_producer=event_producer,
         auth_contract=auth.auth_module_adapter,
     )
@@ -129,3 +145,18 @@ class AppContainer(containers.DeclarativeContainer):
     )
 
     exc_handler = providers.Singleton(GlobalExceptionHandler, registry=exc_registry)
+
+    # --- Metrics ---
+    metrics_registry = providers.Singleton(
+        MetricsRegistry,
+        sources_list=providers.List(
+            providers.Dict(
+                {
+                    "db.pool": db_pool_stats,
+                    "db.replicas": replica_router.provided.stats,
+                }
+            ),
+            auth.metrics_sources,
+            users.metrics_sources,
+        ),
+    )
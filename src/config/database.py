@@ -1,8 +1,12 @@
+import asyncio
+import logging
 from asyncio import current_task
 from typing import Any
 
+from sqlalchemy import URL, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncAttrs,
+    AsyncConnection,
     AsyncEngine,
     async_scoped_session,
     async_sessionmaker,
@@ -11,22 +15,69 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import DeclarativeBase
 
 from config.env import settings
+from shared.infrastructure.database.pool import InstrumentedAsyncQueuePool
+from shared.infrastructure.database.replicas import ReadReplicaRouter
 
-connect_args: dict[str, Any] = {}
+logger = logging.getLogger(__name__)
+
+
+def with_prepared_statement_cache(url: str | URL) -> URL:
+    """Sizes the per-connection cache of server-side prepared statements.
+
+    The asyncpg dialect prepares every statement and keeps the prepared
+    statements of each pooled connection in an LRU keyed by SQL text, so
+    statements with stable text are parsed and planned once per connection.
+
+    Args:
+        url: Database URL.
+
+    Returns:
+        URL: The URL with the cache size set.
+    """
+    cache_size = str(settings.db.PREPARED_STATEMENT_CACHE_SIZE)
+    return make_url(url).update_query_dict(
+        {"prepared_statement_cache_size": cache_size}
+    )
+
+
+connect_args: dict[str, Any] = {
+    "statement_cache_size": settings.db.STATEMENT_CACHE_SIZE,
+}
+
+engine_options: dict[str, Any] = {
+    "echo": settings.DB_ECHO,
+    "connect_args": connect_args,
+    "poolclass": InstrumentedAsyncQueuePool,
+    "pool_size": settings.db.POOL_SIZE,
+    "max_overflow": settings.db.MAX_OVERFLOW,
+    "pool_timeout": settings.db.POOL_TIMEOUT,
+    "pool_recycle": settings.db.POOL_RECYCLE,
+    "pool_pre_ping": settings.db.POOL_PRE_PING,
+}
 
 engine: AsyncEngine = create_async_engine(
-    settings.db.sqlalchemy_database_url,
-    echo=settings.DB_ECHO,
-    connect_args=connect_args,
+    with_prepared_statement_cache(settings.db.sqlalchemy_database_url),
+    **engine_options,
+)
+
+# Read-only units of work use replicas; without DSNs, reads stay on the primary
+replica_router = ReadReplicaRouter(
+    dsns=[with_prepared_statement_cache(dsn) for dsn in settings.db.REPLICA_DSNS],
+    selection=settings.db.REPLICA_SELECTION,
+    failure_cooldown_seconds=settings.db.REPLICA_FAILURE_COOLDOWN_SECONDS,
+    read_your_writes_seconds=settings.db.READ_YOUR_WRITES_SECONDS,
+    engine_options=engine_options,
 )
 
 
-_async_session_factory = async_sessionmaker(
+# Sessions independent of the request, for work that must not share its
+# transaction
+async_session_factory = async_sessionmaker(
     bind=engine, autoflush=False, expire_on_commit=False
 )
 
 scoped_session_factory = async_scoped_session(
-    session_factory=_async_session_factory,
+    session_factory=async_session_factory,
     scopefunc=current_task,
 )
 
@@ -38,7 +89,42 @@ class Base(AsyncAttrs, DeclarativeBase):
     pass
 
 
+# Function to open pooled connections before the first requests
+async def warm_up_connection_pool(connections: int) -> None:
+    """Opens connections concurrently and returns them to the pool.
+
+    Failures are logged, not raised; the pool then fills on demand.
+
+    Args:
+        connections: Number of connections to open, capped at the pool size.
+    """
+    count = min(connections, settings.db.POOL_SIZE)
+    if count <= 0:
+        return
+
+    conns: list[AsyncConnection] = [engine.connect() for _ in range(count)]
+    results = await asyncio.gather(
+        *(conn.start() for conn in conns), return_exceptions=True
+    )
+    for conn in conns:
+        if conn.sync_connection is not None:
+            await conn.close()
+
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        logger.warning(f"Connection pool warm-up failed: {errors[0]}")
+    else:
+        logger.info(f"Connection pool warmed up: {count} connections")
+
+
+def connection_pool_stats() -> dict[str, Any]:
+    """Returns occupancy and checkout wait times of the connection pool."""
+    pool = engine.pool
+    return pool.stats() if isinstance(pool, InstrumentedAsyncQueuePool) else {}
+
+
 # Function to close the database connection
 async def close_db_connection() -> None:
     """Closes the database engine connection."""
     await engine.dispose()
+    await replica_router.dispose()
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -31,6 +32,18 @@ class DatabaseSettings(BaseModel):
     HOST: str
     PORT: int = 5432
     NAME: str
+    POOL_SIZE: int = 5
+    MAX_OVERFLOW: int = 10
+    POOL_TIMEOUT: float = 30.0
+    POOL_RECYCLE: int = -1
+    POOL_PRE_PING: bool = False
+    POOL_WARMUP_CONNECTIONS: int = 0
+    STATEMENT_CACHE_SIZE: int = 100
+    PREPARED_STATEMENT_CACHE_SIZE: int = 256
+    REPLICA_DSNS: list[str] = []
+    REPLICA_SELECTION: Literal["round_robin", "least_connections"] = "round_robin"
+    REPLICA_FAILURE_COOLDOWN_SECONDS: float = 30.0
+    READ_YOUR_WRITES_SECONDS: float = 5.0
 
     @property
     def sqlalchemy_database_url(self) -> str:
@@ -42,6 +55,16 @@ class DatabaseSettings(BaseModel):
             f"{self.NAME}"
         )
 
+    @property
+    def asyncpg_dsn(self) -> str:
+        """Constructs the DSN for connections opened with asyncpg directly."""
+        return (
+            f"postgresql://"
+            f"{self.USER}:{self.PASSWORD}@"
+            f"{self.HOST}:{self.PORT}/"
+            f"{self.NAME}"
+        )
+
 
 class TokenSettings(BaseModel):
     """Configuration settings for JWT tokens."""
@@ -52,6 +75,76 @@ class TokenSettings(BaseModel):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     VERIFICATION_TOKEN_EXPIRE_MINUTES: int = 15
     PASSWORD_RESET_EXPIRE_MINUTES: int = 15
+    CLAIMS_ONLY_ACCESS: bool = False
+    ACTIVE_KID: str | None = None
+    PRIVATE_KEY_PATHS: dict[str, str] = {}
+    PUBLIC_KEY_PATHS: dict[str, str] = {}
+    DECODE_CACHE_SIZE: int = 0
+    CODEC: Literal["jose", "pyjwt", "hmac"] = "jose"
+    REVOCATION_BUCKET_SECONDS: int = 60
+    ROTATION_INDEX_SIZE: int = 100_000
+    ROTATION_FLUSH_INTERVAL_SECONDS: float = 1.0
+
+
+class HashingSettings(BaseModel):
+    """Configuration settings for password hashing."""
+
+    POOL_KIND: Literal["thread", "process"] = "thread"
+    POOL_MAX_WORKERS: int | None = None
+    POOL_MAX_PENDING: int = 64
+    SCHEME: Literal["bcrypt", "argon2"] = "bcrypt"
+    TARGET_LATENCY_MS: int | None = None
+    BCRYPT_ROUNDS: int = 12
+    ARGON2_TIME_COST: int = 2
+    ARGON2_MEMORY_COST: int = 19456
+    ARGON2_PARALLELISM: int = 1
+
+
+class AccountCacheSettings(BaseModel):
+    """Configuration settings for the in-process account cache."""
+
+    ENABLED: bool = False
+    MAX_SIZE: int = 10_000
+    TTL_SECONDS: float = 30.0
+    NEGATIVE_TTL_SECONDS: float = 5.0
+
+
+class QueryCacheSettings(BaseModel):
+    """Configuration settings for the query result cache."""
+
+    ENABLED: bool = False
+    MAX_SIZE: int = 10_000
+    TTL_SECONDS: dict[str, float] = {
+        "GetMyUserProfileQuery": 5.0,
+        "GetUserProfileByIdQuery": 30.0,
+    }
+
+
+class OutboxSettings(BaseModel):
+    """Configuration settings for the outbox processors."""
+
+    MIN_BATCH_SIZE: int = 20
+    MAX_BATCH_SIZE: int = 500
+    TARGET_BATCH_LATENCY_SECONDS: float = 1.0
+    MIN_POLL_INTERVAL_SECONDS: float = 0.5
+    MAX_POLL_INTERVAL_SECONDS: float = 5.0
+    LISTEN_RECONNECT_SECONDS: float = 5.0
+    DISPATCH_CONCURRENCY: int = 8
+    LEASE_SECONDS: float = 60.0
+
+
+class LoginThrottleSettings(BaseModel):
+    """Configuration settings for login admission control."""
+
+    EMAIL_MAX_FAILURES: int = 5
+    EMAIL_WINDOW_SECONDS: float = 300.0
+    EMAIL_LOCKOUT_SECONDS: float = 900.0
+    IP_MAX_ATTEMPTS: int = 100
+    IP_WINDOW_SECONDS: float = 60.0
+    IP_LOCKOUT_SECONDS: float = 300.0
+    MAX_TRACKED_KEYS: int = 100_000
+    MAX_CONCURRENT_VERIFICATIONS: int = 16
+    QUEUE_TIMEOUT_SECONDS: float = 2.0
 
 
 class Settings(BaseSettings):
@@ -60,10 +153,16 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     APP_BASE_URL: str
     DB_ECHO: bool = False
+    METRICS_ENABLED: bool = False
     mail: MailSettings
     db: DatabaseSettings
     token: TokenSettings
     kafka: KafkaSettings
+    hashing: HashingSettings = HashingSettings()
+    account_cache: AccountCacheSettings = AccountCacheSettings()
+    login_throttle: LoginThrottleSettings = LoginThrottleSettings()
+    query_cache: QueryCacheSettings = QueryCacheSettings()
+    outbox: OutboxSettings = OutboxSettings()
 
     # Pydantic Configuration
     model_config = SettingsConfigDict(
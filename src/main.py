@@ -4,13 +4,27 @@ from contextlib import asynccontextmanager
 
 from app_container import AppContainer
 from fastapi import FastAPI
-from middlewares import db_session_middleware, logging_middleware, request_id_middleware
+from middlewares import (
+    db_session_middleware,
+    logging_middleware,
+    query_batching_middleware,
+    request_id_middleware,
+)
 from users import users_router, users_routes
 
 from auth import auth_router, auth_routes
-from config.database import close_db_connection, scoped_session_factory
+from config.database import (
+    async_session_factory,
+    close_db_connection,
+    connection_pool_stats,
+    replica_router,
+    scoped_session_factory,
+    warm_up_connection_pool,
+)
 from config.env import settings
 from config.logging import setup_logging
+from shared.api import metrics as metrics_routes
+from shared.api.metrics import router as metrics_router
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +35,13 @@ def create_container() -> AppContainer:
     Returns:
         Configured AppContainer instance.
     """
-    container = AppContainer(session_factory=scoped_session_factory)
+    container = AppContainer(
+        session_factory=scoped_session_factory,
+        unscoped_session_factory=async_session_factory,
+        replica_router=replica_router,
+        listen_dsn=settings.db.asyncpg_dsn,
+        db_pool_stats=connection_pool_stats,
+    )
     container.settings.from_pydantic(settings)
     return container
 
@@ -34,6 +54,7 @@ def wire_container(container: AppContainer) -> None:
     """
     container.auth().wire(modules=auth_routes)
     container.users().wire(modules=users_routes)
+    container.wire(modules=[metrics_routes])
 
 
 def setup_middlewares(app: FastAPI) -> None:
@@ -42,6 +63,7 @@ def setup_middlewares(app: FastAPI) -> None:
     Args:
         app: The FastAPI application instance.
     """
+    app.middleware("http")(query_batching_middleware)
     app.middleware("http")(db_session_middleware)
     app.middleware("http")(logging_middleware)
     app.middleware("http")(request_id_middleware)
@@ -55,6 +77,8 @@ def setup_routers(app: FastAPI) -> None:
     """
     app.include_router(auth_router, prefix="/v1/auth")
     app.include_router(users_router, prefix="/v1/users")
+    if settings.METRICS_ENABLED:
+        app.include_router(metrics_router, prefix="/internal/metrics")
 
 
 def setup_exc_handlers(
@@ -81,6 +105,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting application...")
     container: AppContainer = app.state.container
 
+    await warm_up_connection_pool(settings.db.POOL_WARMUP_CONNECTIONS)
+
     if init_task := container.init_resources():
         await init_task
 
@@ -8,6 +8,7 @@ from config.database import scoped_session_factory
 from config.logging import request_id_var
 from shared.application.exceptions import ApplicationException
 from shared.domain.exceptions import DomainException
+from shared.infrastructure.cqrs.batching import query_batch_scope
 
 logger = logging.getLogger(__name__)
 
@@ -77,3 +78,19 @@ async def db_session_middleware(
         return response
     finally:
         await scoped_session_factory.remove()
+
+
+async def query_batching_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Middleware that scopes query batching and memoization to the request.
+
+    Args:
+        request: The incoming request.
+        call_next: Function to call the next middleware/handler.
+
+    Returns:
+        The response from the next handler.
+    """
+    with query_batch_scope():
+        return await call_next(request)
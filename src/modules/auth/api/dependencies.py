@@ -28,11 +28,15 @@ async def get_current_account(
         uow: Unit of Work for database access.
 
     Returns:
-        The authenticated Account entity.
+        The authenticated Account entity. In claims-only mode it is built
+        from the token without a database lookup.
     """
     try:
-        account_id_str = token_manager.decode_token(token, TokenScope.ACCESS)
-        account_id = UUID(account_id_str)
+        payload = token_manager.decode_token_payload(token, TokenScope.ACCESS)
+        account_id = UUID(payload.subject)
+
+        if payload.claims:
+            return Account.from_claims(account_id, payload.claims)
 
         async with uow:
             account = await uow.accounts.get_by_id(account_id)
@@ -1,3 +1,4 @@
+from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -23,3 +24,9 @@ class RefreshTokenResponse(BaseModel):
     access_token: str
     refresh_token: str
     refresh_token_expires_in_seconds: int
+
+
+class JwksResponse(BaseModel):
+    """Response model for the JSON Web Key Set."""
+
+    keys: list[dict[str, Any]]
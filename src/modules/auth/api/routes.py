@@ -1,10 +1,15 @@
 # ruff: noqa: B008
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Response, status
-
-from auth.api.dependencies import get_current_account
-from auth.api.responses import LoginResponse, RefreshTokenResponse, RegisterResponse
+from fastapi import APIRouter, Cookie, Depends, Request, Response, status
+
+from auth.api.dependencies import get_current_account, oauth2_scheme
+from auth.api.responses import (
+    JwksResponse,
+    LoginResponse,
+    RefreshTokenResponse,
+    RegisterResponse,
+)
 from auth.api.schemas import (
     ChangePasswordRequest,
     LoginRequest,
@@ -17,6 +22,7 @@ from auth.api.schemas import (
 )
 from auth.application.commands.change_password import ChangePasswordCommand
 from auth.application.commands.login import LoginCommand, LoginDto
+from auth.application.commands.logout import LogoutCommand
 from auth.application.commands.refresh_token import RefreshTokenCommand, RefreshTokenDto
 from auth.application.commands.register import RegisterCommand
 from auth.application.commands.request_password_reset import RequestPasswordResetCommand
@@ -28,6 +34,7 @@ from auth.application.commands.verify import VerifyEmailCommand
 from auth.application.exceptions import AccountDoesNotExistException
 from auth.containers.auth import AuthContainer
 from auth.domain.entities.account import Account
+from auth.domain.ports import TokenManager
 from shared.api.responses import MessageResponse
 from shared.infrastructure.cqrs.buses import CommandBus
 
@@ -65,6 +72,7 @@ async def register(
 @inject
 async def login(
     request: LoginRequest,
+    http_request: Request,
     response: Response,
     command_bus: CommandBus = Depends(Provide[AuthContainer.command_bus]),
 ) -> LoginResponse:
@@ -72,13 +80,18 @@ async def login(
 
     Args:
         request: Login credentials.
+        http_request: Incoming HTTP request, for the client address.
         response: HTTP response to set cookies.
         command_bus: Command bus to dispatch LoginCommand.
 
     Returns:
         Access and refresh tokens.
     """
-    cmd = LoginCommand(email=request.email, password=request.password)
+    cmd = LoginCommand(
+        email=request.email,
+        password=request.password,
+        client_ip=http_request.client.host if http_request.client else None,
+    )
 
     result: LoginDto = await command_bus.dispatch(cmd)  # type: ignore
     response.set_cookie(
@@ -141,18 +154,29 @@ async def refresh_token(
     response_model=MessageResponse,
     status_code=status.HTTP_200_OK,
 )
+@inject
 async def logout(
-    response: Response, current_account: Account = Depends(get_current_account)
+    response: Response,
+    current_account: Account = Depends(get_current_account),
+    access_token: str = Depends(oauth2_scheme),
+    refresh_token: str | None = Cookie(default=None),
+    command_bus: CommandBus = Depends(Provide[AuthContainer.command_bus]),
 ) -> MessageResponse:
-    """Logs out the user by clearing cookies.
+    """Logs out the user by revoking the session tokens and clearing cookies.
 
     Args:
         response: HTTP response to clear cookies.
         current_account: The authenticated user.
+        access_token: The access token of the request.
+        refresh_token: The refresh token cookie, if present.
+        command_bus: Command bus to dispatch LogoutCommand.
 
     Returns:
         Success message.
     """
+    cmd = LogoutCommand(access_token=access_token, refresh_token=refresh_token)
+    await command_bus.dispatch(cmd)
+
     response.delete_cookie(
         key="refresh_token",
         httponly=True,
@@ -308,3 +332,26 @@ async def change_password(
     await command_bus.dispatch(cmd)
 
     return MessageResponse(message="Your password has been changed successfully.")
+
+
+@router.get(
+    "/.well-known/jwks.json",
+    response_model=JwksResponse,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def jwks(
+    response: Response,
+    token_manager: TokenManager = Depends(Provide[AuthContainer.token_manager]),
+) -> JwksResponse:
+    """Publishes the public keys used to verify access tokens.
+
+    Args:
+        response: HTTP response to set caching headers.
+        token_manager: Service holding the signing keys.
+
+    Returns:
+        JSON Web Key Set.
+    """
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return JwksResponse(**token_manager.public_jwks())
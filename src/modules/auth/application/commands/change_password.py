@@ -57,7 +57,9 @@ class ChangePasswordHandler(Handler[ChangePasswordCommand, None]):
             if not account:
                 raise AccountDoesNotExistException
 
-            account.change_password(old_password_vo, new_password_vo, self._hasher)
+            await account.change_password(
+                old_password_vo, new_password_vo, self._hasher
+            )
 
             await self._uow.accounts.update(account)
 
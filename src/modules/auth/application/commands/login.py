@@ -2,6 +2,8 @@ import logging
 from dataclasses import dataclass
 
 from auth.application.uow import AuthUnitOfWork
+from auth.domain.exceptions import InvalidPasswordException
+from auth.domain.ports import LoginThrottle
 from auth.domain.services.account_authentication import AccountAuthenticationService
 from auth.domain.value_objects.email import Email
 from auth.domain.value_objects.plain_password import PlainPassword
@@ -16,6 +18,7 @@ class LoginCommand(Command):
 
     email: str
     password: str
+    client_ip: str | None = None
 
 
 @dataclass(frozen=True)
@@ -31,10 +34,14 @@ class LoginHandler(Handler[LoginCommand, LoginDto]):
     """Handler for LoginCommand."""
 
     def __init__(
-        self, uow: AuthUnitOfWork, service: AccountAuthenticationService
+        self,
+        uow: AuthUnitOfWork,
+        service: AccountAuthenticationService,
+        throttle: LoginThrottle,
     ) -> None:
         self._uow = uow
         self._service = service
+        self._throttle = throttle
 
     async def handle(self, command: LoginCommand) -> LoginDto:
         """Processes the login command.
@@ -44,17 +51,30 @@ class LoginHandler(Handler[LoginCommand, LoginDto]):
 
         Returns:
             LoginDto containing tokens.
+
+        Raises:
+            TooManyLoginAttemptsException: If the email is locked or the client
+                is over its attempt limit.
+            HashingPoolSaturatedException: If no verification slot frees up.
         """
+        self._throttle.check(command.email, command.client_ip)
+
         email_vo = Email(value=command.email)
         plain_password_vo = PlainPassword(value=command.password)
 
-        async with self._uow:
-            response = await self._service.authenticate(
-                self._uow.accounts, email_vo, plain_password_vo
-            )
+        async with self._throttle.admit(), self._uow:
+            try:
+                response = await self._service.authenticate(
+                    self._uow.accounts, email_vo, plain_password_vo
+                )
+            except InvalidPasswordException:
+                self._throttle.record_failure(command.email)
+                raise
 
             await self._uow.commit()
 
+        self._throttle.record_success(command.email)
+
         logger.info(f"Login successful for email: {command.email}")
         return LoginDto(
             response.access_token,
@@ -0,0 +1,55 @@
+import logging
+from dataclasses import dataclass
+from uuid import UUID
+
+from auth.domain.ports import RefreshTokenStore, TokenManager, TokenScope
+from auth.infrastructure.exceptions import InvalidTokenException, TokenExpiredException
+from shared.application.ports import Command, Handler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LogoutCommand(Command):
+    """Command to revoke the tokens of the current session."""
+
+    access_token: str
+    refresh_token: str | None = None
+
+
+class LogoutHandler(Handler[LogoutCommand, None]):
+    """Handler for LogoutCommand."""
+
+    def __init__(
+        self, token_manager: TokenManager, refresh_tokens: RefreshTokenStore
+    ) -> None:
+        self._token_manager = token_manager
+        self._refresh_tokens = refresh_tokens
+
+    async def handle(self, command: LogoutCommand) -> None:
+        """Processes the logout command.
+
+        Args:
+            command: The command data.
+
+        Raises:
+            InvalidTokenException: If the access token is invalid.
+            TokenExpiredException: If the access token has expired.
+        """
+        self._token_manager.revoke_token(command.access_token, TokenScope.ACCESS)
+
+        if command.refresh_token:
+            try:
+                payload = self._token_manager.revoke_token(
+                    command.refresh_token, TokenScope.REFRESH
+                )
+            except (InvalidTokenException, TokenExpiredException):
+                # Nothing to revoke, the token is already unusable.
+                logger.debug("Refresh token not revoked, it is no longer valid")
+            else:
+                if payload.family is not None:
+                    await self._refresh_tokens.revoke_family(
+                        UUID(payload.subject), payload.family.family_id
+                    )
+
+        logger.info("Session tokens revoked")
@@ -1,8 +1,10 @@
 import logging
 from dataclasses import dataclass
+from uuid import UUID
 
 from auth.application.uow import AuthUnitOfWork
-from auth.domain.ports import TokenManager, TokenScope
+from auth.domain.ports import RefreshTokenStore, TokenManager, TokenScope
+from auth.infrastructure.exceptions import InvalidTokenException
 from shared.application.ports import Command, Dto, Handler
 
 logger = logging.getLogger(__name__)
@@ -27,9 +29,15 @@ class RefreshTokenDto(Dto):
 class RefreshTokenHandler(Handler[RefreshTokenCommand, RefreshTokenDto]):
     """Handler for RefreshTokenCommand."""
 
-    def __init__(self, uow: AuthUnitOfWork, token_manager: TokenManager) -> None:
+    def __init__(
+        self,
+        uow: AuthUnitOfWork,
+        token_manager: TokenManager,
+        refresh_tokens: RefreshTokenStore,
+    ) -> None:
         self._uow = uow
         self._token_manager = token_manager
+        self._refresh_tokens = refresh_tokens
 
     async def handle(self, command: RefreshTokenCommand) -> RefreshTokenDto:
         """Processes the refresh token command.
@@ -39,12 +47,34 @@ class RefreshTokenHandler(Handler[RefreshTokenCommand, RefreshTokenDto]):
 
         Returns:
             RefreshTokenDto containing new tokens.
+
+        Raises:
+            InvalidTokenException: If the token was issued before a password
+                change, or was already rotated or revoked.
         """
-        account_id = self._token_manager.decode_token(
+        payload = self._token_manager.decode_token_payload(
             command.refresh_token, TokenScope.REFRESH
         )
-
-        response = self._token_manager.issue_auth_tokens(account_id)
+        account_id = payload.subject
+
+        claims = None
+        if payload.claims is not None:
+            # Claims-only mode: refresh is where embedded claims get re-read
+            # from the database and stale token versions are rejected.
+            async with self._uow:
+                account = await self._uow.accounts.get_by_id(UUID(account_id))
+
+            if not account or account.token_version != payload.claims.token_version:
+                raise InvalidTokenException("Token has been revoked")
+            claims = account.to_claims()
+
+        # Tokens issued before rotation was introduced start a new family.
+        if payload.family is None:
+            family = await self._refresh_tokens.start_family(UUID(account_id))
+        else:
+            family = await self._refresh_tokens.rotate(UUID(account_id), payload.family)
+
+        response = self._token_manager.issue_auth_tokens(account_id, claims, family)
 
         logger.info(f"Token refreshed for account: {account_id}")
         return RefreshTokenDto(
@@ -44,6 +44,7 @@ class RegisterHandler(Handler[RegisterCommand, None]):
 
         Raises:
             PasswordsDoNotMatchException: If passwords do not match.
+            EmailAlreadyExistsException: If email is taken.
         """
         if command.password != command.confirm_password:
             raise PasswordsDoNotMatchException
@@ -59,8 +60,6 @@ class RegisterHandler(Handler[RegisterCommand, None]):
                 password=plain_password_vo,
             )
 
-            await self._uow.accounts.add(account)
-
             token = self._token_manager.create_verification_token(
                 subject=str(account.id)
             )
@@ -58,7 +58,7 @@ class ResetPasswordHandler(Handler[ResetPasswordCommand, None]):
             if not account:
                 raise AccountDoesNotExistException
 
-            account.reset_password(new_password_vo, self._hasher)
+            await account.reset_password(new_password_vo, self._hasher)
 
             await self._uow.accounts.update(account)
 
@@ -0,0 +1,25 @@
+import logging
+
+from auth.domain.events.password_changed import PasswordChangedDomainEvent
+from auth.domain.events.password_reset_completed import (
+    PasswordResetCompletedDomainEvent,
+)
+from auth.domain.ports import AccountCache
+from shared.application.ports import DomainEventHandler
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidateAccountCacheHandler(
+    DomainEventHandler[PasswordChangedDomainEvent | PasswordResetCompletedDomainEvent]
+):
+    """Drops cached account state once a credential change is committed."""
+
+    def __init__(self, cache: AccountCache) -> None:
+        self._cache = cache
+
+    async def handle(
+        self, event: PasswordChangedDomainEvent | PasswordResetCompletedDomainEvent
+    ) -> None:
+        self._cache.invalidate(event.account_id)
+        logger.debug(f"Account cache invalidated after: {type(event).__name__}")
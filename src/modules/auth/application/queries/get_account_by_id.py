@@ -1,10 +1,11 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 from uuid import UUID
 
 from auth.application.queries.common_dtos import AccountDto
 from auth.application.uow import AuthUnitOfWork
 from auth.contracts.exceptions import ContractAccountNotFoundException
-from shared.application.ports import Handler, Query
+from shared.application.ports import BatchHandler, Query
 
 
 @dataclass(frozen=True)
@@ -14,19 +15,35 @@ class GetAccountByIdQuery(Query):
     account_id: UUID
 
 
-class GetAccountByIdHandler(Handler[GetAccountByIdQuery, AccountDto]):
-    """Handler for GetAccountByIdQuery."""
+class GetAccountByIdHandler(BatchHandler[GetAccountByIdQuery, AccountDto]):
+    """Handler for GetAccountByIdQuery.
+
+    Batches of queries are resolved with a single lookup.
+    """
 
     def __init__(self, uow: AuthUnitOfWork):
         self._uow = uow
 
-    async def handle(self, query: GetAccountByIdQuery) -> AccountDto:
+    async def handle_batch(
+        self, messages: Sequence[GetAccountByIdQuery]
+    ) -> list[AccountDto | Exception]:
         async with self._uow:
-            account = await self._uow.accounts.get_by_id(query.account_id)
-
-        if not account:
-            raise ContractAccountNotFoundException
-
-        return AccountDto(
-            id=account.id, email=account.email.value, is_superuser=account.is_superuser
-        )
+            accounts = await self._uow.accounts.get_many_by_ids(
+                [query.account_id for query in messages]
+            )
+
+        by_id = {account.id: account for account in accounts}
+        results: list[AccountDto | Exception] = []
+        for query in messages:
+            account = by_id.get(query.account_id)
+            if not account:
+                results.append(ContractAccountNotFoundException())
+                continue
+            results.append(
+                AccountDto(
+                    id=account.id,
+                    email=account.email.value,
+                    is_superuser=account.is_superuser,
+                )
+            )
+        return results
@@ -29,7 +29,7 @@ class GetAccountByTokenHandler(Handler[GetAccountByTokenQuery, AccountDto]):
 
     async def handle(self, query: GetAccountByTokenQuery) -> AccountDto:
         try:
-            account_id = self._token_manager.decode_token(
+            payload = self._token_manager.decode_token_payload(
                 query.token, TokenScope.ACCESS
             )
         except TokenExpiredException as e:
@@ -37,8 +37,15 @@ class GetAccountByTokenHandler(Handler[GetAccountByTokenQuery, AccountDto]):
         except InvalidTokenException as e:
             raise ContractInvalidTokenException from e
 
+        if payload.claims:
+            return AccountDto(
+                id=UUID(payload.subject),
+                email=payload.claims.email,
+                is_superuser=payload.claims.is_superuser,
+            )
+
         async with self._uow:
-            account = await self._uow.accounts.get_by_id(UUID(account_id))
+            account = await self._uow.accounts.get_by_id(UUID(payload.subject))
 
         if not account:
             raise ContractAccountNotFoundException
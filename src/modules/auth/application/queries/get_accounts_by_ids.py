@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from auth.application.queries.common_dtos import AccountDto
+from auth.application.uow import AuthUnitOfWork
+from shared.application.ports import Handler, Query
+
+
+@dataclass(frozen=True)
+class GetAccountsByIdsQuery(Query):
+    """Query to retrieve many accounts by ID."""
+
+    account_ids: tuple[UUID, ...]
+
+
+class GetAccountsByIdsHandler(Handler[GetAccountsByIdsQuery, list[AccountDto]]):
+    """Handler for GetAccountsByIdsQuery."""
+
+    def __init__(self, uow: AuthUnitOfWork):
+        self._uow = uow
+
+    async def handle(self, query: GetAccountsByIdsQuery) -> list[AccountDto]:
+        """Returns the found accounts in the order of the requested IDs.
+
+        Missing accounts are skipped rather than raising, so callers can
+        resolve a page of references in one query.
+        """
+        async with self._uow:
+            accounts = await self._uow.accounts.get_many_by_ids(query.account_ids)
+
+        by_id = {account.id: account for account in accounts}
+        return [
+            AccountDto(
+                id=account.id,
+                email=account.email.value,
+                is_superuser=account.is_superuser,
+            )
+            for account in map(by_id.get, dict.fromkeys(query.account_ids))
+            if account is not None
+        ]
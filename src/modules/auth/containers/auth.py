@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import Any
 
 from dependency_injector import containers, providers
@@ -12,13 +12,24 @@ from auth.containers.partials.exception_mappings import AUTH_EXCEPTION_MAPPINGS
 from auth.containers.partials.infra_services import InfraServicesContainer
 from auth.containers.partials.query_handlers import QueryHandlersContainer
 from auth.infrastructure.database.models import AuthOutboxEvent
+from auth.infrastructure.database.refresh_token_store import (
+    WriteBehindRefreshTokenStore,
+)
 from auth.infrastructure.database.uow import SqlAlchemyAuthUnitOfWork
 from auth.infrastructure.module_adapter import AuthModuleAdapter
+from auth.infrastructure.services.account_cache import InMemoryAccountCache
 from shared.application.ports import (
     DomainEventBus,
     DomainEventRegistry,
     IntegrationEventProducer,
 )
+from shared.infrastructure.cqrs.batching import QueryBatchLoader
+from shared.infrastructure.database.replicas import ReadReplicaRouter
+from shared.infrastructure.outbox.batch_controller import AdaptiveBatchController
+from shared.infrastructure.outbox.listener import (
+    OutboxNotificationListener,
+    outbox_channel,
+)
 from shared.infrastructure.outbox.mixin import OutboxMixin
 from shared.infrastructure.outbox.processor import OutboxProcessor
 
@@ -28,7 +39,12 @@ async def init_outbox_processor(
     event_bus: DomainEventBus,
     event_registry: DomainEventRegistry,
     outbox_model: type[OutboxMixin],
-    batch_size: int,
+    batch_controller: AdaptiveBatchController,
+    lease_seconds: float,
+    listen_dsn: str,
+    listen_reconnect_seconds: float,
+    dispatch_concurrency: int,
+    cleanup: Callable[[], Awaitable[None]],
 ) -> AsyncGenerator[None, None]:
     """Initializes and runs the outbox processor task.
 
@@ -37,17 +53,50 @@ async def init_outbox_processor(
         event_bus: Bus to publish events to.
         event_registry: Registry of event types.
         outbox_model: ORM model for outbox table.
-        batch_size: Number of messages to process at once.
+        batch_controller: Controller of batch size and idle polling.
+        lease_seconds: How long a claimed batch is reserved for dispatch.
+        listen_dsn: DSN of the connection listening for new messages.
+        listen_reconnect_seconds: Pause before the listener reconnects.
+        dispatch_concurrency: Maximum number of messages dispatched at once.
+        cleanup: Releases the task-scoped session of a dispatch task.
     """
     processor = OutboxProcessor(
         session_factory=session_factory,
         event_bus=event_bus,
         event_registry=event_registry,
         outbox_model=outbox_model,
-        batch_size=batch_size,
+        batch_controller=batch_controller,
+        lease_seconds=lease_seconds,
+        listener=OutboxNotificationListener(
+            dsn=listen_dsn,
+            channel=outbox_channel(outbox_model),
+            reconnect_delay_seconds=listen_reconnect_seconds,
+        ),
+        dispatch_concurrency=dispatch_concurrency,
+        cleanup=cleanup,
     )
+    task = asyncio.create_task(processor.run_forever(), name="auth_outbox_task")
+    yield
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def init_refresh_token_flusher(
+    store: WriteBehindRefreshTokenStore, interval: float
+) -> AsyncGenerator[None, None]:
+    """Runs the write-behind flush of refresh token families.
+
+    Pending families are flushed once more on shutdown.
+
+    Args:
+        store: Refresh token store to flush.
+        interval: Seconds between flushes.
+    """
     task = asyncio.create_task(
-        processor.run_forever(interval=0.5), name="auth_outbox_task"
+        store.run_forever(interval=interval), name="auth_refresh_token_flusher"
     )
     yield
     task.cancel()
@@ -55,6 +104,7 @@ async def init_outbox_processor(
         await task
     except asyncio.CancelledError:
         pass
+    await store.flush()
 
 
 class AuthContainer(containers.DeclarativeContainer):
@@ -66,47 +116,119 @@ class AuthContainer(containers.DeclarativeContainer):
     )
     settings = providers.Configuration()
     session_factory: providers.Provider[Callable[..., Any]] = providers.Dependency()
+    unscoped_session_factory: providers.Provider[Callable[..., Any]] = (
+        providers.Dependency()
+    )
+    replica_router: providers.Dependency[ReadReplicaRouter] = providers.Dependency()
+    listen_dsn: providers.Dependency[str] = providers.Dependency()
 
     # --- Placeholders ----
     event_bus: providers.Dependency[DomainEventBus] = providers.Dependency()
     event_registry: providers.Dependency[DomainEventRegistry] = providers.Dependency()
 
+    # --- Caching ---
+    account_cache = providers.Singleton(
+        InMemoryAccountCache,
+        max_size=settings.account_cache.MAX_SIZE,
+        ttl_seconds=settings.account_cache.TTL_SECONDS,
+        negative_ttl_seconds=settings.account_cache.NEGATIVE_TTL_SECONDS,
+    )
+
     # --- Unit of Work ---
     uow = providers.Factory(
         SqlAlchemyAuthUnitOfWork,
         session_factory=session_factory,
         event_registry=event_registry,
+        account_cache=providers.Callable(
+            lambda enabled, cache: cache if enabled else None,
+            enabled=settings.account_cache.ENABLED,
+            cache=account_cache,
+        ),
+    )
+    read_uow = providers.Factory(
+        SqlAlchemyAuthUnitOfWork,
+        session_factory=session_factory,
+        event_registry=event_registry,
+        account_cache=providers.Callable(
+            lambda enabled, cache: cache if enabled else None,
+            enabled=settings.account_cache.ENABLED,
+            cache=account_cache,
+        ),
+        read_only=True,
+        replica_router=replica_router,
     )
 
+    outbox_batch_controller = providers.Singleton(
+        AdaptiveBatchController,
+        min_batch_size=settings.outbox.MIN_BATCH_SIZE,
+        max_batch_size=settings.outbox.MAX_BATCH_SIZE,
+        target_latency_seconds=settings.outbox.TARGET_BATCH_LATENCY_SECONDS,
+        min_idle_interval=settings.outbox.MIN_POLL_INTERVAL_SECONDS,
+        max_idle_interval=settings.outbox.MAX_POLL_INTERVAL_SECONDS,
+    )
     outbox_processor = providers.Resource(
         init_outbox_processor,
         session_factory=session_factory,
         event_bus=event_bus,
         event_registry=event_registry,
         outbox_model=providers.Object(AuthOutboxEvent),
-        batch_size=20,
+        batch_controller=outbox_batch_controller,
+        lease_seconds=settings.outbox.LEASE_SECONDS,
+        listen_dsn=listen_dsn,
+        listen_reconnect_seconds=settings.outbox.LISTEN_RECONNECT_SECONDS,
+        dispatch_concurrency=settings.outbox.DISPATCH_CONCURRENCY,
+        cleanup=session_factory.provided.remove,
     )
 
     # --- Sub-Containers ---
     infra_services = providers.Container(InfraServicesContainer, settings=settings)
+
+    # --- Refresh Token Rotation ---
+    refresh_token_store = providers.Singleton(
+        WriteBehindRefreshTokenStore,
+        # Own transactions; never commits or closes the request session
+        session_factory=unscoped_session_factory,
+        ttl_seconds=(
+            infra_services.token_manager.provided.refresh_token_expires_in_seconds
+        ),
+        index_size=settings.token.ROTATION_INDEX_SIZE,
+    )
+
+    refresh_token_flusher = providers.Resource(
+        init_refresh_token_flusher,
+        store=refresh_token_store,
+        interval=settings.token.ROTATION_FLUSH_INTERVAL_SECONDS,
+    )
+
     domain_services = providers.Container(
-        DomainServicesContainer, infra_services=infra_services
+        DomainServicesContainer,
+        infra_services=infra_services,
+        refresh_token_store=refresh_token_store,
     )
     command_handlers = providers.Container(
         CommandHandlersContainer,
         uow=uow,
+        refresh_token_store=refresh_token_store,
         settings=settings,
         infra_services=infra_services,
         domain_services=domain_services,
     )
+    # Batches run in their own task, whose scoped session must be released
+    query_batch_loader = providers.Singleton(
+        QueryBatchLoader, cleanup=session_factory.provided.remove
+    )
     query_handlers = providers.Container(
-        QueryHandlersContainer, uow=uow, infra_services=infra_services
+        QueryHandlersContainer,
+        uow=read_uow,
+        batch_loader=query_batch_loader,
+        infra_services=infra_services,
     )
     domain_event_handlers = providers.Container(
         DomainEventHandlersContainer,
         settings=settings,
         infra_services=infra_services,
         producer=event_producer,
+        account_cache=account_cache,
     )
 
     # --- Module Contract ---
@@ -123,3 +245,14 @@ class AuthContainer(containers.DeclarativeContainer):
     query_bus = query_handlers.bus
     token_manager = infra_services.token_manager
     exception_mappings = providers.Object(AUTH_EXCEPTION_MAPPINGS)
+    metrics_sources = providers.Dict(
+        {
+            "auth.account_cache": account_cache.provided.stats,
+            "auth.token_decode_cache": token_manager.provided.decode_cache_stats,
+            "auth.token_denylist": infra_services.token_denylist.provided.stats,
+            "auth.refresh_token_families": refresh_token_store.provided.stats,
+            "auth.login_throttle": infra_services.login_throttle.provided.stats,
+            "auth.query_batching": query_batch_loader.provided.stats,
+            "auth.outbox": outbox_batch_controller.provided.stats,
+        }
+    )
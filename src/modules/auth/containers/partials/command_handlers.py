@@ -5,6 +5,7 @@ from auth.application.commands.change_password import (
     ChangePasswordHandler,
 )
 from auth.application.commands.login import LoginCommand, LoginHandler
+from auth.application.commands.logout import LogoutCommand, LogoutHandler
 from auth.application.commands.refresh_token import (
     RefreshTokenCommand,
     RefreshTokenHandler,
@@ -24,6 +25,7 @@ from auth.application.commands.reset_password import (
 )
 from auth.application.commands.verify import VerifyEmailCommand, VerifyEmailHandler
 from auth.application.uow import AuthUnitOfWork
+from auth.domain.ports import RefreshTokenStore
 from shared.infrastructure.cqrs.buses import CommandBus
 
 
@@ -39,6 +41,9 @@ class CommandHandlersContainer(containers.DeclarativeContainer):
 
     # --- Dependencies ---
     uow: providers.Dependency[AuthUnitOfWork] = providers.Dependency()
+    refresh_token_store: providers.Dependency[RefreshTokenStore] = (
+        providers.Dependency()
+    )
     settings = providers.Configuration()
 
     infra_services = providers.DependenciesContainer()
@@ -53,7 +58,10 @@ class CommandHandlersContainer(containers.DeclarativeContainer):
     )
 
     login_handler = providers.Factory(
-        LoginHandler, uow=uow, service=domain_services.account_authentication_service
+        LoginHandler,
+        uow=uow,
+        service=domain_services.account_authentication_service,
+        throttle=infra_services.login_throttle,
     )
 
     request_verification_token_handler = providers.Factory(
@@ -82,7 +90,16 @@ class CommandHandlersContainer(containers.DeclarativeContainer):
     )
 
     refresh_token_handler = providers.Factory(
-        RefreshTokenHandler, uow=uow, token_manager=infra_services.token_manager
+        RefreshTokenHandler,
+        uow=uow,
+        token_manager=infra_services.token_manager,
+        refresh_tokens=refresh_token_store,
+    )
+
+    logout_handler = providers.Factory(
+        LogoutHandler,
+        token_manager=infra_services.token_manager,
+        refresh_tokens=refresh_token_store,
     )
 
     # --- Handlers Map ---
@@ -96,6 +113,7 @@ class CommandHandlersContainer(containers.DeclarativeContainer):
             ResetPasswordCommand: reset_password_handler,
             ChangePasswordCommand: change_password_handler,
             RefreshTokenCommand: refresh_token_handler,
+            LogoutCommand: logout_handler,
         }
     )
 
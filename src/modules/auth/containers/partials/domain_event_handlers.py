@@ -3,6 +3,9 @@ from dependency_injector import containers, providers
 from auth.application.events.integration.account_registered import (
     AccountRegisteredIntegrationHandler,
 )
+from auth.application.events.internal.invalidate_account_cache import (
+    InvalidateAccountCacheHandler,
+)
 from auth.application.events.internal.send_password_reset_mail import (
     SendPasswordResetMailHandler,
 )
@@ -10,10 +13,15 @@ from auth.application.events.internal.send_verification_mail import (
     SendVerificationMailHandler,
 )
 from auth.domain.events.account_registered import AccountRegisteredDomainEvent
+from auth.domain.events.password_changed import PasswordChangedDomainEvent
+from auth.domain.events.password_reset_completed import (
+    PasswordResetCompletedDomainEvent,
+)
 from auth.domain.events.password_reset_requested import (
     PasswordResetRequestedDomainEvent,
 )
 from auth.domain.events.verification_requested import VerificationRequestedDomainEvent
+from auth.domain.ports import AccountCache
 from shared.application.ports import (
     IntegrationEventProducer,
 )
@@ -36,6 +44,7 @@ class DomainEventHandlersContainer(containers.DeclarativeContainer):
     settings = providers.Configuration()
     infra_services = providers.DependenciesContainer()
     producer: providers.Dependency[IntegrationEventProducer] = providers.Dependency()
+    account_cache: providers.Dependency[AccountCache] = providers.Dependency()
 
     # --- Event Factories ---
     send_verification_mail_handler = providers.Factory(
@@ -54,6 +63,10 @@ class DomainEventHandlersContainer(containers.DeclarativeContainer):
         AccountRegisteredIntegrationHandler, producer=producer
     )
 
+    invalidate_account_cache_handler = providers.Factory(
+        InvalidateAccountCacheHandler, cache=account_cache
+    )
+
     # --- Handlers Map ---
     handlers = providers.Dict(
         {
@@ -66,6 +79,12 @@ class DomainEventHandlersContainer(containers.DeclarativeContainer):
             AccountRegisteredDomainEvent: providers.List(
                 account_registered_integration_handler.provider
             ),
+            PasswordChangedDomainEvent: providers.List(
+                invalidate_account_cache_handler.provider
+            ),
+            PasswordResetCompletedDomainEvent: providers.List(
+                invalidate_account_cache_handler.provider
+            ),
         }
     )
 
@@ -79,5 +98,7 @@ class DomainEventHandlersContainer(containers.DeclarativeContainer):
             VerificationRequestedDomainEvent,
             AccountRegisteredDomainEvent,
             PasswordResetRequestedDomainEvent,
+            PasswordChangedDomainEvent,
+            PasswordResetCompletedDomainEvent,
         ],
     )
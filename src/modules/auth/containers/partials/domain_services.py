@@ -1,5 +1,6 @@
 from dependency_injector import containers, providers
 
+from auth.domain.ports import RefreshTokenStore
 from auth.domain.services.account_authentication import AccountAuthenticationService
 from auth.domain.services.account_registration import AccountRegistrationService
 
@@ -9,6 +10,9 @@ class DomainServicesContainer(containers.DeclarativeContainer):
 
     # --- Dependencies ---
     infra_services = providers.DependenciesContainer()
+    refresh_token_store: providers.Dependency[RefreshTokenStore] = (
+        providers.Dependency()
+    )
 
     # --- Services ---
     account_registration_service = providers.Factory(
@@ -19,4 +23,5 @@ class DomainServicesContainer(containers.DeclarativeContainer):
         AccountAuthenticationService,
         hasher=infra_services.hasher,
         token_manager=infra_services.token_manager,
+        refresh_tokens=refresh_token_store,
     )
@@ -2,6 +2,10 @@ from starlette import status
 
 from auth.application.exceptions import PasswordsDoNotMatchException
 from auth.domain.exceptions import InvalidPasswordException
+from auth.infrastructure.exceptions import (
+    HashingPoolSaturatedException,
+    TooManyLoginAttemptsException,
+)
 from shared.infrastructure.exceptions.exception_registry import ExceptionMetadata
 
 AUTH_EXCEPTION_MAPPINGS = {
@@ -11,4 +15,10 @@ AUTH_EXCEPTION_MAPPINGS = {
     PasswordsDoNotMatchException: ExceptionMetadata(
         status.HTTP_400_BAD_REQUEST, "password_do_not_match"
     ),
+    HashingPoolSaturatedException: ExceptionMetadata(
+        status.HTTP_503_SERVICE_UNAVAILABLE, "hashing_pool_saturated"
+    ),
+    TooManyLoginAttemptsException: ExceptionMetadata(
+        status.HTTP_429_TOO_MANY_REQUESTS, "too_many_login_attempts"
+    ),
 }
@@ -1,8 +1,82 @@
+from collections.abc import Generator
+
 from dependency_injector import containers, providers
 
+from auth.infrastructure.services.hashing_pool import HashingPool, PoolKind
+from auth.infrastructure.services.jwt_codecs import (
+    HmacJwtCodec,
+    JoseJwtCodec,
+    PyJwtCodec,
+)
+from auth.infrastructure.services.login_throttle import InMemoryLoginThrottle
 from auth.infrastructure.services.mail_sender import AioSmtpMailSender
-from auth.infrastructure.services.password_hasher import BcryptPasswordHasher
+from auth.infrastructure.services.password_hasher import (
+    Argon2PasswordHasher,
+    BcryptPasswordHasher,
+    PasslibPasswordHasher,
+)
+from auth.infrastructure.services.signing_keys import SigningKeyRing
+from auth.infrastructure.services.token_denylist import RevokedTokenDenylist
 from auth.infrastructure.services.token_manager import JWTTokenManager
+from shared.infrastructure.rate_limiting.sliding_window import SlidingWindowLimiter
+
+
+def init_hashing_pool(
+    kind: PoolKind, max_workers: int | None, max_pending: int
+) -> Generator[HashingPool, None, None]:
+    """Initializes the password hashing pool and shuts it down on exit.
+
+    Args:
+        kind: Executor type, "thread" or "process".
+        max_workers: Number of workers. Defaults to the CPU count.
+        max_pending: Maximum number of jobs (running and queued) at once.
+
+    Yields:
+        Initialized HashingPool.
+    """
+    pool = HashingPool(kind=kind, max_workers=max_workers, max_pending=max_pending)
+    yield pool
+    pool.shutdown()
+
+
+def calibrate_password_hasher(
+    hasher: PasslibPasswordHasher, target_latency_ms: int | None
+) -> None:
+    """Tunes the hasher cost to the latency budget on the current hardware.
+
+    Args:
+        hasher: Hasher to calibrate.
+        target_latency_ms: Latency budget per hash. Calibration is skipped if None.
+    """
+    if target_latency_ms is not None:
+        hasher.calibrate(target_latency_ms)
+
+
+def load_signing_key_ring(
+    algorithm: str,
+    active_kid: str | None,
+    private_key_paths: dict[str, str],
+    public_key_paths: dict[str, str],
+) -> SigningKeyRing | None:
+    """Loads the asymmetric signing keys, if the algorithm needs them.
+
+    Args:
+        algorithm: JWS algorithm. HMAC algorithms (HS*) use no key ring.
+        active_kid: Key ID used for signing.
+        private_key_paths: Private key file paths by kid.
+        public_key_paths: Verification-only public key file paths by kid.
+
+    Returns:
+        Loaded SigningKeyRing, or None for HMAC algorithms.
+    """
+    if algorithm.startswith("HS"):
+        return None
+    return SigningKeyRing.from_files(
+        algorithm=algorithm,
+        active_kid=active_kid,
+        private_key_paths=private_key_paths,
+        public_key_paths=public_key_paths,
+    )
 
 
 class InfraServicesContainer(containers.DeclarativeContainer):
@@ -10,7 +84,53 @@ class InfraServicesContainer(containers.DeclarativeContainer):
 
     settings = providers.Configuration()
 
-    hasher = providers.Singleton(BcryptPasswordHasher)
+    hashing_pool = providers.Resource(
+        init_hashing_pool,
+        kind=settings.hashing.POOL_KIND,
+        max_workers=settings.hashing.POOL_MAX_WORKERS,
+        max_pending=settings.hashing.POOL_MAX_PENDING,
+    )
+
+    hasher = providers.Selector(
+        settings.hashing.SCHEME,
+        bcrypt=providers.Singleton(
+            BcryptPasswordHasher,
+            pool=hashing_pool,
+            rounds=settings.hashing.BCRYPT_ROUNDS,
+        ),
+        argon2=providers.Singleton(
+            Argon2PasswordHasher,
+            pool=hashing_pool,
+            time_cost=settings.hashing.ARGON2_TIME_COST,
+            memory_cost=settings.hashing.ARGON2_MEMORY_COST,
+            parallelism=settings.hashing.ARGON2_PARALLELISM,
+        ),
+    )
+
+    hasher_calibration = providers.Resource(
+        calibrate_password_hasher,
+        hasher=hasher,
+        target_latency_ms=settings.hashing.TARGET_LATENCY_MS,
+    )
+
+    key_ring = providers.Singleton(
+        load_signing_key_ring,
+        algorithm=settings.token.ALGORITHM,
+        active_kid=settings.token.ACTIVE_KID,
+        private_key_paths=settings.token.PRIVATE_KEY_PATHS,
+        public_key_paths=settings.token.PUBLIC_KEY_PATHS,
+    )
+
+    jwt_codec = providers.Selector(
+        settings.token.CODEC,
+        jose=providers.Singleton(JoseJwtCodec),
+        pyjwt=providers.Singleton(PyJwtCodec),
+        hmac=providers.Singleton(HmacJwtCodec),
+    )
+
+    token_denylist = providers.Singleton(
+        RevokedTokenDenylist, bucket_seconds=settings.token.REVOCATION_BUCKET_SECONDS
+    )
 
     token_manager = providers.Singleton(
         JWTTokenManager,
@@ -20,6 +140,31 @@ class InfraServicesContainer(containers.DeclarativeContainer):
         refresh_expire_days=settings.token.REFRESH_TOKEN_EXPIRE_DAYS,
         verification_expire_minutes=settings.token.VERIFICATION_TOKEN_EXPIRE_MINUTES,
         password_reset_expire_minutes=settings.token.PASSWORD_RESET_EXPIRE_MINUTES,
+        claims_only_access=settings.token.CLAIMS_ONLY_ACCESS,
+        key_ring=key_ring,
+        decode_cache_size=settings.token.DECODE_CACHE_SIZE,
+        codec=jwt_codec,
+        denylist=token_denylist,
+    )
+
+    login_throttle = providers.Singleton(
+        InMemoryLoginThrottle,
+        email_limiter=providers.Singleton(
+            SlidingWindowLimiter,
+            limit=settings.login_throttle.EMAIL_MAX_FAILURES,
+            window_seconds=settings.login_throttle.EMAIL_WINDOW_SECONDS,
+            lockout_seconds=settings.login_throttle.EMAIL_LOCKOUT_SECONDS,
+            max_keys=settings.login_throttle.MAX_TRACKED_KEYS,
+        ),
+        ip_limiter=providers.Singleton(
+            SlidingWindowLimiter,
+            limit=settings.login_throttle.IP_MAX_ATTEMPTS,
+            window_seconds=settings.login_throttle.IP_WINDOW_SECONDS,
+            lockout_seconds=settings.login_throttle.IP_LOCKOUT_SECONDS,
+            max_keys=settings.login_throttle.MAX_TRACKED_KEYS,
+        ),
+        max_concurrent_verifications=settings.login_throttle.MAX_CONCURRENT_VERIFICATIONS,
+        queue_timeout_seconds=settings.login_throttle.QUEUE_TIMEOUT_SECONDS,
     )
 
     mail_sender = providers.Singleton(AioSmtpMailSender, config=settings.mail)
@@ -8,7 +8,12 @@ from auth.application.queries.get_account_by_token import (
     GetAccountByTokenHandler,
     GetAccountByTokenQuery,
 )
+from auth.application.queries.get_accounts_by_ids import (
+    GetAccountsByIdsHandler,
+    GetAccountsByIdsQuery,
+)
 from auth.application.uow import AuthUnitOfWork
+from shared.infrastructure.cqrs.batching import QueryBatchLoader
 from shared.infrastructure.cqrs.buses import QueryBus
 
 
@@ -24,6 +29,7 @@ class QueryHandlersContainer(containers.DeclarativeContainer):
 
     # --- Dependencies ---
     uow: providers.Dependency[AuthUnitOfWork] = providers.Dependency()
+    batch_loader: providers.Dependency[QueryBatchLoader] = providers.Dependency()
 
     infra_services = providers.DependenciesContainer()
 
@@ -37,13 +43,16 @@ class QueryHandlersContainer(containers.DeclarativeContainer):
         uow=uow,
     )
 
+    get_accounts_by_ids_handler = providers.Factory(GetAccountsByIdsHandler, uow=uow)
+
     # --- Handlers Map ---
     handlers = providers.Dict(
         {
             GetAccountByTokenQuery: get_account_by_token_handler,
             GetAccountByIdQuery: get_account_by_id_handler,
+            GetAccountsByIdsQuery: get_accounts_by_ids_handler,
         }
     )
 
     # --- Bus ---
-    bus = providers.Factory(QueryBus, handlers=handlers)
+    bus = providers.Factory(QueryBus, handlers=handlers, batch_loader=batch_loader)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from auth.contracts.dtos import AuthAccountDto
@@ -16,3 +17,8 @@ class AuthModulePort(ABC):
     async def get_account_by_id(self, id: UUID) -> AuthAccountDto:
         """Retrieves account details by ID."""
         pass
+
+    @abstractmethod
+    async def get_accounts_by_ids(self, ids: Sequence[UUID]) -> list[AuthAccountDto]:
+        """Retrieves details of many accounts in one query, skipping missing ones."""
+        pass
@@ -15,7 +15,7 @@ from auth.domain.exceptions import (
     AccountNotVerifiedException,
     InvalidPasswordException,
 )
-from auth.domain.ports import PasswordHasher
+from auth.domain.ports import AccountClaims, PasswordHasher
 from auth.domain.value_objects.email import Email
 from auth.domain.value_objects.plain_password import PlainPassword
 from shared.domain.primitives import AggregateRoot
@@ -30,6 +30,7 @@ class Account(AggregateRoot):
         id: Unique identifier.
         is_verified: Whether email is verified.
         is_superuser: Whether user has admin privileges.
+        token_version: Incremented when issued tokens must stop being accepted.
     """
 
     email: Email
@@ -37,9 +38,10 @@ class Account(AggregateRoot):
     _password_hash: str = field(default="", repr=False)
     is_verified: bool = False
     is_superuser: bool = False
+    token_version: int = 0
 
     @classmethod
-    def create(
+    async def create(
         cls,
         id: UUID,
         email: Email,
@@ -58,7 +60,7 @@ class Account(AggregateRoot):
             New Account instance.
         """
         new_account = cls(id=id, email=email)
-        new_account.set_password(plain_password, hasher)
+        await new_account.set_password(plain_password, hasher)
 
         new_account.add_event(
             AccountRegisteredDomainEvent(
@@ -68,7 +70,7 @@ class Account(AggregateRoot):
 
         return new_account
 
-    def set_password(
+    async def set_password(
         self, plain_password: PlainPassword, hasher: PasswordHasher
     ) -> None:
         """Sets the account password.
@@ -77,25 +79,37 @@ class Account(AggregateRoot):
             plain_password: New password.
             hasher: Hashing service.
         """
-        self._password_hash = hasher.hash(plain_password.value)
+        self._password_hash = await hasher.hash_async(plain_password.value)
 
-    def login(self, plain_password: PlainPassword, hasher: PasswordHasher) -> None:
+    async def login(
+        self, plain_password: PlainPassword, hasher: PasswordHasher
+    ) -> bool:
         """Authenticates the user.
 
+        On success, rehashes the password if the stored hash is outdated.
+
         Args:
             plain_password: Password attempt.
             hasher: Hashing service for verification.
 
+        Returns:
+            True if the password hash was upgraded and must be persisted.
+
         Raises:
             InvalidPasswordException: If password doesn't match.
             AccountNotVerifiedException: If account is not verified.
         """
-        if not hasher.verify(plain_password.value, self._password_hash):
+        if not await hasher.verify_async(plain_password.value, self._password_hash):
             raise InvalidPasswordException
 
         if not self.is_verified:
             raise AccountNotVerifiedException
 
+        if hasher.needs_update(self._password_hash):
+            await self.set_password(plain_password, hasher)
+            return True
+        return False
+
     def verify_email(self) -> None:
         """Marks the email as verified.
 
@@ -135,7 +149,7 @@ class Account(AggregateRoot):
             )
         )
 
-    def reset_password(
+    async def reset_password(
         self, new_password: PlainPassword, hasher: PasswordHasher
     ) -> None:
         """Resets the password.
@@ -144,10 +158,11 @@ class Account(AggregateRoot):
             new_password: New password.
             hasher: Hashing service.
         """
-        self.set_password(new_password, hasher)
+        await self.set_password(new_password, hasher)
+        self.token_version += 1
         self.add_event(PasswordResetCompletedDomainEvent(account_id=self.id))
 
-    def change_password(
+    async def change_password(
         self,
         old_password: PlainPassword,
         new_password: PlainPassword,
@@ -163,13 +178,44 @@ class Account(AggregateRoot):
         Raises:
             InvalidPasswordException: If old password is incorrect.
         """
-        if not hasher.verify(old_password.value, self._password_hash):
+        if not await hasher.verify_async(old_password.value, self._password_hash):
             raise InvalidPasswordException()
 
-        self.set_password(new_password, hasher)
+        await self.set_password(new_password, hasher)
+        self.token_version += 1
 
         self.add_event(PasswordChangedDomainEvent(account_id=self.id))
 
+    def to_claims(self) -> AccountClaims:
+        """Returns the account state to embed in access tokens."""
+        return AccountClaims(
+            email=self.email.value,
+            is_superuser=self.is_superuser,
+            is_verified=self.is_verified,
+            token_version=self.token_version,
+        )
+
+    @classmethod
+    def from_claims(cls, id: UUID, claims: AccountClaims) -> "Account":
+        """Rebuilds a read-only account view from token claims.
+
+        The result carries no password hash and must not be persisted.
+
+        Args:
+            id: Account identifier (token subject).
+            claims: Claims decoded from the token.
+
+        Returns:
+            Account instance.
+        """
+        return cls(
+            id=id,
+            email=Email(value=claims.email),
+            is_verified=claims.is_verified,
+            is_superuser=claims.is_superuser,
+            token_version=claims.token_version,
+        )
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Account):
             return False
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Any
+from uuid import UUID
 
 
 class PasswordHasher(ABC):
@@ -19,6 +21,21 @@ class PasswordHasher(ABC):
         """Verifies if plain password matches hashed."""
         pass
 
+    @abstractmethod
+    async def hash_async(self, password: str) -> str:
+        """Hashes the password without blocking the event loop."""
+        pass
+
+    @abstractmethod
+    async def verify_async(self, plain: str, hashed: str) -> bool:
+        """Verifies the password without blocking the event loop."""
+        pass
+
+    @abstractmethod
+    def needs_update(self, hashed: str) -> bool:
+        """Checks if the hash should be replaced with a stronger one."""
+        pass
+
 
 class TokenScope(StrEnum):
     """Enumeration of token scopes."""
@@ -38,21 +55,66 @@ class AuthenticationResult:
     refresh_token_expires_in_seconds: int
 
 
+@dataclass(frozen=True)
+class AccountClaims:
+    """Account state embedded in tokens when claims-only access is enabled."""
+
+    email: str
+    is_superuser: bool
+    is_verified: bool
+    token_version: int
+
+
+@dataclass(frozen=True)
+class RefreshTokenFamily:
+    """Rotation state embedded in refresh tokens.
+
+    All refresh tokens descending from one login share a family ID; each
+    rotation increments the generation.
+    """
+
+    family_id: UUID
+    generation: int
+
+
+@dataclass(frozen=True)
+class TokenPayload:
+    """Decoded token contents."""
+
+    subject: str
+    claims: AccountClaims | None = None
+    token_id: str | None = None
+    expires_at: int | None = None
+    family: RefreshTokenFamily | None = None
+
+
 class TokenManager(ABC):
     """Interface for token management."""
 
     @abstractmethod
-    def issue_auth_tokens(self, subject: str) -> AuthenticationResult:
+    def issue_auth_tokens(
+        self,
+        subject: str,
+        claims: AccountClaims | None = None,
+        family: RefreshTokenFamily | None = None,
+    ) -> AuthenticationResult:
         """Issues access and refresh tokens."""
         pass
 
     @abstractmethod
-    def create_access_token(self, subject: str) -> str:
+    def create_access_token(
+        self, subject: str, claims: AccountClaims | None = None
+    ) -> str:
         """Creates a new access token."""
         pass
 
     @abstractmethod
-    def create_refresh_token(self, subject: str) -> str:
+    def create_refresh_token(
+        self,
+        subject: str,
+        claims: AccountClaims | None = None,
+        family: RefreshTokenFamily | None = None,
+    ) -> str:
         """Creates a new refresh token."""
         pass
 
@@ -71,6 +133,23 @@ class TokenManager(ABC):
         """Decodes and validates a token, returning the subject."""
         pass
 
+    @abstractmethod
+    def decode_token_payload(
+        self, token: str, expected_type: TokenScope
+    ) -> TokenPayload:
+        """Decodes and validates a token, returning the subject and claims."""
+        pass
+
+    @abstractmethod
+    def revoke_token(self, token: str, expected_type: TokenScope) -> TokenPayload:
+        """Validates a token and rejects it from now on until it expires."""
+        pass
+
+    @abstractmethod
+    def public_jwks(self) -> dict[str, Any]:
+        """Returns the public keys for local token verification as a JWKS."""
+        pass
+
     @property
     @abstractmethod
     def refresh_token_expires_in_seconds(self) -> int:
@@ -84,6 +163,64 @@ class TokenManager(ABC):
         pass
 
 
+class AccountCache(ABC):
+    """Interface for the account read cache."""
+
+    @abstractmethod
+    def invalidate(self, account_id: UUID) -> None:
+        """Drops cached state of the account."""
+        pass
+
+
+class RefreshTokenStore(ABC):
+    """Interface for server-side refresh token rotation state."""
+
+    @abstractmethod
+    async def start_family(self, account_id: UUID) -> RefreshTokenFamily:
+        """Starts a new token family at generation 0."""
+        pass
+
+    @abstractmethod
+    async def rotate(
+        self, account_id: UUID, family: RefreshTokenFamily
+    ) -> RefreshTokenFamily:
+        """Advances the family to the next generation.
+
+        Revokes the whole family if the presented generation was already
+        rotated, which means the refresh token has been reused.
+        """
+        pass
+
+    @abstractmethod
+    async def revoke_family(self, account_id: UUID, family_id: UUID) -> None:
+        """Revokes every refresh token of the family."""
+        pass
+
+
+class LoginThrottle(ABC):
+    """Interface for login admission control."""
+
+    @abstractmethod
+    def check(self, email: str, client_ip: str | None) -> None:
+        """Rejects the attempt if the email or client is locked or over limit."""
+        pass
+
+    @abstractmethod
+    def admit(self) -> AbstractAsyncContextManager[None]:
+        """Holds one of the limited credential verification slots."""
+        pass
+
+    @abstractmethod
+    def record_failure(self, email: str) -> None:
+        """Counts a failed attempt against the email."""
+        pass
+
+    @abstractmethod
+    def record_success(self, email: str) -> None:
+        """Clears the failed attempts of the email."""
+        pass
+
+
 class MailSender(ABC):
     """Interface for sending emails."""
 
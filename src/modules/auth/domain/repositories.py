@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from auth.domain.entities.account import Account
@@ -10,7 +11,11 @@ class AccountRepository(ABC):
 
     @abstractmethod
     async def add(self, entity: Account) -> None:
-        """Persists a new account."""
+        """Persists a new account.
+
+        Raises:
+            EmailAlreadyExistsException: If the email is taken.
+        """
         pass
 
     @abstractmethod
@@ -27,3 +32,8 @@ class AccountRepository(ABC):
     async def get_by_id(self, id: UUID) -> Account | None:
         """Retrieves an account by ID."""
         pass
+
+    @abstractmethod
+    async def get_many_by_ids(self, ids: Sequence[UUID]) -> list[Account]:
+        """Retrieves the accounts with the given IDs, skipping missing ones."""
+        pass
@@ -1,5 +1,10 @@
 from auth.domain.exceptions import InvalidPasswordException
-from auth.domain.ports import AuthenticationResult, PasswordHasher, TokenManager
+from auth.domain.ports import (
+    AuthenticationResult,
+    PasswordHasher,
+    RefreshTokenStore,
+    TokenManager,
+)
 from auth.domain.repositories import AccountRepository
 from auth.domain.value_objects.email import Email
 from auth.domain.value_objects.plain_password import PlainPassword
@@ -8,9 +13,15 @@ from auth.domain.value_objects.plain_password import PlainPassword
 class AccountAuthenticationService:
     """Domain service for account authentication."""
 
-    def __init__(self, hasher: PasswordHasher, token_manager: TokenManager) -> None:
+    def __init__(
+        self,
+        hasher: PasswordHasher,
+        token_manager: TokenManager,
+        refresh_tokens: RefreshTokenStore,
+    ) -> None:
         self._hasher = hasher
         self._token_manager = token_manager
+        self._refresh_tokens = refresh_tokens
 
     async def authenticate(
         self, repo: AccountRepository, email: Email, plain_password: PlainPassword
@@ -33,6 +44,10 @@ class AccountAuthenticationService:
         if not account:
             raise InvalidPasswordException
 
-        account.login(plain_password, self._hasher)
+        if await account.login(plain_password, self._hasher):
+            await repo.update(account)
 
-        return self._token_manager.issue_auth_tokens(str(account.id))
+        family = await self._refresh_tokens.start_family(account.id)
+        return self._token_manager.issue_auth_tokens(
+            str(account.id), account.to_claims(), family
+        )
@@ -1,7 +1,6 @@
 from uuid import UUID
 
 from auth.domain.entities.account import Account
-from auth.domain.exceptions import EmailAlreadyExistsException
 from auth.domain.ports import PasswordHasher
 from auth.domain.repositories import AccountRepository
 from auth.domain.value_objects.email import Email
@@ -21,7 +20,10 @@ class AccountRegistrationService:
         email: Email,
         password: PlainPassword,
     ) -> Account:
-        """Registers a new account.
+        """Registers and persists a new account.
+
+        Uniqueness of the email is enforced by the repository on insert, so
+        concurrent registrations with the same email cannot both succeed.
 
         Args:
             repo: Account repository.
@@ -35,9 +37,8 @@ class AccountRegistrationService:
         Raises:
             EmailAlreadyExistsException: If email is taken.
         """
-        if await repo.get_by_email(email):
-            raise EmailAlreadyExistsException
-
-        return Account.create(
+        account = await Account.create(
             id=account_id, email=email, plain_password=password, hasher=self._hasher
         )
+        await repo.add(account)
+        return account
@@ -0,0 +1,107 @@
+from collections.abc import Sequence
+from uuid import UUID
+
+from auth.domain.entities.account import Account
+from auth.domain.repositories import AccountRepository
+from auth.domain.value_objects.email import Email
+from auth.infrastructure.services.account_cache import InMemoryAccountCache
+from shared.domain.registry import AggregateRegistry
+from shared.infrastructure.caching.ttl_cache import MISSING
+
+
+class CachedAccountRepository(AccountRepository):
+    """Read-through caching decorator for an AccountRepository.
+
+    Writes invalidate the cache at once and remember the written accounts,
+    which the unit of work invalidates again after a successful commit. A
+    read between the write and the commit may cache the old committed row;
+    the second invalidation drops it.
+
+    Args:
+        repository: Repository that reads from and writes to the database.
+        cache: Account cache.
+        track_aggregates: Whether accounts served from the cache are registered.
+    """
+
+    def __init__(
+        self,
+        repository: AccountRepository,
+        cache: InMemoryAccountCache,
+        track_aggregates: bool = True,
+    ) -> None:
+        """Initializes the repository."""
+        self._repository = repository
+        self._cache = cache
+        self._track_aggregates = track_aggregates
+        self._written: dict[UUID, str] = {}
+
+    async def get_by_email(self, email: Email) -> Account | None:
+        cached = self._cache.get_by_email(email.value)
+        if cached is not MISSING:
+            return self._register(cached)
+
+        account = await self._repository.get_by_email(email)
+        if account:
+            self._cache.store(account)
+        else:
+            self._cache.store_missing_email(email.value)
+        return account
+
+    async def get_by_id(self, id: UUID) -> Account | None:
+        cached = self._cache.get_by_id(id)
+        if cached is not MISSING:
+            return self._register(cached)
+
+        account = await self._repository.get_by_id(id)
+        if account:
+            self._cache.store(account)
+        else:
+            self._cache.store_missing_id(id)
+        return account
+
+    async def get_many_by_ids(self, ids: Sequence[UUID]) -> list[Account]:
+        accounts: dict[UUID, Account] = {}
+        misses: list[UUID] = []
+        unique_ids = list(dict.fromkeys(ids))
+        for id in unique_ids:
+            cached = self._cache.get_by_id(id)
+            if cached is MISSING:
+                misses.append(id)
+            elif cached is not None:
+                accounts[id] = cached
+                self._register(cached)
+
+        if misses:
+            for account in await self._repository.get_many_by_ids(misses):
+                self._cache.store(account)
+                accounts[account.id] = account
+            for id in misses:
+                if id not in accounts:
+                    self._cache.store_missing_id(id)
+
+        return [accounts[id] for id in unique_ids if id in accounts]
+
+    async def add(self, account: Account) -> None:
+        self._invalidate(account)
+        await self._repository.add(account)
+
+    async def update(self, account: Account) -> None:
+        self._invalidate(account)
+        await self._repository.update(account)
+
+    def invalidate_written(self) -> None:
+        """Drops the accounts written so far from the cache, once committed."""
+        for account_id, email in self._written.items():
+            self._cache.invalidate(account_id)
+            self._cache.invalidate_email(email)
+        self._written.clear()
+
+    def _invalidate(self, account: Account) -> None:
+        self._cache.invalidate(account.id)
+        self._cache.invalidate_email(account.email.value)
+        self._written[account.id] = account.email.value
+
+    def _register(self, account: Account | None) -> Account | None:
+        if account and self._track_aggregates:
+            AggregateRegistry.register(account)
+        return account
@@ -0,0 +1,256 @@
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auth.domain.ports import RefreshTokenFamily, RefreshTokenStore
+from auth.infrastructure.database.models import RefreshTokenFamilyModel
+from auth.infrastructure.exceptions import InvalidTokenException
+from shared.infrastructure.caching.ttl_cache import MISSING, TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _FamilyState:
+    account_id: UUID
+    generation: int
+    expires_at: float
+    revoked: bool = False
+
+
+class WriteBehindRefreshTokenStore(RefreshTokenStore):
+    """Refresh token families in an in-process index, persisted write-behind.
+
+    Starting a family writes it through, as login does database work anyway.
+    Rotating a family only touches the index; rotated families are written
+    to the database in batches by run_forever. Reuse and logout revoke the
+    family in the index and write it through at once. The database is read
+    only for families missing from the index, e.g. after a restart. A family
+    found in neither is rejected, since rows are only purged once their
+    refresh tokens have expired.
+
+    The index is per process. With several workers, a family rotated on one
+    worker is not seen by another until it leaves that worker's index, so
+    reuse across workers can go undetected.
+
+    Every read and write runs in a short transaction of its own, so the
+    session factory must not be scoped to the request: starting a family
+    during login would otherwise commit and close the login's unit of work.
+
+    Args:
+        session_factory: Factory for DB sessions, not scoped to the request.
+        ttl_seconds: Lifetime of a family after its last rotation, normally
+            the refresh token lifetime.
+        index_size: Maximum number of families held in memory.
+        batch_size: Maximum number of families written per statement.
+    """
+
+    PURGE_INTERVAL_SECONDS = 3600.0
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        ttl_seconds: float,
+        index_size: int,
+        batch_size: int = 500,
+    ):
+        """Initializes the store."""
+        self._session_factory = session_factory
+        self._ttl_seconds = ttl_seconds
+        self._batch_size = batch_size
+        self._index: TTLCache[UUID, _FamilyState] = TTLCache(index_size, ttl_seconds)
+        self._dirty: dict[UUID, _FamilyState] = {}
+        self._next_purge = time.monotonic()
+        self._reuse_detected = 0
+        self._flushed = 0
+        self._flush_failures = 0
+
+    async def start_family(self, account_id: UUID) -> RefreshTokenFamily:
+        """Starts a new family, writing it through to the database."""
+        family_id = uuid4()
+        state = _FamilyState(account_id, 0, time.time() + self._ttl_seconds)
+        await self._write([(family_id, state)])
+        self._index.set(family_id, state)
+        return RefreshTokenFamily(family_id=family_id, generation=0)
+
+    async def rotate(
+        self, account_id: UUID, family: RefreshTokenFamily
+    ) -> RefreshTokenFamily:
+        """Advances the family to the next generation.
+
+        Args:
+            account_id: Subject of the presented refresh token.
+            family: Family and generation of the presented refresh token.
+
+        Returns:
+            The family at its new generation.
+
+        Raises:
+            InvalidTokenException: If the family is unknown or revoked, or the
+                generation was already rotated (the family is revoked then).
+        """
+        state = await self._get_state(family.family_id)
+        if state is None:
+            # Families are written at login and purged only after expiry.
+            raise InvalidTokenException("Unknown token family")
+
+        if state.revoked or state.account_id != account_id:
+            raise InvalidTokenException("Token has been revoked")
+
+        if family.generation < state.generation:
+            self._reuse_detected += 1
+            logger.warning(
+                f"Refresh token reuse detected for account: {account_id} "
+                f"(family={family.family_id}, generation={family.generation}, "
+                f"current={state.generation})"
+            )
+            await self.revoke_family(account_id, family.family_id)
+            raise InvalidTokenException("Token has been revoked")
+
+        state.generation = family.generation + 1
+        state.expires_at = time.time() + self._ttl_seconds
+        self._index.set(family.family_id, state)
+        self._dirty[family.family_id] = state
+        return RefreshTokenFamily(
+            family_id=family.family_id, generation=state.generation
+        )
+
+    async def revoke_family(self, account_id: UUID, family_id: UUID) -> None:
+        """Revokes the family in the index and writes it through."""
+        state = self._index.lookup(family_id)
+        if state is MISSING:
+            state = self._dirty.get(family_id) or _FamilyState(
+                account_id, 0, time.time() + self._ttl_seconds
+            )
+            self._index.set(family_id, state)
+
+        state.revoked = True
+        self._dirty.pop(family_id, None)
+        await self._write([(family_id, state)])
+        logger.info(f"Refresh token family revoked: {family_id}")
+
+    async def flush(self) -> int:
+        """Writes changed families to the database.
+
+        Families that fail to write are kept for the next flush.
+
+        Returns:
+            Number of families written.
+        """
+        if not self._dirty:
+            return 0
+
+        items = list(self._dirty.items())
+        self._dirty = {}
+        try:
+            for start in range(0, len(items), self._batch_size):
+                await self._write(items[start : start + self._batch_size])
+        except Exception as e:
+            for family_id, state in items:
+                self._dirty.setdefault(family_id, state)
+            self._flush_failures += 1
+            logger.error(f"Refresh token families flush failed: {e}")
+            return 0
+
+        self._flushed += len(items)
+        logger.debug(f"Refresh token families flushed: {len(items)}")
+        return len(items)
+
+    async def purge_expired(self) -> None:
+        """Deletes families whose last refresh token has expired."""
+        async with self._session_factory() as session:
+            await session.execute(
+                delete(RefreshTokenFamilyModel).where(
+                    RefreshTokenFamilyModel.expires_at < datetime.now(UTC)
+                )
+            )
+            await session.commit()
+
+    async def run_forever(self, interval: float = 1.0) -> None:
+        """Flushes changed families periodically.
+
+        Args:
+            interval: Sleep interval between flushes.
+        """
+        logger.info("Refresh token flusher started")
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush()
+            if time.monotonic() >= self._next_purge:
+                self._next_purge = time.monotonic() + self.PURGE_INTERVAL_SECONDS
+                try:
+                    await self.purge_expired()
+                except Exception as e:
+                    logger.error(f"Refresh token families purge failed: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Returns index counters and write-behind state."""
+        index = self._index.stats()
+        return {
+            "index": {**asdict(index), "hit_ratio": index.hit_ratio},
+            "pending": len(self._dirty),
+            "flushed": self._flushed,
+            "flush_failures": self._flush_failures,
+            "reuse_detected": self._reuse_detected,
+        }
+
+    async def _get_state(self, family_id: UUID) -> _FamilyState | None:
+        state = self._index.lookup(family_id)
+        if state is not MISSING:
+            return state
+
+        pending = self._dirty.get(family_id)
+        if pending is None:
+            model = RefreshTokenFamilyModel
+            stmt = select(
+                model.account_id, model.generation, model.expires_at, model.revoked_at
+            ).where(model.id == family_id)
+            async with self._session_factory() as session:
+                row = (await session.execute(stmt)).one_or_none()
+            if row is None:
+                return None
+            pending = _FamilyState(
+                account_id=row.account_id,
+                generation=row.generation,
+                expires_at=row.expires_at.timestamp(),
+                revoked=row.revoked_at is not None,
+            )
+
+        self._index.set(family_id, pending)
+        return pending
+
+    async def _write(self, items: list[tuple[UUID, _FamilyState]]) -> None:
+        now = datetime.now(UTC)
+        stmt = insert(RefreshTokenFamilyModel).values(
+            [
+                {
+                    "id": family_id,
+                    "account_id": state.account_id,
+                    "generation": state.generation,
+                    "expires_at": datetime.fromtimestamp(state.expires_at, UTC),
+                    "revoked_at": now if state.revoked else None,
+                }
+                for family_id, state in items
+            ]
+        )
+        # Rows only move forward, so late or repeated writes are harmless.
+        table = RefreshTokenFamilyModel
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.id],
+            set_={
+                "generation": func.greatest(table.generation, stmt.excluded.generation),
+                "expires_at": func.greatest(table.expires_at, stmt.excluded.expires_at),
+                "revoked_at": func.coalesce(table.revoked_at, stmt.excluded.revoked_at),
+            },
+        )
+        async with self._session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
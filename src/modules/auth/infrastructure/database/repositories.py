@@ -1,58 +1,96 @@
+from collections.abc import Sequence
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import Result, Select, select
+from sqlalchemy import Executable, Result, Row, any_, lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth.domain.entities.account import Account
+from auth.domain.exceptions import EmailAlreadyExistsException
 from auth.domain.repositories import AccountRepository
 from auth.domain.value_objects.email import Email
 from auth.infrastructure.database.models import AccountModel
 from shared.infrastructure.database.base_repository import BaseSqlAlchemyRepository
 
+# Reads select table columns and map rows straight to accounts, without ORM
+# instances or identity-map bookkeeping.
+accounts_table = AccountModel.__table__
+
 
 class SqlAlchemyAccountRepository(AccountRepository, BaseSqlAlchemyRepository[Account]):
-    def __init__(self, session: AsyncSession):
-        self._session = session
+    def __init__(self, session: AsyncSession, track_aggregates: bool = True):
+        super().__init__(session, track_aggregates)
 
     async def get_by_email(self, email: Email) -> Account | None:
-        stmt = select(AccountModel).where(AccountModel.email == email.value)
+        value = email.value
+        stmt = lambda_stmt(
+            lambda: select(accounts_table).where(accounts_table.c.email == value)
+        )
         return await self._execute(stmt)
 
     async def get_by_id(self, id: UUID) -> Account | None:
-        stmt = select(AccountModel).where(AccountModel.id == id)
+        stmt = lambda_stmt(
+            lambda: select(accounts_table).where(accounts_table.c.id == id)
+        )
         return await self._execute(stmt)
 
+    async def get_many_by_ids(self, ids: Sequence[UUID]) -> list[Account]:
+        if not ids:
+            return []
+        stmt = select(accounts_table).where(
+            accounts_table.c.id == any_(self._id_array(ids))
+        )
+        result: Result[Any] = await self._session.execute(stmt)
+        return [self._to_domain(row) for row in result]
+
     async def add(self, account: Account) -> None:
         self._register(account)
-        account_model = self._to_model(account)
-        self._session.add(account_model)
+        values = self._to_values(account)
+        result = await self._execute_write(
+            insert(AccountModel)
+            .values(id=account.id, **values)
+            .on_conflict_do_nothing(index_elements=[AccountModel.email])
+            .returning(AccountModel.id)
+        )
+        if result.scalar_one_or_none() is None:
+            raise EmailAlreadyExistsException
+        self._snapshot(account.id, values)
 
     async def update(self, account: Account) -> None:
         self._register(account)
-        account_model = self._to_model(account)
-        await self._session.merge(account_model)
+        values = self._to_values(account)
+        changes = self._changed_values(account.id, values)
+        if not changes:
+            return
 
-    def _to_domain(self, account_model: AccountModel) -> Account:
+        await self._execute_write(
+            update(AccountModel).where(AccountModel.id == account.id).values(changes)
+        )
+        self._snapshot(account.id, values)
+
+    def _to_domain(self, row: Row[Any]) -> Account:
         account = Account(
-            id=account_model.id,
-            email=Email(value=account_model.email),
-            _password_hash=account_model.password_hash,
-            is_verified=account_model.is_verified,
-            is_superuser=account_model.is_superuser,
+            id=row.id,
+            email=Email(value=row.email),
+            _password_hash=row.password_hash,
+            is_verified=row.is_verified,
+            is_superuser=row.is_superuser,
+            token_version=row.token_version,
         )
+        self._snapshot(account.id, self._to_values(account))
         return self._register(account)
 
-    def _to_model(self, account: Account) -> AccountModel:
-        return AccountModel(
-            id=account.id,
-            email=account.email.value,
-            password_hash=account._password_hash,
-            is_verified=account.is_verified,
-            is_superuser=account.is_superuser,
-        )
+    def _to_values(self, account: Account) -> dict[str, Any]:
+        return {
+            "email": account.email.value,
+            "password_hash": account._password_hash,
+            "is_verified": account.is_verified,
+            "is_superuser": account.is_superuser,
+            "token_version": account.token_version,
+        }
 
-    async def _execute(self, stmt: Select[Any]) -> Account | None:
+    async def _execute(self, stmt: Executable) -> Account | None:
         result: Result[Any] = await self._session.execute(stmt)
-        account_model = result.scalar_one_or_none()
-        return self._to_domain(account_model) if account_model else None
+        row = result.one_or_none()
+        return self._to_domain(row) if row else None
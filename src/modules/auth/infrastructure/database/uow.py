@@ -2,28 +2,55 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from auth.application.uow import AuthUnitOfWork
 from auth.domain.repositories import AccountRepository
+from auth.infrastructure.database.cached_repositories import CachedAccountRepository
 from auth.infrastructure.database.models import AuthOutboxEvent
 from auth.infrastructure.database.repositories import SqlAlchemyAccountRepository
+from auth.infrastructure.services.account_cache import InMemoryAccountCache
 from shared.application.ports import DomainEventRegistry
 from shared.infrastructure.database.base_uow import BaseSqlAlchemyUnitOfWork
+from shared.infrastructure.database.replicas import ReadReplicaRouter
 
 
 class SqlAlchemyAuthUnitOfWork(BaseSqlAlchemyUnitOfWork, AuthUnitOfWork):
-    """SQLAlchemy implementation of the Auth Unit of Work."""
+    """SQLAlchemy implementation of the Auth Unit of Work.
+
+    With an account cache, accounts written in the unit of work are dropped
+    from the cache again after each successful commit.
+    """
 
     def __init__(
         self,
         session_factory: async_sessionmaker[AsyncSession],
         event_registry: DomainEventRegistry,
+        account_cache: InMemoryAccountCache | None = None,
+        read_only: bool = False,
+        replica_router: ReadReplicaRouter | None = None,
     ):
-        super().__init__(session_factory, event_registry)
+        super().__init__(session_factory, event_registry, read_only, replica_router)
+        self._account_cache = account_cache
+        self._cached_accounts: CachedAccountRepository | None = None
         self.accounts: AccountRepository
 
     async def __aenter__(self) -> "SqlAlchemyAuthUnitOfWork":
         await super().__aenter__()
+        self._cached_accounts = None
         if self._session is not None:
-            self.accounts = SqlAlchemyAccountRepository(self._session)
+            self.accounts = SqlAlchemyAccountRepository(
+                self._session, track_aggregates=not self._read_only
+            )
+            if self._account_cache is not None:
+                self.accounts = self._cached_accounts = CachedAccountRepository(
+                    self.accounts,
+                    self._account_cache,
+                    track_aggregates=not self._read_only,
+                )
         return self
 
+    async def commit(self) -> None:
+        """Commits the transaction, then invalidates written accounts."""
+        await super().commit()
+        if self._cached_accounts is not None:
+            self._cached_accounts.invalidate_written()
+
     def _get_outbox_model(self) -> type[AuthOutboxEvent]:
         return AuthOutboxEvent
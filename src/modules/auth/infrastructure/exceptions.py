@@ -9,3 +9,25 @@ class TokenExpiredException(InfrastructureException):
 class InvalidTokenException(InfrastructureException):
     def __init__(self, message: str = "The provided token is invalid."):
         super().__init__(message)
+
+
+class HashingPoolSaturatedException(InfrastructureException):
+    def __init__(
+        self, message: str = "Password hashing capacity exhausted. Try again later."
+    ):
+        super().__init__(message)
+
+
+class TooManyLoginAttemptsException(InfrastructureException):
+    def __init__(self, message: str = "Too many login attempts. Try again later."):
+        super().__init__(message)
+
+
+class InvalidSigningKeyConfigurationException(InfrastructureException):
+    def __init__(self, message: str = "Signing keys are misconfigured."):
+        super().__init__(message)
+
+
+class JwtCodecUnavailableException(InfrastructureException):
+    def __init__(self, message: str = "The configured JWT codec is unavailable."):
+        super().__init__(message)
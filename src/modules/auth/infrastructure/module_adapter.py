@@ -1,8 +1,10 @@
+from collections.abc import Sequence
 from uuid import UUID
 
 from auth.application.queries.common_dtos import AccountDto
 from auth.application.queries.get_account_by_id import GetAccountByIdQuery
 from auth.application.queries.get_account_by_token import GetAccountByTokenQuery
+from auth.application.queries.get_accounts_by_ids import GetAccountsByIdsQuery
 from auth.contracts.dtos import AuthAccountDto
 from auth.contracts.module_port import AuthModulePort
 from shared.infrastructure.cqrs.buses import QueryBus
@@ -23,3 +25,11 @@ class AuthModuleAdapter(AuthModulePort):
         query = GetAccountByIdQuery(account_id=id)
         dto: AccountDto = await self._query_bus.dispatch(query)
         return AuthAccountDto(id=dto.id, email=dto.email, is_superuser=dto.is_superuser)
+
+    async def get_accounts_by_ids(self, ids: Sequence[UUID]) -> list[AuthAccountDto]:
+        query = GetAccountsByIdsQuery(account_ids=tuple(ids))
+        dtos: list[AccountDto] = await self._query_bus.dispatch(query)
+        return [
+            AuthAccountDto(id=dto.id, email=dto.email, is_superuser=dto.is_superuser)
+            for dto in dtos
+        ]
@@ -0,0 +1,114 @@
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any
+from uuid import UUID
+
+from auth.domain.entities.account import Account
+from auth.domain.ports import AccountCache
+from auth.domain.value_objects.email import Email
+from shared.infrastructure.caching.ttl_cache import MISSING, Missing, TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _AccountSnapshot:
+    id: UUID
+    email: str
+    password_hash: str
+    is_verified: bool
+    is_superuser: bool
+    token_version: int
+
+    @classmethod
+    def from_account(cls, account: Account) -> "_AccountSnapshot":
+        return cls(
+            id=account.id,
+            email=account.email.value,
+            password_hash=account._password_hash,
+            is_verified=account.is_verified,
+            is_superuser=account.is_superuser,
+            token_version=account.token_version,
+        )
+
+    def to_account(self) -> Account:
+        return Account(
+            id=self.id,
+            email=Email(value=self.email),
+            _password_hash=self.password_hash,
+            is_verified=self.is_verified,
+            is_superuser=self.is_superuser,
+            token_version=self.token_version,
+        )
+
+
+class InMemoryAccountCache(AccountCache):
+    """Per-process account cache with TTL and negative caching.
+
+    Stores immutable snapshots and returns a fresh Account on every hit, so
+    callers never share mutable aggregates. Invalidation is local to the
+    process; other workers catch up when their entries expire.
+
+    Args:
+        max_size: Maximum number of cached accounts.
+        ttl_seconds: Lifetime of cached accounts.
+        negative_ttl_seconds: Lifetime of cached "not found" results.
+    """
+
+    def __init__(
+        self, max_size: int, ttl_seconds: float, negative_ttl_seconds: float
+    ) -> None:
+        """Initializes the cache."""
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._by_id: TTLCache[UUID, _AccountSnapshot | None] = TTLCache(
+            max_size, ttl_seconds
+        )
+        self._email_index: TTLCache[str, UUID | None] = TTLCache(max_size, ttl_seconds)
+
+    def get_by_id(self, account_id: UUID) -> Account | None | Missing:
+        """Returns the cached account, None if known missing, else MISSING."""
+        snapshot = self._by_id.lookup(account_id)
+        if snapshot is MISSING or snapshot is None:
+            return snapshot
+        return snapshot.to_account()
+
+    def get_by_email(self, email: str) -> Account | None | Missing:
+        """Returns the cached account, None if known missing, else MISSING."""
+        account_id = self._email_index.lookup(email)
+        if account_id is MISSING or account_id is None:
+            return account_id
+        return self.get_by_id(account_id)
+
+    def store(self, account: Account) -> None:
+        """Caches the current state of the account."""
+        snapshot = _AccountSnapshot.from_account(account)
+        self._by_id.set(snapshot.id, snapshot)
+        self._email_index.set(snapshot.email, snapshot.id)
+
+    def store_missing_id(self, account_id: UUID) -> None:
+        """Caches that no account has the given ID."""
+        self._by_id.set(account_id, None, self._negative_ttl_seconds)
+
+    def store_missing_email(self, email: str) -> None:
+        """Caches that no account has the given email."""
+        self._email_index.set(email, None, self._negative_ttl_seconds)
+
+    def invalidate(self, account_id: UUID) -> None:
+        """Drops the account and its email index entry."""
+        snapshot = self._by_id.pop(account_id)
+        if isinstance(snapshot, _AccountSnapshot):
+            self._email_index.pop(snapshot.email)
+        logger.debug(f"Account cache invalidated for: {account_id}")
+
+    def invalidate_email(self, email: str) -> None:
+        """Drops the email index entry."""
+        self._email_index.pop(email)
+
+    def stats(self) -> dict[str, Any]:
+        """Returns hit/miss counters of both lookups."""
+        by_id = self._by_id.stats()
+        by_email = self._email_index.stats()
+        return {
+            "by_id": {**asdict(by_id), "hit_ratio": by_id.hit_ratio},
+            "by_email": {**asdict(by_email), "hit_ratio": by_email.hit_ratio},
+        }
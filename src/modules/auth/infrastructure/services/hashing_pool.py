@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal
+
+from auth.infrastructure.exceptions import HashingPoolSaturatedException
+
+logger = logging.getLogger(__name__)
+
+type PoolKind = Literal["thread", "process"]
+
+
+class HashingPool:
+    """Bounded worker pool running CPU-bound password hashing off the event loop.
+
+    Args:
+        kind: Executor type, "thread" or "process".
+        max_workers: Number of workers. Defaults to the CPU count.
+        max_pending: Maximum number of jobs (running and queued) at once.
+    """
+
+    def __init__(
+        self,
+        kind: PoolKind = "thread",
+        max_workers: int | None = None,
+        max_pending: int = 64,
+    ) -> None:
+        """Initializes the pool."""
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._max_pending = max(max_pending, self._max_workers)
+        self._pending = 0
+        self._executor: Executor
+        if kind == "process":
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="password-hashing"
+            )
+        logger.info(
+            f"Hashing pool started: {kind} x{self._max_workers} "
+            f"(max pending: {self._max_pending})"
+        )
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of jobs currently submitted to the pool."""
+        return self._pending
+
+    async def run[T](self, fn: Callable[..., T], *args: Any) -> T:
+        """Runs a function in the pool and awaits its result.
+
+        Args:
+            fn: Picklable callable to execute.
+            *args: Positional arguments for the callable.
+
+        Returns:
+            T: The callable's result.
+
+        Raises:
+            HashingPoolSaturatedException: If the pending job limit is reached.
+        """
+        if self._pending >= self._max_pending:
+            logger.warning("Hashing pool saturated, rejecting job")
+            raise HashingPoolSaturatedException
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        """Stops the workers, dropping jobs that have not started yet."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        logger.info("Hashing pool stopped.")
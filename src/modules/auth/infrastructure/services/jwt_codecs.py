@@ -0,0 +1,250 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+
+from jose import ExpiredSignatureError, JWTError, jwk, jwt
+from jose.exceptions import JOSEError
+
+from auth.infrastructure.exceptions import (
+    InvalidSigningKeyConfigurationException,
+    InvalidTokenException,
+    JwtCodecUnavailableException,
+    TokenExpiredException,
+)
+
+
+class JwtCodec(ABC):
+    """Interface for JWT encoding/decoding backends.
+
+    Keys go through prepare_key once at startup, so backends can build their
+    key objects ahead of time instead of on every call.
+    """
+
+    @abstractmethod
+    def prepare_key(self, key: Any, algorithm: str) -> Any:
+        """Converts a secret or `cryptography` key into the backend key type.
+
+        Raises:
+            InvalidSigningKeyConfigurationException: If the backend cannot use
+                the key with the algorithm.
+        """
+        pass
+
+    @abstractmethod
+    def encode(
+        self,
+        payload: dict[str, Any],
+        key: Any,
+        algorithm: str,
+        headers: dict[str, Any] | None = None,
+    ) -> str:
+        """Signs the payload into a compact JWS."""
+        pass
+
+    @abstractmethod
+    def decode(self, token: str, key: Any, algorithm: str) -> dict[str, Any]:
+        """Verifies the token signature and expiry, returning its payload.
+
+        Raises:
+            InvalidTokenException: If the token is malformed or forged.
+            TokenExpiredException: If the token has expired.
+        """
+        pass
+
+    @abstractmethod
+    def get_unverified_header(self, token: str) -> dict[str, Any]:
+        """Returns the token header without verifying the signature.
+
+        Raises:
+            InvalidTokenException: If the header cannot be parsed.
+        """
+        pass
+
+
+class JoseJwtCodec(JwtCodec):
+    """JwtCodec backed by python-jose."""
+
+    def prepare_key(self, key: Any, algorithm: str) -> Any:
+        try:
+            return jwk.construct(key, algorithm)
+        except JOSEError as e:
+            raise InvalidSigningKeyConfigurationException(
+                f"python-jose does not support {algorithm} with this key"
+            ) from e
+
+    def encode(
+        self,
+        payload: dict[str, Any],
+        key: Any,
+        algorithm: str,
+        headers: dict[str, Any] | None = None,
+    ) -> str:
+        return str(jwt.encode(payload, key, algorithm=algorithm, headers=headers))
+
+    def decode(self, token: str, key: Any, algorithm: str) -> dict[str, Any]:
+        try:
+            payload: dict[str, Any] = jwt.decode(token, key, algorithms=[algorithm])
+            return payload
+        except ExpiredSignatureError as e:
+            raise TokenExpiredException from e
+        except JWTError as e:
+            raise InvalidTokenException from e
+
+    def get_unverified_header(self, token: str) -> dict[str, Any]:
+        try:
+            header: dict[str, Any] = jwt.get_unverified_header(token)
+            return header
+        except JWTError as e:
+            raise InvalidTokenException from e
+
+
+class PyJwtCodec(JwtCodec):
+    """JwtCodec backed by PyJWT (optional dependency, supports EdDSA).
+
+    Raises:
+        JwtCodecUnavailableException: If PyJWT is not installed.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the codec."""
+        try:
+            import jwt as pyjwt
+        except ImportError as e:
+            raise JwtCodecUnavailableException(
+                "PyJWT is not installed. Install the 'pyjwt' extra."
+            ) from e
+        self._jwt = pyjwt
+
+    def prepare_key(self, key: Any, algorithm: str) -> Any:
+        try:
+            self._jwt.get_algorithm_by_name(algorithm)
+        except NotImplementedError as e:
+            raise InvalidSigningKeyConfigurationException(
+                f"PyJWT does not support {algorithm}"
+            ) from e
+        return key
+
+    def encode(
+        self,
+        payload: dict[str, Any],
+        key: Any,
+        algorithm: str,
+        headers: dict[str, Any] | None = None,
+    ) -> str:
+        return str(self._jwt.encode(payload, key, algorithm=algorithm, headers=headers))
+
+    def decode(self, token: str, key: Any, algorithm: str) -> dict[str, Any]:
+        try:
+            payload: dict[str, Any] = self._jwt.decode(
+                token, key, algorithms=[algorithm]
+            )
+            return payload
+        except self._jwt.ExpiredSignatureError as e:
+            raise TokenExpiredException from e
+        except self._jwt.PyJWTError as e:
+            raise InvalidTokenException from e
+
+    def get_unverified_header(self, token: str) -> dict[str, Any]:
+        try:
+            header: dict[str, Any] = self._jwt.get_unverified_header(token)
+            return header
+        except self._jwt.PyJWTError as e:
+            raise InvalidTokenException from e
+
+
+class HmacJwtCodec(JwtCodec):
+    """Minimal HS256/HS384/HS512 JwtCodec on the standard library.
+
+    The HMAC state keyed with the secret is computed once in prepare_key and
+    copied for each token, which skips the per-call key schedule. Supports
+    only the "exp" registered claim, which is all JWTTokenManager issues.
+    """
+
+    _DIGESTS = {
+        "HS256": hashlib.sha256,
+        "HS384": hashlib.sha384,
+        "HS512": hashlib.sha512,
+    }
+
+    def prepare_key(self, key: Any, algorithm: str) -> Any:
+        if algorithm not in self._DIGESTS or not isinstance(key, str | bytes):
+            raise InvalidSigningKeyConfigurationException(
+                f"The hmac codec supports only {list(self._DIGESTS)} with a secret"
+            )
+        secret = key.encode() if isinstance(key, str) else key
+        return hmac.new(secret, digestmod=self._DIGESTS[algorithm])
+
+    def encode(
+        self,
+        payload: dict[str, Any],
+        key: Any,
+        algorithm: str,
+        headers: dict[str, Any] | None = None,
+    ) -> str:
+        header = {"alg": algorithm, "typ": "JWT", **(headers or {})}
+        signing_input = (
+            self._b64encode(self._dumps(header))
+            + b"."
+            + self._b64encode(self._dumps(payload))
+        )
+        signature = self._sign(key, signing_input)
+        return (signing_input + b"." + self._b64encode(signature)).decode("ascii")
+
+    def decode(self, token: str, key: Any, algorithm: str) -> dict[str, Any]:
+        try:
+            segments = token.encode("ascii").split(b".")
+            if len(segments) != 3:
+                raise InvalidTokenException("Invalid token segments")
+            header_segment, payload_segment, signature = segments
+            signing_input = header_segment + b"." + payload_segment
+            header = json.loads(self._b64decode(header_segment))
+            if not isinstance(header, dict) or header.get("alg") != algorithm:
+                raise InvalidTokenException("Invalid token algorithm")
+            expected = self._sign(key, signing_input)
+            if not hmac.compare_digest(expected, self._b64decode(signature)):
+                raise InvalidTokenException("Signature verification failed")
+            payload = json.loads(self._b64decode(payload_segment))
+        except (UnicodeError, ValueError, binascii.Error) as e:
+            raise InvalidTokenException from e
+
+        if not isinstance(payload, dict):
+            raise InvalidTokenException
+        exp = payload.get("exp")
+        if exp is not None:
+            if not isinstance(exp, int | float):
+                raise InvalidTokenException("Invalid expiration claim")
+            if exp <= time.time():
+                raise TokenExpiredException
+        return payload
+
+    def get_unverified_header(self, token: str) -> dict[str, Any]:
+        try:
+            header = json.loads(self._b64decode(token.encode("ascii").split(b".")[0]))
+        except (UnicodeError, ValueError, binascii.Error) as e:
+            raise InvalidTokenException from e
+        if not isinstance(header, dict):
+            raise InvalidTokenException
+        return header
+
+    @staticmethod
+    def _sign(key: "hmac.HMAC", signing_input: bytes) -> bytes:
+        mac = key.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    @staticmethod
+    def _dumps(data: dict[str, Any]) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    @staticmethod
+    def _b64encode(data: bytes) -> bytes:
+        return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+    @staticmethod
+    def _b64decode(data: bytes) -> bytes:
+        return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
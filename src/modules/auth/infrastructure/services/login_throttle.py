@@ -0,0 +1,104 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from typing import Any
+
+from auth.domain.ports import LoginThrottle
+from auth.infrastructure.exceptions import (
+    HashingPoolSaturatedException,
+    TooManyLoginAttemptsException,
+)
+from shared.infrastructure.rate_limiting.sliding_window import SlidingWindowLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryLoginThrottle(LoginThrottle):
+    """Per-process login admission control.
+
+    Rejects attempts for emails locked after repeated failures and for
+    clients over their attempt rate, before any database or hashing work.
+    Admitted attempts then wait for one of a bounded number of verification
+    slots, so a burst cannot queue more password verifies than the worker
+    can finish in time.
+
+    Args:
+        email_limiter: Counts failed attempts per email.
+        ip_limiter: Counts all attempts per client IP.
+        max_concurrent_verifications: Number of verification slots.
+        queue_timeout_seconds: How long an attempt may wait for a slot.
+    """
+
+    def __init__(
+        self,
+        email_limiter: SlidingWindowLimiter,
+        ip_limiter: SlidingWindowLimiter,
+        max_concurrent_verifications: int,
+        queue_timeout_seconds: float,
+    ) -> None:
+        """Initializes the throttle."""
+        self._emails = email_limiter
+        self._ips = ip_limiter
+        self._slots = asyncio.BoundedSemaphore(max_concurrent_verifications)
+        self._queue_timeout_seconds = queue_timeout_seconds
+        self._rejected_email = 0
+        self._rejected_ip = 0
+        self._rejected_busy = 0
+
+    def check(self, email: str, client_ip: str | None) -> None:
+        """Rejects the attempt if the email is locked or the client over limit.
+
+        Raises:
+            TooManyLoginAttemptsException: If the attempt is rejected.
+        """
+        if self._emails.retry_after(email.lower()):
+            self._rejected_email += 1
+            logger.debug(f"Login rejected, email locked: {email}")
+            raise TooManyLoginAttemptsException
+
+        if client_ip is not None and self._ips.hit(client_ip):
+            self._rejected_ip += 1
+            logger.debug(f"Login rejected, client over limit: {client_ip}")
+            raise TooManyLoginAttemptsException
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Holds a verification slot for the duration of the block.
+
+        Raises:
+            HashingPoolSaturatedException: If no slot frees up in time.
+        """
+        try:
+            async with asyncio.timeout(self._queue_timeout_seconds):
+                await self._slots.acquire()
+        except TimeoutError as e:
+            self._rejected_busy += 1
+            raise HashingPoolSaturatedException from e
+
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    def record_failure(self, email: str) -> None:
+        """Counts a failed attempt, locking the email past the limit."""
+        if self._emails.hit(email.lower()):
+            logger.warning(f"Login locked after repeated failures: {email}")
+
+    def record_success(self, email: str) -> None:
+        """Clears the failed attempts of the email."""
+        self._emails.reset(email.lower())
+
+    def stats(self) -> dict[str, Any]:
+        """Returns limiter state and rejection counters."""
+        return {
+            "emails": asdict(self._emails.stats()),
+            "ips": asdict(self._ips.stats()),
+            "rejected": {
+                "email_locked": self._rejected_email,
+                "ip_limited": self._rejected_ip,
+                "busy": self._rejected_busy,
+            },
+        }
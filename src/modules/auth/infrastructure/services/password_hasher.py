@@ -1,33 +1,191 @@
 import logging
-from typing import Final
+import time
+from abc import abstractmethod
+from functools import lru_cache
+from typing import Any, Final
 
 from passlib.context import CryptContext
 
 from auth.domain.ports import (
     PasswordHasher,
 )
+from auth.infrastructure.services.hashing_pool import HashingPool
 
 logger = logging.getLogger(__name__)
 
 BCRYPT_MAX_LENGTH: Final[int] = 72
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+_CALIBRATION_SAMPLE: Final[bytes] = b"calibration-sample-password"
 
 
-class BcryptPasswordHasher(PasswordHasher):
-    """Bcrypt-based implementation of PasswordHasher."""
+@lru_cache(maxsize=8)
+def _context(config: str) -> CryptContext:
+    return CryptContext.from_string(config)
+
+
+def _hash(config: str, password: bytes) -> str:
+    # Module-level and keyed by the serialized context so it can be pickled
+    # into a process pool, where each worker builds the context once.
+    return str(_context(config).hash(password))
+
+
+def _verify(config: str, password: bytes, hashed_password: str) -> bool:
+    return bool(_context(config).verify(password, hashed_password))
+
+
+class PasslibPasswordHasher(PasswordHasher):
+    """Base PasswordHasher backed by a passlib CryptContext.
+
+    The first entry of SCHEMES is used for new hashes. The others stay
+    verifiable but are deprecated, so their hashes report needs_update.
+
+    Args:
+        pool: Worker pool used by the async methods.
+        cost: Scheme cost parameter, clamped to [MIN_COST, MAX_COST].
+    """
+
+    SCHEMES: tuple[str, ...]
+    MIN_COST: int
+    MAX_COST: int
+
+    def __init__(self, pool: HashingPool, cost: int) -> None:
+        """Initializes the hasher."""
+        self._pool = pool
+        self._cost = min(max(cost, self.MIN_COST), self.MAX_COST)
+        self._config = self._build_config(self._cost)
 
     def hash(self, password: str) -> str:
-        """Hashes the password using bcrypt."""
-        truncated_password = password.encode("utf-8")[:BCRYPT_MAX_LENGTH]
-        hashed = pwd_context.hash(truncated_password)
+        """Hashes the password with the default scheme."""
+        hashed = _hash(self._config, self._prepare(password))
         logger.debug("Password hashed successfully")
-        return str(hashed)
+        return hashed
 
     def verify(self, plain_password: str, hashed_password: str) -> bool:
-        """Verifies the password against the bcrypt hash."""
-        truncated_password = plain_password.encode("utf-8")[:BCRYPT_MAX_LENGTH]
-        result = bool(pwd_context.verify(truncated_password, hashed_password))
+        """Verifies the password against a hash of any supported scheme."""
+        secret = self._prepare(plain_password, hashed_password)
+        result = _verify(self._config, secret, hashed_password)
         if not result:
             logger.debug("Password verification failed")
         return result
+
+    async def hash_async(self, password: str) -> str:
+        """Hashes the password with the default scheme in the worker pool."""
+        hashed = await self._pool.run(_hash, self._config, self._prepare(password))
+        logger.debug("Password hashed successfully")
+        return hashed
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verifies the password in the worker pool."""
+        secret = self._prepare(plain_password, hashed_password)
+        result = await self._pool.run(_verify, self._config, secret, hashed_password)
+        if not result:
+            logger.debug("Password verification failed")
+        return result
+
+    def needs_update(self, hashed_password: str) -> bool:
+        """Checks if the hash uses a deprecated scheme or a lower cost."""
+        return bool(_context(self._config).needs_update(hashed_password))
+
+    def calibrate(self, target_latency_ms: int) -> None:
+        """Picks the highest cost whose hash time fits the latency budget.
+
+        Starts from MIN_COST, so the result never drops below the floor.
+
+        Args:
+            target_latency_ms: Maximum time a single hash may take.
+        """
+        cost = self.MIN_COST
+        while cost < self.MAX_COST and self._measure_ms(cost + 1) <= target_latency_ms:
+            cost += 1
+
+        self._cost = cost
+        self._config = self._build_config(cost)
+        logger.info(
+            f"Password hasher calibrated: {self.SCHEMES[0]} cost={cost} "
+            f"(target: {target_latency_ms}ms)"
+        )
+
+    @abstractmethod
+    def _scheme_settings(self, cost: int) -> dict[str, Any]:
+        """Returns CryptContext keyword settings for the default scheme."""
+        pass
+
+    def _build_config(self, cost: int) -> str:
+        context = CryptContext(
+            schemes=list(self.SCHEMES),
+            deprecated="auto",
+            **self._scheme_settings(cost),
+        )
+        return str(context.to_string())
+
+    def _measure_ms(self, cost: int) -> float:
+        config = self._build_config(cost)
+        _hash(config, _CALIBRATION_SAMPLE)  # warm-up: backend load, allocations
+        started = time.perf_counter()
+        _hash(config, _CALIBRATION_SAMPLE)
+        return (time.perf_counter() - started) * 1000
+
+    def _prepare(self, password: str, hashed_password: str | None = None) -> bytes:
+        secret = password.encode("utf-8")
+        if hashed_password is None:
+            scheme = self.SCHEMES[0]
+        else:
+            scheme = _context(self._config).identify(hashed_password)
+        # bcrypt only uses the first 72 bytes of the secret.
+        return secret[:BCRYPT_MAX_LENGTH] if scheme == "bcrypt" else secret
+
+
+class BcryptPasswordHasher(PasslibPasswordHasher):
+    """Bcrypt-based implementation of PasswordHasher.
+
+    Args:
+        pool: Worker pool used by the async methods.
+        rounds: Cost factor (log2 of the number of iterations).
+    """
+
+    SCHEMES = ("bcrypt", "argon2")
+    MIN_COST = 10
+    MAX_COST = 16
+
+    def __init__(self, pool: HashingPool, rounds: int = 12) -> None:
+        """Initializes the hasher."""
+        super().__init__(pool, cost=rounds)
+
+    def _scheme_settings(self, cost: int) -> dict[str, Any]:
+        return {"bcrypt__default_rounds": cost, "bcrypt__min_rounds": cost}
+
+
+class Argon2PasswordHasher(PasslibPasswordHasher):
+    """Argon2id-based implementation of PasswordHasher.
+
+    Args:
+        pool: Worker pool used by the async methods.
+        time_cost: Number of passes over memory.
+        memory_cost: Memory usage in KiB.
+        parallelism: Number of lanes.
+    """
+
+    SCHEMES = ("argon2", "bcrypt")
+    MIN_COST = 1
+    MAX_COST = 10
+
+    def __init__(
+        self,
+        pool: HashingPool,
+        time_cost: int = 2,
+        memory_cost: int = 19456,
+        parallelism: int = 1,
+    ) -> None:
+        """Initializes the hasher."""
+        self._memory_cost = memory_cost
+        self._parallelism = parallelism
+        super().__init__(pool, cost=time_cost)
+
+    def _scheme_settings(self, cost: int) -> dict[str, Any]:
+        return {
+            "argon2__type": "ID",
+            "argon2__default_rounds": cost,
+            "argon2__min_rounds": cost,
+            "argon2__memory_cost": self._memory_cost,
+            "argon2__parallelism": self._parallelism,
+        }
@@ -0,0 +1,210 @@
+import base64
+import logging
+from pathlib import Path
+from typing import Any
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed448, ed25519, rsa
+
+from auth.infrastructure.exceptions import InvalidSigningKeyConfigurationException
+
+logger = logging.getLogger(__name__)
+
+type PrivateKey = (
+    rsa.RSAPrivateKey
+    | ec.EllipticCurvePrivateKey
+    | ed25519.Ed25519PrivateKey
+    | ed448.Ed448PrivateKey
+)
+type PublicKey = (
+    rsa.RSAPublicKey
+    | ec.EllipticCurvePublicKey
+    | ed25519.Ed25519PublicKey
+    | ed448.Ed448PublicKey
+)
+
+_EC_CURVES: dict[str, tuple[type[ec.EllipticCurve], str, int]] = {
+    "ES256": (ec.SECP256R1, "P-256", 32),
+    "ES384": (ec.SECP384R1, "P-384", 48),
+    "ES512": (ec.SECP521R1, "P-521", 66),
+}
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64url_uint(value: int) -> str:
+    return _b64url(value.to_bytes(max(1, (value.bit_length() + 7) // 8), "big"))
+
+
+class SigningKeyRing:
+    """Asymmetric JWT keys indexed by key ID (kid).
+
+    The active key signs new tokens. Every key in the ring, including retired
+    ones that only have a public part, verifies tokens, so keys can be rotated
+    by adding the new key first and removing the old one after its tokens
+    expire. Keys are plain `cryptography` objects, so any JWT codec can use them.
+
+    Args:
+        algorithm: JWS algorithm shared by all keys (RS*, PS*, ES*, EdDSA).
+        active_kid: Key ID used for signing.
+        private_keys: PEM-encoded private keys by kid.
+        public_keys: PEM-encoded public keys by kid, for keys that are only
+            used for verification.
+
+    Raises:
+        InvalidSigningKeyConfigurationException: If a key cannot be loaded,
+            does not fit the algorithm, or the active key has no private part.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        active_kid: str | None,
+        private_keys: dict[str, str],
+        public_keys: dict[str, str] | None = None,
+    ) -> None:
+        """Initializes the ring and loads every key once."""
+        self.algorithm = algorithm
+        self._private: dict[str, PrivateKey] = {
+            kid: self._load_private(kid, pem) for kid, pem in private_keys.items()
+        }
+        self._public: dict[str, PublicKey] = {
+            kid: key.public_key() for kid, key in self._private.items()
+        }
+        for kid, pem in (public_keys or {}).items():
+            self._public.setdefault(kid, self._load_public(kid, pem))
+
+        if active_kid is None or active_kid not in self._private:
+            raise InvalidSigningKeyConfigurationException(
+                f"No private key configured for active kid: {active_kid}"
+            )
+        self._active_kid = active_kid
+        self._jwks = {
+            "keys": [self._to_jwk(kid, key) for kid, key in self._public.items()]
+        }
+        logger.info(
+            f"Signing keys loaded: {algorithm}, active kid: {active_kid}, "
+            f"verification kids: {list(self._public)}"
+        )
+
+    @classmethod
+    def from_files(
+        cls,
+        algorithm: str,
+        active_kid: str | None,
+        private_key_paths: dict[str, str],
+        public_key_paths: dict[str, str] | None = None,
+    ) -> "SigningKeyRing":
+        """Loads PEM files by kid.
+
+        Args:
+            algorithm: JWS algorithm shared by all keys.
+            active_kid: Key ID used for signing.
+            private_key_paths: Private key file paths by kid.
+            public_key_paths: Public key file paths by kid.
+
+        Returns:
+            Initialized SigningKeyRing.
+        """
+        return cls(
+            algorithm=algorithm,
+            active_kid=active_kid,
+            private_keys={
+                kid: Path(path).read_text() for kid, path in private_key_paths.items()
+            },
+            public_keys={
+                kid: Path(path).read_text()
+                for kid, path in (public_key_paths or {}).items()
+            },
+        )
+
+    @property
+    def active_kid(self) -> str:
+        """Returns the key ID used for signing."""
+        return self._active_kid
+
+    @property
+    def signing_key(self) -> PrivateKey:
+        """Returns the private key used for signing."""
+        return self._private[self._active_kid]
+
+    @property
+    def verification_keys(self) -> dict[str, PublicKey]:
+        """Returns the public keys by kid."""
+        return dict(self._public)
+
+    def jwks(self) -> dict[str, Any]:
+        """Returns the public keys as a JSON Web Key Set."""
+        return self._jwks
+
+    def _load_private(self, kid: str, pem: str) -> PrivateKey:
+        try:
+            key = serialization.load_pem_private_key(pem.encode(), password=None)
+        except (TypeError, ValueError) as e:
+            raise InvalidSigningKeyConfigurationException(
+                f"Invalid private key: {kid}"
+            ) from e
+        return self._check(kid, key)  # type: ignore[return-value]
+
+    def _load_public(self, kid: str, pem: str) -> PublicKey:
+        try:
+            key = serialization.load_pem_public_key(pem.encode())
+        except (TypeError, ValueError) as e:
+            raise InvalidSigningKeyConfigurationException(
+                f"Invalid public key: {kid}"
+            ) from e
+        return self._check(kid, key)  # type: ignore[return-value]
+
+    def _check(self, kid: str, key: object) -> object:
+        family = self.algorithm[:2]
+        if family in ("RS", "PS"):
+            valid = isinstance(key, rsa.RSAPrivateKey | rsa.RSAPublicKey)
+        elif self.algorithm in _EC_CURVES:
+            curve = _EC_CURVES[self.algorithm][0]
+            valid = isinstance(
+                key, ec.EllipticCurvePrivateKey | ec.EllipticCurvePublicKey
+            ) and isinstance(key.curve, curve)
+        elif self.algorithm == "EdDSA":
+            valid = isinstance(
+                key,
+                ed25519.Ed25519PrivateKey
+                | ed25519.Ed25519PublicKey
+                | ed448.Ed448PrivateKey
+                | ed448.Ed448PublicKey,
+            )
+        else:
+            valid = False
+
+        if not valid:
+            raise InvalidSigningKeyConfigurationException(
+                f"Key {kid} cannot be used with {self.algorithm}"
+            )
+        return key
+
+    def _to_jwk(self, kid: str, key: PublicKey) -> dict[str, Any]:
+        jwk: dict[str, Any]
+        if isinstance(key, rsa.RSAPublicKey):
+            numbers = key.public_numbers()
+            jwk = {
+                "kty": "RSA",
+                "n": _b64url_uint(numbers.n),
+                "e": _b64url_uint(numbers.e),
+            }
+        elif isinstance(key, ec.EllipticCurvePublicKey):
+            _, crv, size = _EC_CURVES[self.algorithm]
+            point = key.public_numbers()
+            jwk = {
+                "kty": "EC",
+                "crv": crv,
+                "x": _b64url(point.x.to_bytes(size, "big")),
+                "y": _b64url(point.y.to_bytes(size, "big")),
+            }
+        else:
+            raw = key.public_bytes(
+                serialization.Encoding.Raw, serialization.PublicFormat.Raw
+            )
+            crv = "Ed25519" if isinstance(key, ed25519.Ed25519PublicKey) else "Ed448"
+            jwk = {"kty": "OKP", "crv": crv, "x": _b64url(raw)}
+        return {**jwk, "alg": self.algorithm, "kid": kid, "use": "sig"}
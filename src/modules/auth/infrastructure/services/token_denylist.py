@@ -0,0 +1,63 @@
+import heapq
+import logging
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class RevokedTokenDenylist:
+    """Revoked token IDs (jti), kept only until the tokens would have expired.
+
+    Lookups are a single set membership test. Each entry is also filed in a
+    bucket by its expiry time, and buckets whose tokens have all expired are
+    dropped as new revocations come in, so memory is bounded by the number of
+    tokens revoked within one token lifetime.
+
+    The denylist lives in the process. With several workers, a token revoked
+    on one worker stays valid on the others until it expires.
+
+    Args:
+        bucket_seconds: Width of an expiry bucket. Wider buckets mean fewer
+            buckets, but entries are kept up to this long past expiry.
+    """
+
+    def __init__(self, bucket_seconds: int = 60) -> None:
+        """Initializes an empty denylist."""
+        self._bucket_seconds = bucket_seconds
+        self._revoked: set[str] = set()
+        self._buckets: dict[int, list[str]] = {}
+        self._bucket_heap: list[int] = []
+
+    def __contains__(self, token_id: str) -> bool:
+        return token_id in self._revoked
+
+    def revoke(self, token_id: str, expires_at: float) -> None:
+        """Adds a token ID until its expiry time.
+
+        Args:
+            token_id: The "jti" claim of the token.
+            expires_at: The "exp" claim of the token, as a Unix timestamp.
+        """
+        now = time.time()
+        self._prune(now)
+        if expires_at <= now or token_id in self._revoked:
+            return
+
+        self._revoked.add(token_id)
+        bucket = int(expires_at) // self._bucket_seconds
+        if bucket not in self._buckets:
+            self._buckets[bucket] = []
+            heapq.heappush(self._bucket_heap, bucket)
+        self._buckets[bucket].append(token_id)
+        logger.debug(f"Token revoked: {token_id}")
+
+    def stats(self) -> dict[str, Any]:
+        """Returns the number of revoked tokens and expiry buckets held."""
+        return {"revoked": len(self._revoked), "buckets": len(self._buckets)}
+
+    def _prune(self, now: float) -> None:
+        current = int(now) // self._bucket_seconds
+        while self._bucket_heap and self._bucket_heap[0] < current:
+            bucket = heapq.heappop(self._bucket_heap)
+            self._revoked.difference_update(self._buckets.pop(bucket))
@@ -1,20 +1,54 @@
+import hashlib
 import logging
+import secrets
+import time
+from dataclasses import asdict
 from datetime import UTC, datetime, timedelta
-
-from jose import ExpiredSignatureError, JWTError, jwt
+from typing import Any
+from uuid import UUID
 
 from auth.domain.ports import (
+    AccountClaims,
     AuthenticationResult,
+    RefreshTokenFamily,
     TokenManager,
+    TokenPayload,
     TokenScope,
 )
-from auth.infrastructure.exceptions import InvalidTokenException, TokenExpiredException
+from auth.infrastructure.exceptions import (
+    InvalidSigningKeyConfigurationException,
+    InvalidTokenException,
+)
+from auth.infrastructure.services.jwt_codecs import JoseJwtCodec, JwtCodec
+from auth.infrastructure.services.signing_keys import SigningKeyRing
+from auth.infrastructure.services.token_denylist import RevokedTokenDenylist
+from shared.infrastructure.caching.ttl_cache import MISSING, TTLCache
 
 logger = logging.getLogger(__name__)
 
 
 class JWTTokenManager(TokenManager):
-    """JWT-based implementation of TokenManager."""
+    """JWT-based implementation of TokenManager.
+
+    Encoding and signature checks are delegated to a JwtCodec backend
+    (python-jose by default). HMAC algorithms (HS*) sign with the shared
+    secret key. Any other algorithm signs with the active key of the key ring
+    and stamps its kid in the header, so other services can verify tokens
+    against the published JWKS.
+
+    With claims_only_access enabled, access and refresh tokens carry the
+    account claims, so authenticated requests need no account lookup.
+
+    With decode_cache_size > 0, successfully decoded tokens are cached by a
+    digest of the token string until they expire, so repeated requests with
+    the same bearer token skip signature verification.
+
+    Refresh tokens also carry their rotation family ("fam") and generation
+    ("gen") when one is given.
+
+    Every token carries a random ID ("jti"). Revoked IDs are held in a
+    denylist that is checked on every decode, cached or not.
+    """
 
     def __init__(
         self,
@@ -24,6 +58,11 @@ class JWTTokenManager(TokenManager):
         refresh_expire_days: int,
         verification_expire_minutes: int,
         password_reset_expire_minutes: int,
+        claims_only_access: bool = False,
+        key_ring: SigningKeyRing | None = None,
+        decode_cache_size: int = 0,
+        codec: JwtCodec | None = None,
+        denylist: RevokedTokenDenylist | None = None,
     ):
         self.secret_key = secret_key
         self.algorithm = algorithm
@@ -31,11 +70,46 @@ class JWTTokenManager(TokenManager):
         self.refresh_expire_days = refresh_expire_days
         self.verification_expire_minutes = verification_expire_minutes
         self.password_reset_expire_minutes = password_reset_expire_minutes
+        self.claims_only_access = claims_only_access
+        self.key_ring = None if algorithm.startswith("HS") else key_ring
+        self._decode_cache: TTLCache[bytes, tuple[str, TokenPayload]] | None = (
+            TTLCache(decode_cache_size, ttl_seconds=0)
+            if decode_cache_size > 0
+            else None
+        )
 
-    def issue_auth_tokens(self, subject: str) -> AuthenticationResult:
+        self._codec = codec or JoseJwtCodec()
+        self._denylist = denylist or RevokedTokenDenylist()
+
+        if not algorithm.startswith("HS") and (
+            key_ring is None or key_ring.algorithm != algorithm
+        ):
+            raise InvalidSigningKeyConfigurationException(
+                f"Algorithm {algorithm} requires a matching signing key ring"
+            )
+
+        # Keys are converted to the codec's key type once, not per token.
+        if self.key_ring:
+            self._signing_key = self._codec.prepare_key(
+                self.key_ring.signing_key, algorithm
+            )
+            self._verification_keys = {
+                kid: self._codec.prepare_key(key, algorithm)
+                for kid, key in self.key_ring.verification_keys.items()
+            }
+        else:
+            self._signing_key = self._codec.prepare_key(secret_key, algorithm)
+            self._verification_keys = {}
+
+    def issue_auth_tokens(
+        self,
+        subject: str,
+        claims: AccountClaims | None = None,
+        family: RefreshTokenFamily | None = None,
+    ) -> AuthenticationResult:
         """Issues access and refresh JWTs."""
-        access_token = self.create_access_token(subject)
-        refresh_token = self.create_refresh_token(subject)
+        access_token = self.create_access_token(subject, claims)
+        refresh_token = self.create_refresh_token(subject, claims, family)
         refresh_token_expires_in_seconds = self.refresh_token_expires_in_seconds
 
         logger.debug(f"Auth tokens issued for subject: {subject}")
@@ -43,20 +117,30 @@ class JWTTokenManager(TokenManager):
             access_token, refresh_token, refresh_token_expires_in_seconds
         )
 
-    def create_access_token(self, subject: str) -> str:
+    def create_access_token(
+        self, subject: str, claims: AccountClaims | None = None
+    ) -> str:
         """Creates a JWT access token."""
         return self._create_token(
             subject=subject,
             expires_delta=timedelta(minutes=self.access_expire_minutes),
             token_type=TokenScope.ACCESS,
+            claims=claims,
         )
 
-    def create_refresh_token(self, subject: str) -> str:
+    def create_refresh_token(
+        self,
+        subject: str,
+        claims: AccountClaims | None = None,
+        family: RefreshTokenFamily | None = None,
+    ) -> str:
         """Creates a JWT refresh token."""
         return self._create_token(
             subject=subject,
             expires_delta=timedelta(days=self.refresh_expire_days),
             token_type=TokenScope.REFRESH,
+            claims=claims,
+            family=family,
         )
 
     def create_verification_token(self, subject: str) -> str:
@@ -76,13 +160,35 @@ class JWTTokenManager(TokenManager):
         )
 
     def _create_token(
-        self, subject: str, expires_delta: timedelta, token_type: TokenScope
+        self,
+        subject: str,
+        expires_delta: timedelta,
+        token_type: TokenScope,
+        claims: AccountClaims | None = None,
+        family: RefreshTokenFamily | None = None,
     ) -> str:
         expire = datetime.now(UTC) + expires_delta
-        to_encode = {"exp": expire, "sub": str(subject), "type": token_type}
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        to_encode: dict[str, Any] = {
+            "exp": int(expire.timestamp()),
+            "sub": str(subject),
+            "type": token_type,
+            "jti": secrets.token_urlsafe(16),
+        }
+        if claims and self.claims_only_access:
+            to_encode.update(
+                email=claims.email,
+                is_superuser=claims.is_superuser,
+                is_verified=claims.is_verified,
+                ver=claims.token_version,
+            )
+        if family:
+            to_encode.update(fam=family.family_id.hex, gen=family.generation)
+        headers = {"kid": self.key_ring.active_kid} if self.key_ring else None
+        encoded_jwt = self._codec.encode(
+            to_encode, self._signing_key, self.algorithm, headers
+        )
         logger.debug(f"Token created: {token_type} for subject: {subject}")
-        return str(encoded_jwt)
+        return encoded_jwt
 
     def decode_token(self, token: str, expected_type: TokenScope) -> str:
         """Decodes and validates a JWT token.
@@ -98,19 +204,144 @@ class JWTTokenManager(TokenManager):
             InvalidTokenException: If token is invalid or type mismatch.
             TokenExpiredException: If token has expired.
         """
+        return self.decode_token_payload(token, expected_type).subject
+
+    def decode_token_payload(
+        self, token: str, expected_type: TokenScope
+    ) -> TokenPayload:
+        """Decodes and validates a JWT token, including embedded account claims.
+
+        Claims are returned only when claims-only access is enabled and the
+        token carries them, so tokens issued before the switch still work.
+
+        Args:
+            token: The JWT string.
+            expected_type: The expected scope/type of the token.
+
+        Returns:
+            The subject and the account claims, if any.
+
+        Raises:
+            InvalidTokenException: If token is invalid or type mismatch.
+            TokenExpiredException: If token has expired.
+        """
+        digest = None
+        if self._decode_cache is not None:
+            digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+            cached = self._decode_cache.lookup(digest)
+            if cached is not MISSING:
+                token_type, token_payload = cached
+                if token_type != expected_type:
+                    raise InvalidTokenException("Invalid token type")
+                self._check_not_revoked(token_payload)
+                return token_payload
+
+        payload = self._codec.decode(
+            token, self._verification_key(token), self.algorithm
+        )
+
+        if payload.get("type") != expected_type:
+            raise InvalidTokenException("Invalid token type")
+
+        exp = payload.get("exp")
+        if not isinstance(exp, int | float):
+            raise InvalidTokenException("Missing expiration claim")
+        jti = payload.get("jti")
+
+        subject = str(payload.get("sub"))
+        logger.debug(f"Token decoded successfully for subject: {subject}")
+        token_payload = TokenPayload(
+            subject=subject,
+            claims=self._read_claims(payload),
+            token_id=None if jti is None else str(jti),
+            expires_at=int(exp),
+            family=self._read_family(payload),
+        )
+        self._check_not_revoked(token_payload)
+
+        if self._decode_cache is not None and digest is not None:
+            # Entries must not outlive the token, so the TTL ends at "exp".
+            ttl = exp - time.time()
+            if ttl > 0:
+                self._decode_cache.set(digest, (expected_type, token_payload), ttl)
+        return token_payload
+
+    def revoke_token(self, token: str, expected_type: TokenScope) -> TokenPayload:
+        """Revokes a token until it expires.
+
+        Tokens issued without a "jti" cannot be revoked and stay valid until
+        they expire.
+
+        Args:
+            token: The JWT string.
+            expected_type: The expected scope/type of the token.
+
+        Returns:
+            The payload of the revoked token.
+
+        Raises:
+            InvalidTokenException: If token is invalid or type mismatch.
+            TokenExpiredException: If token has expired.
+        """
+        token_payload = self.decode_token_payload(token, expected_type)
+        if token_payload.token_id is None or token_payload.expires_at is None:
+            logger.warning(
+                f"Token without jti cannot be revoked: {token_payload.subject}"
+            )
+            return token_payload
+        self._denylist.revoke(token_payload.token_id, token_payload.expires_at)
+        logger.info(f"Token revoked: {expected_type} for: {token_payload.subject}")
+        return token_payload
+
+    def decode_cache_stats(self) -> dict[str, Any]:
+        """Returns decode cache counters (empty when the cache is disabled)."""
+        if self._decode_cache is None:
+            return {}
+        stats = self._decode_cache.stats()
+        return {**asdict(stats), "hit_ratio": stats.hit_ratio}
+
+    def public_jwks(self) -> dict[str, Any]:
+        """Returns the JWKS of the verification keys (empty for HMAC)."""
+        return self.key_ring.jwks() if self.key_ring else {"keys": []}
+
+    def _verification_key(self, token: str) -> Any:
+        if not self.key_ring:
+            return self._signing_key
+        kid = self._codec.get_unverified_header(token).get("kid")
+        key = self._verification_keys.get(kid) if isinstance(kid, str) else None
+        if key is None:
+            raise InvalidTokenException("Unknown signing key")
+        return key
+
+    def _check_not_revoked(self, token_payload: TokenPayload) -> None:
+        if token_payload.token_id is not None and token_payload.token_id in (
+            self._denylist
+        ):
+            raise InvalidTokenException("Token has been revoked")
+
+    def _read_claims(self, payload: dict[str, Any]) -> AccountClaims | None:
+        if not self.claims_only_access or "ver" not in payload:
+            return None
+        try:
+            return AccountClaims(
+                email=str(payload["email"]),
+                is_superuser=bool(payload["is_superuser"]),
+                is_verified=bool(payload["is_verified"]),
+                token_version=int(payload["ver"]),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise InvalidTokenException("Malformed token claims") from e
+
+    def _read_family(self, payload: dict[str, Any]) -> RefreshTokenFamily | None:
+        if "fam" not in payload:
+            return None
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-
-            if payload.get("type") != expected_type:
-                raise InvalidTokenException("Invalid token type")
-
-            subject = str(payload.get("sub"))
-            logger.debug(f"Token decoded successfully for subject: {subject}")
-            return subject
-        except ExpiredSignatureError as e:
-            raise TokenExpiredException from e
-        except JWTError as e:
-            raise InvalidTokenException from e
+            return RefreshTokenFamily(
+                family_id=UUID(hex=str(payload["fam"])),
+                generation=int(payload["gen"]),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise InvalidTokenException("Malformed token claims") from e
 
     @property
     def refresh_token_expires_in_seconds(self) -> int:
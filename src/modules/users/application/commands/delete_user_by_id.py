@@ -58,6 +58,7 @@ class DeleteUserProfileByIdHandler(Handler[DeleteUserProfileByIdCommand, None]):
             if not user:
                 raise UserProfileNotFoundException
 
+            user.delete()
             await self._uow.users.delete(user)
             await self._uow.commit()
 
@@ -42,9 +42,8 @@ class CreateUserHandler(IntegrationEventHandler[AccountRegisteredIntegrationEven
         username = f"User_{random_id}"
         username_vo = Username(username)
         async with self._uow:
-            user = await self._service.create_user(
+            await self._service.create_user(
                 self._uow.users, user_id, event.account_id, username_vo
             )
-            await self._uow.users.add(user)
             await self._uow.commit()
         logger.info(f"User profile for account id: {event.account_id} created.")
@@ -0,0 +1,29 @@
+import logging
+
+from users.application.queries.get_my_user_profile import GetMyUserProfileQuery
+from users.application.queries.get_user_profile_by_id import GetUserProfileByIdQuery
+from users.domain.events.user_profile_deleted import UserProfileDeletedDomainEvent
+from users.domain.events.user_profile_updated import UserProfileUpdatedDomainEvent
+
+from shared.application.ports import DomainEventHandler, QueryCache
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidateUserProfileCacheHandler(
+    DomainEventHandler[UserProfileUpdatedDomainEvent | UserProfileDeletedDomainEvent]
+):
+    """Drops cached profile query results once a profile change is committed."""
+
+    def __init__(self, cache: QueryCache) -> None:
+        self._cache = cache
+
+    async def handle(
+        self, event: UserProfileUpdatedDomainEvent | UserProfileDeletedDomainEvent
+    ) -> None:
+        self._cache.invalidate(
+            GetMyUserProfileQuery(account_id=event.account_id),
+            GetUserProfileByIdQuery(user_id=event.user_id, is_superuser=True),
+            GetUserProfileByIdQuery(user_id=event.user_id, is_superuser=False),
+        )
+        logger.debug(f"User profile cache invalidated after: {type(event).__name__}")
@@ -1,6 +1,11 @@
 from dependency_injector import containers, providers
+from users.application.events.internal.invalidate_user_profile_cache import (
+    InvalidateUserProfileCacheHandler,
+)
+from users.domain.events.user_profile_deleted import UserProfileDeletedDomainEvent
+from users.domain.events.user_profile_updated import UserProfileUpdatedDomainEvent
 
-from shared.application.ports import IntegrationEventProducer
+from shared.application.ports import IntegrationEventProducer, QueryCache
 from shared.infrastructure.messaging.event_bus import InMemoryDomainEventBus
 from shared.infrastructure.messaging.event_registry import DomainEventRegistryImpl
 
@@ -14,11 +19,24 @@ class DomainEventHandlersContainer(containers.DeclarativeContainer):
     # --- Dependencies ---
     settings = providers.Configuration()
     producer: providers.Dependency[IntegrationEventProducer] = providers.Dependency()
+    query_cache: providers.Dependency[QueryCache] = providers.Dependency()
 
     # --- Event Factories ---
+    invalidate_user_profile_cache_handler = providers.Factory(
+        InvalidateUserProfileCacheHandler, cache=query_cache
+    )
 
     # --- Handlers Map ---
-    handlers = providers.Dict({})
+    handlers = providers.Dict(
+        {
+            UserProfileUpdatedDomainEvent: providers.List(
+                invalidate_user_profile_cache_handler.provider
+            ),
+            UserProfileDeletedDomainEvent: providers.List(
+                invalidate_user_profile_cache_handler.provider
+            ),
+        }
+    )
 
     # --- Bus ---
     bus = providers.Singleton(InMemoryDomainEventBus, subscribers=handlers)
@@ -26,5 +44,8 @@ class DomainEventHandlersContainer(containers.DeclarativeContainer):
     # --- Registry ---
     registry = providers.Singleton(
         DomainEventRegistryImpl,
-        events=[],
+        events=[
+            UserProfileUpdatedDomainEvent,
+            UserProfileDeletedDomainEvent,
+        ],
     )
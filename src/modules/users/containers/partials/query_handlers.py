@@ -10,6 +10,7 @@ from users.application.queries.get_user_profile_by_id import (
 from users.application.uow import UsersUnitOfWork
 
 from shared.infrastructure.cqrs.buses import QueryBus
+from shared.infrastructure.cqrs.caching import CachingQueryBus, QueryResultCache
 
 
 class QueryHandlersContainer(containers.DeclarativeContainer):
@@ -20,6 +21,7 @@ class QueryHandlersContainer(containers.DeclarativeContainer):
 
     # --- Dependencies ---
     uow: providers.Dependency[UsersUnitOfWork] = providers.Dependency()
+    query_cache: providers.Dependency[QueryResultCache] = providers.Dependency()
 
     # --- Handler Factories ---
     get_my_user_profile_handler = providers.Factory(GetMyUserProfileHandler, uow=uow)
@@ -37,4 +39,5 @@ class QueryHandlersContainer(containers.DeclarativeContainer):
     )
 
     # --- Bus ---
-    bus = providers.Factory(QueryBus, handlers=handlers)
+    uncached_bus = providers.Factory(QueryBus, handlers=handlers)
+    bus = providers.Factory(CachingQueryBus, bus=uncached_bus, cache=query_cache)
@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import Any
 
 from dependency_injector import containers, providers
@@ -21,6 +21,13 @@ from shared.application.ports import (
     DomainEventRegistry,
     IntegrationEventProducer,
 )
+from shared.infrastructure.cqrs.caching import QueryResultCache
+from shared.infrastructure.database.replicas import ReadReplicaRouter
+from shared.infrastructure.outbox.batch_controller import AdaptiveBatchController
+from shared.infrastructure.outbox.listener import (
+    OutboxNotificationListener,
+    outbox_channel,
+)
 from shared.infrastructure.outbox.mixin import OutboxMixin
 from shared.infrastructure.outbox.processor import OutboxProcessor
 
@@ -30,7 +37,12 @@ async def init_outbox_processor(
     event_bus: DomainEventBus,
     event_registry: DomainEventRegistry,
     outbox_model: type[OutboxMixin],
-    batch_size: int,
+    batch_controller: AdaptiveBatchController,
+    lease_seconds: float,
+    listen_dsn: str,
+    listen_reconnect_seconds: float,
+    dispatch_concurrency: int,
+    cleanup: Callable[[], Awaitable[None]],
 ) -> AsyncGenerator[None, None]:
     """Initializes and runs the outbox processor.
 
@@ -39,7 +51,12 @@ async def init_outbox_processor(
         event_bus: Domain event bus.
         event_registry: Domain event registry.
         outbox_model: Model class for outbox events.
-        batch_size: Number of events to process per batch.
+        batch_controller: Controller of batch size and idle polling.
+        lease_seconds: How long a claimed batch is reserved for dispatch.
+        listen_dsn: DSN of the connection listening for new events.
+        listen_reconnect_seconds: Pause before the listener reconnects.
+        dispatch_concurrency: Maximum number of events dispatched at once.
+        cleanup: Releases the task-scoped session of a dispatch task.
 
     Yields:
         None: Yields control back to the caller while running.
@@ -49,11 +66,17 @@ async def init_outbox_processor(
         event_bus=event_bus,
         event_registry=event_registry,
         outbox_model=outbox_model,
-        batch_size=batch_size,
-    )
-    task = asyncio.create_task(
-        processor.run_forever(interval=0.5), name="users_outbox_task"
+        batch_controller=batch_controller,
+        lease_seconds=lease_seconds,
+        listener=OutboxNotificationListener(
+            dsn=listen_dsn,
+            channel=outbox_channel(outbox_model),
+            reconnect_delay_seconds=listen_reconnect_seconds,
+        ),
+        dispatch_concurrency=dispatch_concurrency,
+        cleanup=cleanup,
     )
+    task = asyncio.create_task(processor.run_forever(), name="users_outbox_task")
     yield
     task.cancel()
     try:
@@ -74,6 +97,8 @@ class UsersContainer(containers.DeclarativeContainer):
     )
     settings = providers.Configuration()
     session_factory: providers.Provider[Callable[..., Any]] = providers.Dependency()
+    replica_router: providers.Dependency[ReadReplicaRouter] = providers.Dependency()
+    listen_dsn: providers.Dependency[str] = providers.Dependency()
 
     # --- External Contracts ---
     auth_contract: providers.Provider[AuthModulePort] = providers.Dependency()
@@ -88,14 +113,45 @@ class UsersContainer(containers.DeclarativeContainer):
         session_factory=session_factory,
         event_registry=event_registry,
     )
+    read_uow = providers.Factory(
+        SqlAlchemyUsersUnitOfWork,
+        session_factory=session_factory,
+        event_registry=event_registry,
+        read_only=True,
+        replica_router=replica_router,
+    )
 
+    outbox_batch_controller = providers.Singleton(
+        AdaptiveBatchController,
+        min_batch_size=settings.outbox.MIN_BATCH_SIZE,
+        max_batch_size=settings.outbox.MAX_BATCH_SIZE,
+        target_latency_seconds=settings.outbox.TARGET_BATCH_LATENCY_SECONDS,
+        min_idle_interval=settings.outbox.MIN_POLL_INTERVAL_SECONDS,
+        max_idle_interval=settings.outbox.MAX_POLL_INTERVAL_SECONDS,
+    )
     outbox_processor = providers.Resource(
         init_outbox_processor,
         session_factory=session_factory,
         event_bus=event_bus,
         event_registry=event_registry,
         outbox_model=providers.Object(UsersOutboxEvent),
-        batch_size=20,
+        batch_controller=outbox_batch_controller,
+        lease_seconds=settings.outbox.LEASE_SECONDS,
+        listen_dsn=listen_dsn,
+        listen_reconnect_seconds=settings.outbox.LISTEN_RECONNECT_SECONDS,
+        dispatch_concurrency=settings.outbox.DISPATCH_CONCURRENCY,
+        cleanup=session_factory.provided.remove,
+    )
+
+    # --- Caching ---
+    query_cache = providers.Singleton(
+        QueryResultCache,
+        ttl_seconds=providers.Callable(
+            lambda enabled, ttl_seconds: ttl_seconds if enabled else {},
+            enabled=settings.query_cache.ENABLED,
+            ttl_seconds=settings.query_cache.TTL_SECONDS,
+        ),
+        max_size=settings.query_cache.MAX_SIZE,
     )
 
     # --- Sub-Containers ---
@@ -103,11 +159,14 @@ class UsersContainer(containers.DeclarativeContainer):
     command_handlers = providers.Container(
         CommandHandlersContainer, uow=uow, domain_services=domain_services
     )
-    query_handlers = providers.Container(QueryHandlersContainer, uow=uow)
+    query_handlers = providers.Container(
+        QueryHandlersContainer, uow=read_uow, query_cache=query_cache
+    )
     domain_event_handlers = providers.Container(
         DomainEventHandlersContainer,
         settings=settings,
         producer=event_producer,
+        query_cache=query_cache,
     )
     integration_event_handlers = providers.Container(
         IntegrationEventHandlersContainer,
@@ -120,7 +179,7 @@ class UsersContainer(containers.DeclarativeContainer):
     event_bus.override(domain_event_handlers.bus)
     event_registry.override(domain_event_handlers.registry)
     command_handlers.uow.override(uow)
-    query_handlers.uow.override(uow)
+    query_handlers.uow.override(read_uow)
     integration_event_handlers.uow.override(uow)
 
     # --- Convenience aliases ---
@@ -128,3 +187,9 @@ class UsersContainer(containers.DeclarativeContainer):
     query_bus = query_handlers.bus
     event_consumer = integration_event_handlers.consumer
     exception_mappings = providers.Object(USERS_EXCEPTION_MAPPINGS)
+    metrics_sources = providers.Dict(
+        {
+            "users.query_cache": query_cache.provided.stats,
+            "users.outbox": outbox_batch_controller.provided.stats,
+        }
+    )
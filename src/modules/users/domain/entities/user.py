@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from users.domain.events.user_profile_deleted import UserProfileDeletedDomainEvent
+from users.domain.events.user_profile_updated import UserProfileUpdatedDomainEvent
 from users.domain.value_objects.username import Username
 
 from shared.domain.primitives import AggregateRoot
@@ -41,6 +43,15 @@ class User(AggregateRoot):
             new_username: New Username value object.
         """
         self.username = new_username
+        self.add_event(
+            UserProfileUpdatedDomainEvent(user_id=self.id, account_id=self.account_id)
+        )
+
+    def delete(self) -> None:
+        """Records the deletion of the user."""
+        self.add_event(
+            UserProfileDeletedDomainEvent(user_id=self.id, account_id=self.account_id)
+        )
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, User):
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from shared.domain.events import DomainEvent
+
+
+@dataclass(frozen=True)
+class UserProfileUpdatedDomainEvent(DomainEvent):
+    user_id: UUID
+    account_id: UUID
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"user_id": str(self.user_id), "account_id": str(self.account_id)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "UserProfileUpdatedDomainEvent":
+        return cls(user_id=UUID(data["user_id"]), account_id=UUID(data["account_id"]))
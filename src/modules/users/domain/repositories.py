@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from users.domain.entities.user import User
@@ -13,6 +14,11 @@ class UserRepository(ABC):
         """Retrieve a user by their unique identifier."""
         pass
 
+    @abstractmethod
+    async def get_many_by_ids(self, user_ids: Sequence[UUID]) -> list[User]:
+        """Retrieve the users with the given IDs, skipping missing ones."""
+        pass
+
     @abstractmethod
     async def get_by_account_id(self, account_id: UUID) -> User | None:
         """Retrieve a user by their account ID."""
@@ -25,7 +31,12 @@ class UserRepository(ABC):
 
     @abstractmethod
     async def add(self, user: User) -> None:
-        """Add a new user to the repository."""
+        """Add a new user to the repository.
+
+        Raises:
+            UsernameIsAlreadyTakenException: If the username is taken.
+            UserAlreadyExistsForAccountException: If the account has a user.
+        """
         pass
 
     @abstractmethod
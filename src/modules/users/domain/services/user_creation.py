@@ -1,10 +1,6 @@
 from uuid import UUID
 
 from users.domain.entities.user import User
-from users.domain.exceptions import (
-    UserAlreadyExistsForAccountException,
-    UsernameIsAlreadyTakenException,
-)
 from users.domain.repositories import UserRepository
 from users.domain.value_objects.username import Username
 
@@ -19,10 +15,13 @@ class UserCreationService:
         account_id: UUID,
         username: Username,
     ) -> User:
-        """Creates a new user ensuring domain rules.
+        """Creates and persists a new user ensuring domain rules.
+
+        Uniqueness of the username and of the account's profile is enforced
+        by the repository on insert.
 
         Args:
-            repository: User repository to check uniqueness.
+            repository: User repository.
             user_id: New User UUID.
             account_id: Associated Account UUID.
             username: Desired Username.
@@ -34,10 +33,6 @@ class UserCreationService:
             UsernameIsAlreadyTakenException: If username is taken.
             UserAlreadyExistsForAccountException: If account already has a user profile.
         """
-        if await repository.get_by_username(username):
-            raise UsernameIsAlreadyTakenException
-
-        if await repository.get_by_id(account_id):
-            raise UserAlreadyExistsForAccountException
-
-        return User.create(id=user_id, account_id=account_id, username=username)
+        user = User.create(id=user_id, account_id=account_id, username=username)
+        await repository.add(user)
+        return user
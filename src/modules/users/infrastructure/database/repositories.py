@@ -1,30 +1,52 @@
+from collections.abc import Sequence
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import Result, Select, select
+from sqlalchemy import (
+    Executable,
+    Result,
+    Row,
+    any_,
+    delete,
+    exists,
+    lambda_stmt,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from users.domain.entities.user import User
+from users.domain.exceptions import (
+    UserAlreadyExistsForAccountException,
+    UsernameIsAlreadyTakenException,
+)
 from users.domain.repositories import UserRepository
 from users.domain.value_objects.username import Username
 from users.infrastructure.database.models import UserModel
 
 from shared.infrastructure.database.base_repository import BaseSqlAlchemyRepository
 
+# Reads select table columns and map rows straight to users, without ORM
+# instances or identity-map bookkeeping.
+users_table = UserModel.__table__
+
 
 class SqlAlchemyUserRepository(UserRepository, BaseSqlAlchemyRepository[User]):
     """SQLAlchemy implementation of UserRepository.
 
     Args:
         session: Async SQLAlchemy session.
+        track_aggregates: Whether loaded and saved users are registered.
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, track_aggregates: bool = True):
         """Initializes the repository.
 
         Args:
             session: Async SQLAlchemy session.
+            track_aggregates: Whether loaded and saved users are registered.
         """
-        self._session = session
+        super().__init__(session, track_aggregates)
 
     async def get_by_id(self, id: UUID) -> User | None:
         """Retrieves user by ID.
@@ -35,9 +57,26 @@ class SqlAlchemyUserRepository(UserRepository, BaseSqlAlchemyRepository[User]):
         Returns:
             User: User entity or None.
         """
-        stmt = select(UserModel).where(UserModel.id == id)
+        stmt = lambda_stmt(lambda: select(users_table).where(users_table.c.id == id))
         return await self._execute(stmt)
 
+    async def get_many_by_ids(self, user_ids: Sequence[UUID]) -> list[User]:
+        """Retrieves users by IDs in a single query.
+
+        Args:
+            user_ids: User UUIDs.
+
+        Returns:
+            list[User]: Found users; missing IDs are skipped.
+        """
+        if not user_ids:
+            return []
+        stmt = select(users_table).where(
+            users_table.c.id == any_(self._id_array(user_ids))
+        )
+        result: Result[Any] = await self._session.execute(stmt)
+        return [self._to_domain(row) for row in result]
+
     async def get_by_account_id(self, account_id: UUID) -> User | None:
         """Retrieves user by account ID.
 
@@ -47,7 +86,9 @@ class SqlAlchemyUserRepository(UserRepository, BaseSqlAlchemyRepository[User]):
         Returns:
             User: User entity or None.
         """
-        stmt = select(UserModel).where(UserModel.account_id == account_id)
+        stmt = lambda_stmt(
+            lambda: select(users_table).where(users_table.c.account_id == account_id)
+        )
         return await self._execute(stmt)
 
     async def get_by_username(self, username: Username) -> User | None:
@@ -59,18 +100,42 @@ class SqlAlchemyUserRepository(UserRepository, BaseSqlAlchemyRepository[User]):
         Returns:
             User: User entity or None.
         """
-        stmt = select(UserModel).where(UserModel.username == username.value)
+        value = username.value
+        stmt = lambda_stmt(
+            lambda: select(users_table).where(users_table.c.username == value)
+        )
         return await self._execute(stmt)
 
     async def add(self, user: User) -> None:
         """Adds a new user.
 
+        Inserts in a single statement that skips rows conflicting with an
+        existing username or account. Only on a conflict is the cause
+        looked up.
+
         Args:
             user: User entity.
+
+        Raises:
+            UsernameIsAlreadyTakenException: If the username is taken.
+            UserAlreadyExistsForAccountException: If the account has a user.
         """
         self._register(user)
-        user_model = self._to_model(user)
-        self._session.add(user_model)
+        values = self._to_values(user)
+        result = await self._execute_write(
+            insert(UserModel)
+            .values(id=user.id, **values)
+            .on_conflict_do_nothing()
+            .returning(UserModel.id)
+        )
+        if result.scalar_one_or_none() is None:
+            account_has_user = await self._session.scalar(
+                select(exists().where(UserModel.account_id == user.account_id))
+            )
+            if account_has_user:
+                raise UserAlreadyExistsForAccountException
+            raise UsernameIsAlreadyTakenException
+        self._snapshot(user.id, values)
 
     async def update(self, user: User) -> None:
         """Updates an existing user.
@@ -79,8 +144,15 @@ class SqlAlchemyUserRepository(UserRepository, BaseSqlAlchemyRepository[User]):
             user: User entity.
         """
         self._register(user)
-        user_model = self._to_model(user)
-        await self._session.merge(user_model)
+        values = self._to_values(user)
+        changes = self._changed_values(user.id, values)
+        if not changes:
+            return
+
+        await self._execute_write(
+            update(UserModel).where(UserModel.id == user.id).values(changes)
+        )
+        self._snapshot(user.id, values)
 
     async def delete(self, user: User) -> None:
         """Deletes a user.
@@ -89,41 +161,41 @@ class SqlAlchemyUserRepository(UserRepository, BaseSqlAlchemyRepository[User]):
             user: User entity.
         """
         self._register(user)
-        user_model = self._to_model(user)
-        await self._session.delete(user_model)
+        await self._execute_write(delete(UserModel).where(UserModel.id == user.id))
+        self._snapshots.pop(user.id, None)
 
-    def _to_domain(self, user_model: UserModel) -> User:
-        """Converts model to domain entity.
+    def _to_domain(self, row: Row[Any]) -> User:
+        """Converts a users row to domain entity.
 
         Args:
-            user_model: Database model.
+            row: Row with the users columns.
 
         Returns:
             User: Domain entity.
         """
         user = User(
-            id=user_model.id,
-            account_id=user_model.account_id,
-            username=Username(user_model.username),
+            id=row.id,
+            account_id=row.account_id,
+            username=Username(row.username),
         )
+        self._snapshot(user.id, self._to_values(user))
         return self._register(user)
 
-    def _to_model(self, user: User) -> UserModel:
-        """Converts domain entity to model.
+    def _to_values(self, user: User) -> dict[str, Any]:
+        """Converts domain entity to column values, without the ID.
 
         Args:
             user: Domain entity.
 
         Returns:
-            UserModel: Database model.
+            dict[str, Any]: Column values.
         """
-        return UserModel(
-            id=user.id,
-            account_id=user.account_id,
-            username=user.username.value,
-        )
+        return {
+            "account_id": user.account_id,
+            "username": user.username.value,
+        }
 
-    async def _execute(self, stmt: Select[Any]) -> User | None:
+    async def _execute(self, stmt: Executable) -> User | None:
         """Executes selection query.
 
         Args:
@@ -133,5 +205,5 @@ class SqlAlchemyUserRepository(UserRepository, BaseSqlAlchemyRepository[User]):
             User: User entity or None from first result.
         """
         result: Result[Any] = await self._session.execute(stmt)
-        user_model = result.scalar_one_or_none()
-        return self._to_domain(user_model) if user_model else None
+        row = result.one_or_none()
+        return self._to_domain(row) if row else None
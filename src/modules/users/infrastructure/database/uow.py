@@ -6,6 +6,7 @@ from users.infrastructure.database.repositories import SqlAlchemyUserRepository
 
 from shared.application.ports import DomainEventRegistry
 from shared.infrastructure.database.base_uow import BaseSqlAlchemyUnitOfWork
+from shared.infrastructure.database.replicas import ReadReplicaRouter
 
 
 class SqlAlchemyUsersUnitOfWork(BaseSqlAlchemyUnitOfWork, UsersUnitOfWork):
@@ -14,26 +15,34 @@ class SqlAlchemyUsersUnitOfWork(BaseSqlAlchemyUnitOfWork, UsersUnitOfWork):
     Args:
         session_factory: Factory for async sessions.
         event_registry: Domain event registry.
+        read_only: Whether the UoW only reads.
+        replica_router: Router for read-only sessions.
     """
 
     def __init__(
         self,
         session_factory: async_sessionmaker[AsyncSession],
         event_registry: DomainEventRegistry,
+        read_only: bool = False,
+        replica_router: ReadReplicaRouter | None = None,
     ):
         """Initializes the Unit of Work.
 
         Args:
             session_factory: Session factory.
             event_registry: Event registry.
+            read_only: Whether the UoW only reads.
+            replica_router: Router for read-only sessions.
         """
-        super().__init__(session_factory, event_registry)
+        super().__init__(session_factory, event_registry, read_only, replica_router)
         self.users: UserRepository
 
     async def __aenter__(self) -> "SqlAlchemyUsersUnitOfWork":
         await super().__aenter__()
         if self._session is not None:
-            self.users = SqlAlchemyUserRepository(self._session)
+            self.users = SqlAlchemyUserRepository(
+                self._session, track_aggregates=not self._read_only
+            )
         return self
 
     def _get_outbox_model(self) -> type[UsersOutboxEvent]:
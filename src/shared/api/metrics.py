@@ -0,0 +1,26 @@
+# ruff: noqa: B008
+
+from typing import Any
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, status
+
+from shared.infrastructure.metrics.metrics_registry import MetricsRegistry
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("", status_code=status.HTTP_200_OK)
+@inject
+async def get_metrics(
+    registry: MetricsRegistry = Depends(Provide["metrics_registry"]),
+) -> dict[str, dict[str, Any]]:
+    """Returns in-process runtime counters (caches, pools, limiters).
+
+    Args:
+        registry: Registry of metrics sources.
+
+    Returns:
+        Counters grouped by source name.
+    """
+    return registry.collect()
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 from types import TracebackType
 from typing import Any
@@ -160,9 +161,43 @@ class Handler[TMessage, TResult](ABC):
         pass
 
 
+class BatchHandler[TMessage, TResult](Handler[TMessage, TResult]):
+    """Abstract interface for handlers that can process messages in bulk."""
+
+    @abstractmethod
+    async def handle_batch(
+        self, messages: Sequence[TMessage]
+    ) -> list[TResult | Exception]:
+        """Handles messages together.
+
+        Args:
+            messages: Messages to handle.
+
+        Returns:
+            Results in the order of the messages; a message that failed on
+            its own gets its exception instead of a result.
+        """
+        pass
+
+    async def handle(self, message: TMessage) -> TResult:
+        (result,) = await self.handle_batch([message])
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
 class CqrsBus[TMessage, TResult](ABC):
     """Abstract interface for CQRS buses."""
 
     @abstractmethod
     async def dispatch(self, message: TMessage) -> TResult:
         pass
+
+
+class QueryCache(ABC):
+    """Abstract interface for query result caches."""
+
+    @abstractmethod
+    def invalidate(self, *queries: Query) -> None:
+        """Drops the cached results of the given queries."""
+        pass
@@ -0,0 +1,103 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from enum import Enum
+
+
+class Missing(Enum):
+    """Marker for a cache miss, distinct from a cached None."""
+
+    MISSING = "missing"
+
+
+MISSING = Missing.MISSING
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache counters."""
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Returns the share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache[K: Hashable, V]:
+    """Bounded in-process LRU cache with per-entry expiry.
+
+    Not thread-safe; intended for use from the event loop.
+
+    Args:
+        max_size: Maximum number of entries before the least recently used
+            one is evicted.
+        ttl_seconds: Default entry lifetime.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        """Initializes the cache."""
+        self._max_size = max(max_size, 1)
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def lookup(self, key: K) -> V | Missing:
+        """Returns the cached value or MISSING if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return MISSING
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._misses += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        """Stores a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key.
+            value: Value to store. None is a valid value (negative caching).
+            ttl_seconds: Entry lifetime. Defaults to the cache TTL.
+        """
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def pop(self, key: K) -> V | Missing:
+        """Removes a key, returning its value or MISSING if absent."""
+        entry = self._entries.pop(key, None)
+        return MISSING if entry is None else entry[0]
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Returns the current counters."""
+        return CacheStats(
+            size=len(self._entries),
+            max_size=self._max_size,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from shared.application.ports import BatchHandler, Query
+
+logger = logging.getLogger(__name__)
+
+type BatchEntry = tuple[Query, asyncio.Future[Any]]
+
+
+@dataclass
+class _BatchScope:
+    results: dict[Query, asyncio.Future[Any]] = field(default_factory=dict)
+    pending: dict[BatchHandler[Any, Any], list[BatchEntry]] = field(
+        default_factory=dict
+    )
+    tasks: set[asyncio.Task[None]] = field(default_factory=set)
+
+
+_scope: ContextVar[_BatchScope | None] = ContextVar("query_batch_scope", default=None)
+
+
+@contextmanager
+def query_batch_scope() -> Iterator[None]:
+    """Opens a batching and memoization scope, typically one per request.
+
+    Tasks started inside the scope, such as those of asyncio.gather, share
+    it through the copied context.
+    """
+    token = _scope.set(_BatchScope())
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def clear_query_memo() -> None:
+    """Forgets the memoized results of the current scope, e.g. after a write.
+
+    Queries already in flight still resolve for their callers; later equal
+    queries load again.
+    """
+    scope = _scope.get()
+    if scope is not None:
+        scope.results.clear()
+
+
+class QueryBatchLoader:
+    """Coalesces batchable queries dispatched in the same event loop tick.
+
+    The first query for a handler schedules a flush with loop.call_soon, so
+    queries for the same handler dispatched before the loop comes around,
+    e.g. by sibling tasks of asyncio.gather, go to the handler as a single
+    batch. Within a scope, equal queries are memoized and resolve to the
+    same result until a unit of work commits; outside a scope, queries go
+    straight to the handler.
+
+    Batches run in their own task, which holds its own task-scoped
+    resources, so cleanup is awaited after each batch to release them.
+
+    Args:
+        cleanup: Awaited in the batch task once the batch is done.
+    """
+
+    def __init__(self, cleanup: Callable[[], Awaitable[None]] | None = None) -> None:
+        """Initializes the loader."""
+        self._cleanup = cleanup
+        self._batches = 0
+        self._queries = 0
+        self._memoized = 0
+
+    async def load(self, handler: BatchHandler[Any, Any], query: Query) -> Any:
+        """Returns the result of the query, batched with its neighbours.
+
+        Args:
+            handler: Handler of the query type.
+            query: Query to resolve.
+
+        Returns:
+            Any: The handler result for the query.
+        """
+        scope = _scope.get()
+        if scope is None:
+            return await handler.handle(query)
+
+        future = scope.results.get(query)
+        if future is not None:
+            self._memoized += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        scope.results[query] = future
+        pending = scope.pending.setdefault(handler, [])
+        pending.append((query, future))
+        if len(pending) == 1:
+            loop.call_soon(self._flush, scope, handler)
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict[str, Any]:
+        """Returns batch and memoization counters."""
+        return {
+            "batches": self._batches,
+            "queries": self._queries,
+            "memoized": self._memoized,
+            "avg_batch_size": self._queries / self._batches if self._batches else 0.0,
+        }
+
+    def _flush(self, scope: _BatchScope, handler: BatchHandler[Any, Any]) -> None:
+        batch = scope.pending.pop(handler)
+        task = asyncio.create_task(self._run(scope, handler, batch))
+        scope.tasks.add(task)
+        task.add_done_callback(scope.tasks.discard)
+
+    async def _run(
+        self,
+        scope: _BatchScope,
+        handler: BatchHandler[Any, Any],
+        batch: list[BatchEntry],
+    ) -> None:
+        self._batches += 1
+        self._queries += len(batch)
+        logger.debug(f"Dispatching batch of {len(batch)}: {type(handler).__name__}")
+        try:
+            results = await handler.handle_batch([query for query, _ in batch])
+            for (_, future), result in zip(batch, results, strict=True):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        except Exception as e:
+            # Failures of the whole batch are not memoized, so a retry reloads.
+            for query, future in batch:
+                scope.results.pop(query, None)
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+            if self._cleanup is not None:
+                await self._cleanup()
@@ -2,11 +2,13 @@ import logging
 from typing import Any
 
 from shared.application.ports import (
+    BatchHandler,
     Command,
     CqrsBus,
     Handler,
     Query,
 )
+from shared.infrastructure.cqrs.batching import QueryBatchLoader
 from shared.infrastructure.exceptions.exceptions import BusException
 
 logger = logging.getLogger(__name__)
@@ -35,12 +37,16 @@ class GenericCqrsBus[TMessage, TResult](CqrsBus[TMessage, TResult]):
         Raises:
             BusException: If no handler is found.
         """
+        handler = self._get_handler(command)
+        logger.debug(f"Dispatching command: {type(command).__name__}")
+        return await handler.handle(command)
+
+    def _get_handler(self, command: TMessage) -> Handler[TMessage, TResult]:
         handler = self._handlers.get(type(command))
         if not handler:
             logger.error(f"No handler found for command: {type(command).__name__}")
             raise BusException
-        logger.debug(f"Dispatching command: {type(command).__name__}")
-        return await handler.handle(command)
+        return handler
 
 
 class CommandBus(GenericCqrsBus[Command, None]):
@@ -50,6 +56,39 @@ class CommandBus(GenericCqrsBus[Command, None]):
 
 
 class QueryBus(GenericCqrsBus[Query, Any]):
-    """Bus for dispatching queries."""
+    """Bus for dispatching queries.
 
-    pass
+    Queries with a batch-capable handler go through the batch loader, when
+    one is given.
+
+    Args:
+        handlers: Dictionary of query types to handlers.
+        batch_loader: Loader that coalesces batchable queries.
+    """
+
+    def __init__(
+        self,
+        handlers: dict[type[Query], Handler[Query, Any]],
+        batch_loader: QueryBatchLoader | None = None,
+    ):
+        """Initializes the bus."""
+        super().__init__(handlers)
+        self._batch_loader = batch_loader
+
+    async def dispatch(self, command: Query) -> Any:
+        """Dispatches a query to its handler, batching it where possible.
+
+        Args:
+            command: The query to dispatch.
+
+        Returns:
+            Any: The handler result.
+
+        Raises:
+            BusException: If no handler is found.
+        """
+        handler = self._get_handler(command)
+        if self._batch_loader is not None and isinstance(handler, BatchHandler):
+            return await self._batch_loader.load(handler, command)
+        logger.debug(f"Dispatching command: {type(command).__name__}")
+        return await handler.handle(command)
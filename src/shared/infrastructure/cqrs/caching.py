@@ -0,0 +1,139 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import asdict
+from typing import Any
+
+from shared.application.ports import CqrsBus, Query, QueryCache
+from shared.infrastructure.caching.ttl_cache import MISSING, TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class QueryResultCache(QueryCache):
+    """Per-process cache of query results with in-flight coalescing.
+
+    Only query types with a configured TTL are cached; each gets its own
+    bounded TTL cache keyed by the query itself. Concurrent misses for an
+    equal query share one execution. A result whose query is invalidated
+    while it is being loaded is returned but not cached.
+
+    Args:
+        ttl_seconds: Result lifetime per query type name. Types not listed
+            are not cached.
+        max_size: Maximum number of cached results per query type.
+    """
+
+    def __init__(self, ttl_seconds: Mapping[str, float], max_size: int) -> None:
+        """Initializes the cache."""
+        self._caches: dict[str, TTLCache[Query, Any]] = {
+            name: TTLCache(max_size, ttl) for name, ttl in ttl_seconds.items()
+        }
+        self._in_flight: dict[Query, asyncio.Future[Any]] = {}
+        self._stale: set[Query] = set()
+        self._coalesced = 0
+        self._invalidations = 0
+
+    async def get_or_load(
+        self, query: Query, load: Callable[[Query], Awaitable[Any]]
+    ) -> Any:
+        """Returns the cached result of the query, loading it on a miss.
+
+        Args:
+            query: Query to resolve.
+            load: Executes the query.
+
+        Returns:
+            Any: The query result.
+        """
+        cache = self._caches.get(type(query).__name__)
+        if cache is None:
+            return await load(query)
+
+        cached = cache.lookup(query)
+        if cached is not MISSING:
+            return cached
+
+        future = self._in_flight.get(query)
+        if future is not None:
+            self._coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The loading caller was cancelled, not this one.
+                return await self.get_or_load(query, load)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[query] = future
+        stale = False
+        try:
+            result = await load(query)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark it retrieved; followers, if any, re-raise it themselves.
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._in_flight[query]
+            if query in self._stale:
+                self._stale.discard(query)
+                stale = True
+
+        future.set_result(result)
+        if not stale:
+            cache.set(query, result)
+        return result
+
+    def invalidate(self, *queries: Query) -> None:
+        """Drops the cached results of the given queries."""
+        for query in queries:
+            cache = self._caches.get(type(query).__name__)
+            if cache is None:
+                continue
+            cache.pop(query)
+            if query in self._in_flight:
+                self._stale.add(query)
+            self._invalidations += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Returns per-type cache counters and coalescing counters."""
+        types = {}
+        for name, cache in self._caches.items():
+            stats = cache.stats()
+            types[name] = {**asdict(stats), "hit_ratio": stats.hit_ratio}
+        return {
+            "types": types,
+            "in_flight": len(self._in_flight),
+            "coalesced": self._coalesced,
+            "invalidations": self._invalidations,
+        }
+
+
+class CachingQueryBus(CqrsBus[Query, Any]):
+    """Query bus decorator that serves results through a QueryResultCache.
+
+    Args:
+        bus: Bus that executes queries.
+        cache: Result cache.
+    """
+
+    def __init__(self, bus: CqrsBus[Query, Any], cache: QueryResultCache) -> None:
+        """Initializes the bus."""
+        self._bus = bus
+        self._cache = cache
+
+    async def dispatch(self, message: Query) -> Any:
+        """Dispatches a query, serving cached results where configured.
+
+        Args:
+            message: The query to dispatch.
+
+        Returns:
+            Any: The handler result.
+        """
+        return await self._cache.get_or_load(message, self._bus.dispatch)
@@ -1,19 +1,36 @@
+from collections.abc import Sequence
 from typing import Any
+from uuid import UUID
+
+from sqlalchemy import BindParameter, Executable, Result, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 from shared.domain.primitives import AggregateRoot
 from shared.domain.registry import AggregateRegistry
 
+# Session.info key set when a repository writes with a statement, which the
+# session itself does not track as a pending change.
+PENDING_WRITES_KEY = "pending_writes"
+
 
 class BaseSqlAlchemyRepository[TAggregate: AggregateRoot]:
     """Base repository for SQLAlchemy with aggregate registration.
 
+    Keeps a snapshot of the column values of every aggregate it loads, so
+    saves can write only the columns that changed.
+
     Args:
         session: SQLAlchemy session.
+        track_aggregates: Whether loaded and saved aggregates are registered.
+            Disabled for read-only units of work, which never collect events.
     """
 
-    def __init__(self, session: Any):
+    def __init__(self, session: Any, track_aggregates: bool = True):
         """Initializes the repository."""
         self._session = session
+        self._track_aggregates = track_aggregates
+        self._snapshots: dict[UUID, dict[str, Any]] = {}
 
     def _register(self, aggregate: TAggregate) -> TAggregate:
         """Registers aggregate with the global registry.
@@ -24,6 +41,67 @@ class BaseSqlAlchemyRepository[TAggregate: AggregateRoot]:
         Returns:
             TAggregate: The registered aggregate.
         """
-        if aggregate:
+        if aggregate and self._track_aggregates:
             AggregateRegistry.register(aggregate)
         return aggregate
+
+    def _snapshot(self, aggregate_id: UUID, values: dict[str, Any]) -> None:
+        """Records the persisted column values of an aggregate.
+
+        Args:
+            aggregate_id: Aggregate ID.
+            values: Column values as stored in the database.
+        """
+        self._snapshots[aggregate_id] = values
+
+    def _changed_values(
+        self, aggregate_id: UUID, values: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Returns the column values that differ from the snapshot.
+
+        Args:
+            aggregate_id: Aggregate ID.
+            values: Current column values.
+
+        Returns:
+            dict[str, Any]: Changed values, or all values if the aggregate
+                was not loaded by this repository.
+        """
+        snapshot = self._snapshots.get(aggregate_id)
+        if snapshot is None:
+            return values
+        return {
+            column: value
+            for column, value in values.items()
+            if column not in snapshot or snapshot[column] != value
+        }
+
+    @staticmethod
+    def _id_array(ids: Sequence[UUID]) -> BindParameter[Sequence[UUID]]:
+        """Binds IDs as one array parameter, for use with any_().
+
+        Unlike in_(), the statement text does not depend on the number of
+        IDs, so a single prepared statement serves every batch size.
+
+        Args:
+            ids: IDs to bind.
+
+        Returns:
+            BindParameter[Sequence[UUID]]: Array bind parameter.
+        """
+        return bindparam(
+            "ids", list(ids), type_=ARRAY(PG_UUID(as_uuid=True)), unique=True
+        )
+
+    async def _execute_write(self, stmt: Executable) -> Result[Any]:
+        """Executes a write statement and marks the session as written.
+
+        Args:
+            stmt: INSERT, UPDATE or DELETE statement.
+
+        Returns:
+            Result[Any]: Statement result, with any RETURNING rows.
+        """
+        result: Result[Any] = await self._session.execute(stmt)
+        self._session.info[PENDING_WRITES_KEY] = True
+        return result
@@ -2,11 +2,23 @@ import logging
 from abc import abstractmethod
 from types import TracebackType
 
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from shared.application.ports import DomainEventRegistry, UnitOfWork
 from shared.domain.registry import AggregateRegistry
-from shared.infrastructure.exceptions.exceptions import SessionNotInitializedException
+from shared.infrastructure.cqrs.batching import clear_query_memo
+from shared.infrastructure.database.base_repository import PENDING_WRITES_KEY
+from shared.infrastructure.database.replicas import (
+    READ_ONLY_OPTIONS,
+    ReadReplicaRouter,
+    mark_committed,
+)
+from shared.infrastructure.exceptions.exceptions import (
+    ReadOnlyUnitOfWorkException,
+    SessionNotInitializedException,
+)
+from shared.infrastructure.outbox.listener import outbox_channel
 from shared.infrastructure.outbox.mixin import OutboxMixin
 
 logger = logging.getLogger(__name__)
@@ -15,25 +27,49 @@ logger = logging.getLogger(__name__)
 class BaseSqlAlchemyUnitOfWork(UnitOfWork):
     """Base Unit of Work for SQLAlchemy.
 
-    Handles transaction management and outbox pattern.
+    Handles transaction management and outbox pattern. Commit is skipped
+    when the session holds no changes and no domain events are pending.
+    A commit that writes outbox rows notifies the channel of the outbox
+    table, which PostgreSQL delivers once the transaction commits.
+
+    A read-only UoW runs in a read-only transaction, does not register
+    loaded aggregates and, given a replica router, reads from a replica when
+    one is available.
 
     Args:
         session_factory: Factory for sessions.
         event_registry: Registry for domain events.
+        read_only: Whether the UoW only reads.
+        replica_router: Router for read-only sessions.
     """
 
     def __init__(
         self,
         session_factory: async_sessionmaker[AsyncSession],
         event_registry: DomainEventRegistry,
+        read_only: bool = False,
+        replica_router: ReadReplicaRouter | None = None,
     ):
         """Initializes the UoW."""
         self._session_factory = session_factory
         self._session: AsyncSession | None = None
         self._registry = event_registry
+        self._read_only = read_only
+        self._replica_router = replica_router
+        self._owns_session = False
+        self._ends_transaction = False
 
     async def __aenter__(self) -> "BaseSqlAlchemyUnitOfWork":
-        self._session = self._session_factory()
+        self._session = None
+        self._ends_transaction = False
+        if self._read_only and self._replica_router is not None:
+            self._session = await self._replica_router.open_session()
+        self._owns_session = self._session is not None
+        if self._session is None:
+            self._session = self._session_factory()
+            if self._read_only and not self._session.in_transaction():
+                await self._session.connection(execution_options=READ_ONLY_OPTIONS)
+                self._ends_transaction = True
         return self
 
     async def __aexit__(
@@ -44,17 +80,37 @@ class BaseSqlAlchemyUnitOfWork(UnitOfWork):
     ) -> None:
         if exc_type:
             await self.rollback()
+        if self._session is None:
+            return
+        if self._owns_session:
+            await self._session.close()
+            self._owns_session = False
+        elif self._ends_transaction:
+            # Later units of work on this session need a writable transaction.
+            await self._session.rollback()
+            self._ends_transaction = False
 
     async def commit(self) -> None:
         """Commits transaction and processes outbox events.
 
         Raises:
             SessionNotInitializedException: If session is missing.
+            ReadOnlyUnitOfWorkException: If the UoW is read-only and the session
+                holds changes.
         """
         if not self._session:
             raise SessionNotInitializedException
+        if self._read_only:
+            if self._has_pending_changes():
+                raise ReadOnlyUnitOfWorkException
+            return
 
         events = AggregateRegistry.pull_events()
+        if not events and not self._has_pending_changes():
+            AggregateRegistry.clear()
+            logger.debug("UnitOfWork commit skipped, nothing to write")
+            return
+
         outbox_model = self._get_outbox_model()
 
         for event in events:
@@ -62,8 +118,16 @@ class BaseSqlAlchemyUnitOfWork(UnitOfWork):
             self._session.add(
                 outbox_model(event_type=event_name, payload=event.to_dict())
             )
+        if events:
+            await self._session.execute(
+                select(func.pg_notify(outbox_channel(outbox_model), ""))
+            )
 
         await self._session.commit()
+        self._session.info.pop(PENDING_WRITES_KEY, None)
+        mark_committed()
+        # Results memoized earlier in the request predate this write
+        clear_query_memo()
         AggregateRegistry.clear()
         logger.debug("UnitOfWork committed successfully")
 
@@ -77,8 +141,18 @@ class BaseSqlAlchemyUnitOfWork(UnitOfWork):
             raise SessionNotInitializedException
 
         await self._session.rollback()
+        self._session.info.pop(PENDING_WRITES_KEY, None)
         logger.debug("UnitOfWork rolled back")
 
+    def _has_pending_changes(self) -> bool:
+        session = self._session
+        return session is not None and bool(
+            session.new
+            or session.dirty
+            or session.deleted
+            or session.info.get(PENDING_WRITES_KEY)
+        )
+
     @abstractmethod
     def _get_outbox_model(self) -> type[OutboxMixin]:
         """Returns the outbox model class."""
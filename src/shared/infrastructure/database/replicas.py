@@ -0,0 +1,167 @@
+import itertools
+import logging
+import time
+from collections.abc import Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from sqlalchemy import URL
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+logger = logging.getLogger(__name__)
+
+type ReplicaSelection = Literal["round_robin", "least_connections"]
+
+# Opens transactions with BEGIN READ ONLY, without an extra SET TRANSACTION.
+READ_ONLY_OPTIONS: dict[str, Any] = {"postgresql_readonly": True}
+
+# Monotonic time of the last commit in the current request context.
+_last_commit_at: ContextVar[float | None] = ContextVar("last_commit_at", default=None)
+
+
+def mark_committed() -> None:
+    """Records a commit, so reads in this context see it for a while."""
+    _last_commit_at.set(time.monotonic())
+
+
+@dataclass
+class _Replica:
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    unhealthy_until: float = 0.0
+    failures: int = 0
+    sessions: int = 0
+
+
+class ReadReplicaRouter:
+    """Routes read-only units of work to read replicas.
+
+    Replicas are picked round-robin or by fewest checked-out connections.
+    A replica that fails to hand out a connection is skipped for the
+    cooldown, and the unit of work falls back to the primary. After a commit
+    in the current request context, reads go to the primary for the
+    read-your-writes window, so a request sees its own writes despite
+    replication lag.
+
+    With no replica DSNs, every read goes to the primary.
+
+    Args:
+        dsns: SQLAlchemy URLs of the replicas.
+        selection: Replica selection strategy.
+        failure_cooldown_seconds: How long a failed replica is skipped.
+        read_your_writes_seconds: How long after a commit reads use the primary.
+        engine_options: Keyword arguments for create_async_engine.
+    """
+
+    def __init__(
+        self,
+        dsns: Sequence[str | URL],
+        selection: ReplicaSelection = "round_robin",
+        failure_cooldown_seconds: float = 30.0,
+        read_your_writes_seconds: float = 5.0,
+        engine_options: dict[str, Any] | None = None,
+    ) -> None:
+        """Initializes the router and creates one engine per replica."""
+        self._selection = selection
+        self._failure_cooldown_seconds = failure_cooldown_seconds
+        self._read_your_writes_seconds = read_your_writes_seconds
+        self._replicas: list[_Replica] = []
+        for dsn in dsns:
+            engine = create_async_engine(dsn, **(engine_options or {}))
+            self._replicas.append(
+                _Replica(
+                    engine=engine,
+                    session_factory=async_sessionmaker(
+                        bind=engine, autoflush=False, expire_on_commit=False
+                    ),
+                )
+            )
+        self._round_robin = itertools.cycle(range(len(self._replicas)))
+        self._primary_reads = 0
+
+    async def open_session(self) -> AsyncSession | None:
+        """Opens a connected session on a replica.
+
+        Returns:
+            A session the caller must close, or None if the read should go
+            to the primary.
+        """
+        replica = self._choose()
+        if replica is None:
+            self._primary_reads += 1
+            return None
+
+        session = replica.session_factory()
+        try:
+            await session.connection(execution_options=READ_ONLY_OPTIONS)
+        except (SQLAlchemyError, OSError) as e:
+            await session.close()
+            replica.failures += 1
+            replica.unhealthy_until = time.monotonic() + self._failure_cooldown_seconds
+            self._primary_reads += 1
+            logger.warning(
+                f"Read replica unavailable, falling back to primary: "
+                f"{self._name(replica)} ({e})"
+            )
+            return None
+
+        replica.sessions += 1
+        return session
+
+    def stats(self) -> dict[str, Any]:
+        """Returns per-replica health and load."""
+        now = time.monotonic()
+        return {
+            "primary_reads": self._primary_reads,
+            "replicas": {
+                self._name(replica): {
+                    "healthy": replica.unhealthy_until <= now,
+                    "checked_out": replica.engine.pool.checkedout(),  # type: ignore[attr-defined]
+                    "sessions": replica.sessions,
+                    "failures": replica.failures,
+                }
+                for replica in self._replicas
+            },
+        }
+
+    async def dispose(self) -> None:
+        """Closes the connection pools of all replicas."""
+        for replica in self._replicas:
+            await replica.engine.dispose()
+
+    def _choose(self) -> _Replica | None:
+        if not self._replicas:
+            return None
+
+        last_commit_at = _last_commit_at.get()
+        now = time.monotonic()
+        if (
+            last_commit_at is not None
+            and now - last_commit_at < self._read_your_writes_seconds
+        ):
+            return None
+
+        if self._selection == "least_connections":
+            healthy = [r for r in self._replicas if r.unhealthy_until <= now]
+            return min(
+                healthy,
+                key=lambda r: r.engine.pool.checkedout(),  # type: ignore[attr-defined]
+                default=None,
+            )
+
+        for _ in range(len(self._replicas)):
+            replica = self._replicas[next(self._round_robin)]
+            if replica.unhealthy_until <= now:
+                return replica
+        return None
+
+    @staticmethod
+    def _name(replica: _Replica) -> str:
+        return replica.engine.url.render_as_string(hide_password=True)
@@ -18,6 +18,13 @@ class SessionNotInitializedException(InfrastructureException):
         super().__init__(message)
 
 
+class ReadOnlyUnitOfWorkException(InfrastructureException):
+    """Exception for commits on a read-only unit of work"""
+
+    def __init__(self, message: str = "Read-only unit of work cannot commit changes."):
+        super().__init__(message)
+
+
 class DatabaseConnectionException(InfrastructureException):
     """Base exception for database connection errors"""
 
@@ -0,0 +1,31 @@
+import logging
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+type MetricsSource = Callable[[], dict[str, Any]]
+
+
+class MetricsRegistry:
+    """Registry collecting runtime counters from named sources."""
+
+    def __init__(
+        self,
+        sources_list: list[dict[str, MetricsSource]] | None = None,
+    ) -> None:
+        """Initializes the registry with optional sources."""
+        self._sources: dict[str, MetricsSource] = {}
+        if sources_list:
+            for sources in sources_list:
+                self._sources.update(sources)
+
+    def collect(self) -> dict[str, dict[str, Any]]:
+        """Reads every source, skipping the ones that fail."""
+        snapshot: dict[str, dict[str, Any]] = {}
+        for name, source in self._sources.items():
+            try:
+                snapshot[name] = source()
+            except Exception as e:
+                logger.warning(f"Metrics source {name} failed: {e}")
+        return snapshot
@@ -0,0 +1,92 @@
+from typing import Any
+
+
+class AdaptiveBatchController:
+    """Sizes outbox batches and paces idle polling from recent batches.
+
+    The batch size doubles while batches come back full without failures
+    and finish within the target latency, so a backlog drains in fewer
+    round trips. It halves when a batch has failures, and shrinks by a
+    quarter when a batch overruns the target latency.
+
+    The idle poll interval starts at the minimum and doubles with every
+    empty batch, up to the maximum, and resets once events show up.
+
+    Args:
+        min_batch_size: Smallest batch size, also the initial one.
+        max_batch_size: Largest batch size.
+        target_latency_seconds: Time a batch should take at most.
+        min_idle_interval: First idle poll interval, in seconds.
+        max_idle_interval: Longest idle poll interval, in seconds.
+    """
+
+    def __init__(
+        self,
+        min_batch_size: int = 20,
+        max_batch_size: int = 500,
+        target_latency_seconds: float = 1.0,
+        min_idle_interval: float = 0.5,
+        max_idle_interval: float = 5.0,
+    ) -> None:
+        """Initializes the controller."""
+        self._min_batch_size = min_batch_size
+        self._max_batch_size = max(max_batch_size, min_batch_size)
+        self._target_latency_seconds = target_latency_seconds
+        self._min_idle_interval = min_idle_interval
+        self._max_idle_interval = max(max_idle_interval, min_idle_interval)
+        self._batch_size = min_batch_size
+        self._idle_rounds = 0
+        self._last_latency_seconds = 0.0
+        self._batches = 0
+        self._events = 0
+        self._failures = 0
+
+    @property
+    def batch_size(self) -> int:
+        """Number of events to claim in the next batch."""
+        return self._batch_size
+
+    @property
+    def idle_interval(self) -> float:
+        """Seconds to wait for events after an empty batch."""
+        return min(
+            self._min_idle_interval * 2.0 ** max(self._idle_rounds - 1, 0),
+            self._max_idle_interval,
+        )
+
+    def record(self, claimed: int, failed: int, latency_seconds: float) -> None:
+        """Adjusts the batch size and idle interval after a batch.
+
+        Args:
+            claimed: Number of events claimed.
+            failed: Number of events whose dispatch failed.
+            latency_seconds: Time from claim to finalization.
+        """
+        if claimed == 0:
+            # Bounded, as the interval is capped long before
+            self._idle_rounds = min(self._idle_rounds + 1, 32)
+            return
+
+        self._idle_rounds = 0
+        self._batches += 1
+        self._events += claimed
+        self._failures += failed
+        self._last_latency_seconds = latency_seconds
+
+        if failed:
+            self._batch_size = max(self._batch_size // 2, self._min_batch_size)
+        elif latency_seconds > self._target_latency_seconds:
+            self._batch_size = max(self._batch_size * 3 // 4, self._min_batch_size)
+        elif claimed >= self._batch_size:
+            self._batch_size = min(self._batch_size * 2, self._max_batch_size)
+
+    def stats(self) -> dict[str, Any]:
+        """Returns the current batch size, idle interval and counters."""
+        return {
+            "batch_size": self._batch_size,
+            "idle_interval": self.idle_interval if self._idle_rounds else 0.0,
+            "last_latency_seconds": self._last_latency_seconds,
+            "batches": self._batches,
+            "events": self._events,
+            "failures": self._failures,
+        }
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+
+import asyncpg
+
+from shared.infrastructure.outbox.mixin import OutboxMixin
+
+logger = logging.getLogger(__name__)
+
+
+def outbox_channel(outbox_model: type[OutboxMixin]) -> str:
+    """Returns the notification channel of an outbox table.
+
+    Args:
+        outbox_model: Model class for the outbox table.
+
+    Returns:
+        str: The channel, named after the table.
+    """
+    return str(outbox_model.__tablename__)  # type: ignore[attr-defined]
+
+
+class OutboxNotificationListener:
+    """Listens for notifications of new outbox rows.
+
+    Units of work notify the channel of the outbox table in the transaction
+    that writes outbox rows, so the notification arrives once the rows are
+    committed. The listener holds a dedicated connection outside the pool
+    and reconnects after connection loss. Whenever it starts listening it
+    also signals a wakeup, as rows written in the meantime were not
+    announced.
+
+    Args:
+        dsn: PostgreSQL DSN understood by asyncpg.
+        channel: Notification channel to listen on.
+        reconnect_delay_seconds: Pause before reconnecting.
+    """
+
+    def __init__(
+        self, dsn: str, channel: str, reconnect_delay_seconds: float = 5.0
+    ) -> None:
+        """Initializes the listener."""
+        self._dsn = dsn
+        self._channel = channel
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._notified = asyncio.Event()
+
+    async def wait(self, timeout: float) -> bool:
+        """Waits for a notification, consuming it.
+
+        Notifications received since the last wait return immediately.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            bool: True if notified, False on timeout.
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                await self._notified.wait()
+        except TimeoutError:
+            return False
+        self._notified.clear()
+        return True
+
+    async def run_forever(self) -> None:
+        """Keeps a listening connection open until cancelled."""
+        while True:
+            try:
+                await self._listen()
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(
+                    f"Outbox listener on {self._channel} unavailable, polling only: {e}"
+                )
+            await asyncio.sleep(self._reconnect_delay_seconds)
+
+    async def _listen(self) -> None:
+        connection = await asyncpg.connect(self._dsn)
+        closed = asyncio.Event()
+        connection.add_termination_listener(lambda _: closed.set())
+        try:
+            await connection.add_listener(self._channel, self._on_notification)
+            logger.info(f"Outbox listener started on {self._channel}")
+            self._notified.set()
+            await closed.wait()
+            logger.warning(f"Outbox listener on {self._channel} lost its connection")
+        finally:
+            if not connection.is_closed():
+                connection.terminate()
+
+    def _on_notification(self, *_: object) -> None:
+        self._notified.set()
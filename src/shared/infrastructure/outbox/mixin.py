@@ -11,6 +11,7 @@ class OutboxStatus(StrEnum):
     """Enumeration of outbox message statuses."""
 
     PENDING = "PENDING"
+    IN_FLIGHT = "IN_FLIGHT"
     PROCESSED = "PROCESSED"
     FAILED = "FAILED"
 
@@ -26,6 +27,7 @@ class OutboxMixin(MappedAsDataclass):
         attempts: Number of processing attempts.
         scheduled_at: Next scheduled processing time.
         last_error: Error message if last attempt failed.
+        lease_until: When a claim by a processor expires.
         occurred_at: Timestamp of event occurrence.
         processed_at: Timestamp of successful processing.
     """
@@ -52,6 +54,10 @@ class OutboxMixin(MappedAsDataclass):
 
     last_error: Mapped[str | None] = mapped_column(String, nullable=True, init=False)
 
+    lease_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, init=False
+    )
+
     occurred_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(UTC), init=False
     )
@@ -1,25 +1,92 @@
 import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from datetime import UTC, datetime, timedelta
+from typing import Any, NamedTuple, cast
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    CursorResult,
+    DateTime,
+    Integer,
+    Row,
+    String,
+    and_,
+    any_,
+    bindparam,
+    case,
+    column,
+    func,
+    or_,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
 
 from shared.application.ports import DomainEventBus, DomainEventRegistry
+from shared.infrastructure.outbox.batch_controller import AdaptiveBatchController
+from shared.infrastructure.outbox.listener import OutboxNotificationListener
 from shared.infrastructure.outbox.mixin import OutboxMixin, OutboxStatus
 
 logger = logging.getLogger(__name__)
 
 
+class _Outcome(NamedTuple):
+    """Result of dispatching an outbox event, written back in bulk."""
+
+    status: OutboxStatus
+    attempts: int
+    scheduled_at: datetime
+    last_error: str | None
+
+
 class OutboxProcessor:
     """Processes pending outbox events.
 
+    A batch is claimed in a short transaction that marks its events
+    IN_FLIGHT under a lease, then dispatched outside any transaction, and
+    the outcomes are written in a second short transaction with set-based
+    updates, so connections and row locks are not held while handlers run.
+    Events whose lease expired, e.g. after a crash or a hung handler, are
+    claimed again; the expiry counts as a failed attempt, so such events
+    end up FAILED after MAX_ATTEMPTS like any other failure. Rows are read
+    as plain tuples, not ORM instances.
+
+    The batch controller sizes each batch from how the previous ones went
+    and backs off polling while there is nothing to process. With a
+    notification listener, an idle processor wakes as soon as new events
+    are committed, and polling only catches what was not announced.
+
+    Events of a batch are grouped by the aggregate ID in their payload.
+    Groups are dispatched concurrently, up to dispatch_concurrency events at
+    a time, while the events of a group are dispatched in order. When an
+    event is retried later, the events after it in its group are deferred
+    along with it. Across batches, an event is not claimed while an earlier
+    event of its aggregate waits for a retry or is in flight. Two processors
+    claiming at the same moment can still each take events of the same
+    aggregate, as an event locked by the other claim is skipped rather than
+    seen, so ordering across processors is best effort.
+
+    Groups run in their own tasks, which hold their own task-scoped
+    resources, so cleanup is awaited after each group to release them.
+
     Args:
         session_factory: Factory for DB sessions.
         event_bus: Bus to publish domain events.
         event_registry: Registry to deserialize events.
         outbox_model: Model class for outbox table.
-        batch_size: Number of events to process at once.
+        batch_controller: Controller of batch size and idle polling.
+        lease_seconds: How long a claimed batch is reserved for dispatch.
+        listener: Listener for notifications of new events.
+        dispatch_concurrency: Maximum number of events dispatched at once.
+        ordering_key: Payload key of the aggregate ID events are ordered by.
+        cleanup: Awaited in each group task once its events are dispatched.
     """
 
     MAX_ATTEMPTS = 5
@@ -30,14 +97,24 @@ class OutboxProcessor:
         event_bus: DomainEventBus,
         event_registry: DomainEventRegistry,
         outbox_model: type[OutboxMixin],
-        batch_size: int = 20,
+        batch_controller: AdaptiveBatchController | None = None,
+        lease_seconds: float = 60.0,
+        listener: OutboxNotificationListener | None = None,
+        dispatch_concurrency: int = 8,
+        ordering_key: str = "account_id",
+        cleanup: Callable[[], Awaitable[None]] | None = None,
     ):
         """Initializes the processor."""
         self._session_factory = session_factory
         self._event_bus = event_bus
         self._event_registry = event_registry
         self._outbox_model = outbox_model
-        self._batch_size = batch_size
+        self._batch_controller = batch_controller or AdaptiveBatchController()
+        self._lease_seconds = lease_seconds
+        self._listener = listener
+        self._dispatch_concurrency = dispatch_concurrency
+        self._ordering_key = ordering_key
+        self._cleanup = cleanup
 
     async def _process_batch(self) -> int:
         """Processes a single batch of pending events.
@@ -45,72 +122,320 @@ class OutboxProcessor:
         Returns:
             int: Number of events processed (or attempted).
         """
+        start = time.perf_counter()
         async with self._session_factory() as session:
-            stmt = (
-                select(self._outbox_model)
-                .where(
-                    self._outbox_model.status == OutboxStatus.PENDING,
-                    self._outbox_model.scheduled_at <= datetime.now(UTC),
-                )
-                .order_by(self._outbox_model.occurred_at.asc())
-                .limit(self._batch_size)
-                .with_for_update(skip_locked=True)
-            )
-
-            records = (await session.execute(stmt)).scalars().all()
+            records = await self._claim(session)
             if not records:
+                self._batch_controller.record(0, 0, time.perf_counter() - start)
                 return 0
 
-            processed_count = 0
+            groups: dict[object, list[Row[Any]]] = {}
             for record in records:
-                try:
-                    event_cls = self._event_registry.get_class(record.event_type)
-                    event = event_cls.from_dict(record.payload)
-
-                    await self._event_bus.publish(event)
-
-                    record.status = OutboxStatus.PROCESSED
-                    record.processed_at = datetime.now(UTC)
-                    processed_count += 1
-                    logger.debug(
-                        f"Outbox event processed: {record.event_type} (id={record.id})"
-                    )
-
-                except Exception as e:
-                    record.attempts += 1
-                    record.last_error = str(e)
-
-                    if record.attempts >= self.MAX_ATTEMPTS:
-                        record.status = OutboxStatus.FAILED
-                        logger.warning(
-                            f"Outbox event failed permanently: {record.event_type} "
-                            f"(id={record.id}, attempts={record.attempts})"
-                        )
-                    else:
-                        delay = (2**record.attempts) * 10
-                        record.scheduled_at = datetime.now(UTC) + timedelta(
-                            seconds=delay
-                        )
-                        logger.debug(
-                            f"Outbox event scheduled for retry: {record.event_type} "
-                            f"(id={record.id}, attempt={record.attempts}, delay={delay}s)"  # noqa: E501
-                        )
+                key = record.payload.get(self._ordering_key) or record.id
+                groups.setdefault(key, []).append(record)
 
-            await session.commit()
+            outcomes: dict[UUID, _Outcome] = {}
+            slots = asyncio.Semaphore(self._dispatch_concurrency)
+            async with asyncio.TaskGroup() as tg:
+                for group in groups.values():
+                    tg.create_task(self._dispatch_group(group, slots, outcomes))
+
+            await self._finalize(session, records[0].lease_until, outcomes)
+            processed_count = sum(
+                outcome.status == OutboxStatus.PROCESSED
+                for outcome in outcomes.values()
+            )
+            failed_count = sum(
+                outcomes[record.id].attempts > record.attempts for record in records
+            )
+            self._batch_controller.record(
+                len(records), failed_count, time.perf_counter() - start
+            )
             if processed_count > 0:
                 logger.info(f"Outbox batch processed: {processed_count} events")
             return len(records)
 
-    async def run_forever(self, interval: float = 0.5) -> None:
-        """Runs the processor loop indefinitely.
+    async def _claim(self, session: AsyncSession) -> list[Row[Any]]:
+        """Claims a batch of due events under a lease.
+
+        Events with an earlier event of the same aggregate that waits for a
+        retry or is in flight are skipped, so they cannot overtake it.
+        Reclaiming an expired lease counts as a failed attempt. Events that
+        reach MAX_ATTEMPTS that way are marked FAILED instead of claimed.
 
         Args:
-            interval: Sleep interval between batches when empty.
+            session: Session to claim with; its transaction is committed.
+
+        Returns:
+            list[Row[Any]]: Claimed rows, oldest first.
         """
-        logger.info("Outbox processor started")
-        while True:
-            count = await self._process_batch()
-            if count == 0:
-                await asyncio.sleep(interval)
+        model = self._outbox_model
+        now = func.now()
+        earlier = aliased(model)
+        blocked = (
+            select(earlier.id)
+            .where(
+                earlier.payload[self._ordering_key].as_string()
+                == model.payload[self._ordering_key].as_string(),
+                tuple_(earlier.occurred_at, earlier.id)
+                < tuple_(model.occurred_at, model.id),
+                or_(
+                    earlier.status == OutboxStatus.IN_FLIGHT,
+                    and_(
+                        earlier.status == OutboxStatus.PENDING,
+                        earlier.scheduled_at > now,
+                    ),
+                ),
+            )
+            .exists()
+        )
+        claimable = (
+            select(model.id)
+            .where(
+                ~blocked,
+                or_(
+                    and_(
+                        model.status == OutboxStatus.PENDING,
+                        model.scheduled_at <= now,
+                    ),
+                    and_(
+                        model.status == OutboxStatus.IN_FLIGHT,
+                        model.lease_until < now,
+                    ),
+                ),
+            )
+            .order_by(model.occurred_at.asc())
+            .limit(self._batch_controller.batch_size)
+            .with_for_update(skip_locked=True)
+            .cte("claimable")
+            .prefix_with("MATERIALIZED")
+        )
+        expired = model.status == OutboxStatus.IN_FLIGHT
+        exhausted = and_(expired, model.attempts + 1 >= self.MAX_ATTEMPTS)
+        stmt = (
+            update(model)
+            .where(model.id == claimable.c.id)
+            .values(
+                status=case(
+                    (exhausted, OutboxStatus.FAILED), else_=OutboxStatus.IN_FLIGHT
+                ),
+                attempts=model.attempts + case((expired, 1), else_=0),
+                last_error=case(
+                    (expired, "Lease expired before dispatch finished"),
+                    else_=model.last_error,
+                ),
+                lease_until=case(
+                    (exhausted, None),
+                    else_=now + timedelta(seconds=self._lease_seconds),
+                ),
+            )
+            .returning(
+                model.id,
+                model.status,
+                model.event_type,
+                model.payload,
+                model.attempts,
+                model.scheduled_at,
+                model.last_error,
+                model.occurred_at,
+                model.lease_until,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        rows = (await session.execute(stmt)).all()
+        await session.commit()
+
+        records = []
+        for row in rows:
+            if row.status == OutboxStatus.FAILED:
+                logger.warning(
+                    f"Outbox event failed permanently: {row.event_type} "
+                    f"(id={row.id}, attempts={row.attempts}, lease expired)"
+                )
             else:
-                logger.debug(f"Outbox processed {count} records, continuing...")
+                records.append(row)
+        return sorted(records, key=lambda record: record.occurred_at)
+
+    async def _finalize(
+        self,
+        session: AsyncSession,
+        lease_until: datetime,
+        outcomes: Mapping[UUID, _Outcome],
+    ) -> None:
+        """Writes the outcomes of a batch and ends its lease.
+
+        Processed events are marked in one UPDATE and all others in one
+        UPDATE ... FROM (VALUES ...). Rows are only updated while the lease
+        of the batch holds, so a batch that overran its lease does not
+        overwrite the outcome of the processor that reclaimed it.
+
+        Args:
+            session: Session to write with; its transaction is committed.
+            lease_until: Lease the batch was claimed with.
+            outcomes: Outcome per record ID.
+        """
+        model = self._outbox_model
+        processed = [
+            record_id
+            for record_id, outcome in outcomes.items()
+            if outcome.status == OutboxStatus.PROCESSED
+        ]
+        others = [
+            (record_id, *outcome)
+            for record_id, outcome in outcomes.items()
+            if outcome.status != OutboxStatus.PROCESSED
+        ]
+        updated = 0
+
+        if processed:
+            ids = bindparam(
+                "ids", processed, type_=ARRAY(PG_UUID(as_uuid=True)), unique=True
+            )
+            stmt = (
+                update(model)
+                .where(model.id == any_(ids), model.lease_until == lease_until)
+                .values(
+                    status=OutboxStatus.PROCESSED,
+                    processed_at=func.now(),
+                    lease_until=None,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            updated += cast(CursorResult[Any], await session.execute(stmt)).rowcount
+
+        if others:
+            outcome = values(
+                column("id", PG_UUID(as_uuid=True)),
+                column("status", String),
+                column("attempts", Integer),
+                column("scheduled_at", DateTime(timezone=True)),
+                column("last_error", String),
+                name="outcome",
+            ).data(others)
+            stmt = (
+                update(model)
+                .where(model.id == outcome.c.id, model.lease_until == lease_until)
+                .values(
+                    status=outcome.c.status,
+                    attempts=outcome.c.attempts,
+                    scheduled_at=outcome.c.scheduled_at,
+                    last_error=outcome.c.last_error,
+                    lease_until=None,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            updated += cast(CursorResult[Any], await session.execute(stmt)).rowcount
+
+        await session.commit()
+        if updated < len(outcomes):
+            logger.warning(
+                f"Outbox lease expired before finalization: "
+                f"{len(outcomes) - updated} of {len(outcomes)} events"
+            )
+
+    async def _dispatch_group(
+        self,
+        records: Sequence[Row[Any]],
+        slots: asyncio.Semaphore,
+        outcomes: dict[UUID, _Outcome],
+    ) -> None:
+        """Dispatches the events of one aggregate in order.
+
+        Args:
+            records: Outbox rows of the aggregate, oldest first.
+            slots: Semaphore bounding concurrent dispatches.
+            outcomes: Outcome per record ID, filled in by the group.
+        """
+        try:
+            for index, record in enumerate(records):
+                async with slots:
+                    outcome = outcomes[record.id] = await self._dispatch(record)
+                if outcome.status == OutboxStatus.PENDING:
+                    for later in records[index + 1 :]:
+                        outcomes[later.id] = _Outcome(
+                            OutboxStatus.PENDING,
+                            later.attempts,
+                            outcome.scheduled_at,
+                            later.last_error,
+                        )
+                    return
+        finally:
+            if self._cleanup is not None:
+                await self._cleanup()
+
+    async def _dispatch(self, record: Row[Any]) -> _Outcome:
+        """Publishes the event of a record.
+
+        Args:
+            record: Outbox row to dispatch.
+
+        Returns:
+            _Outcome: What to write back for the record.
+        """
+        try:
+            event_cls = self._event_registry.get_class(record.event_type)
+            event = event_cls.from_dict(record.payload)
+
+            await self._event_bus.publish(event)
+
+            logger.debug(
+                f"Outbox event processed: {record.event_type} (id={record.id})"
+            )
+            return _Outcome(
+                OutboxStatus.PROCESSED,
+                record.attempts,
+                record.scheduled_at,
+                record.last_error,
+            )
+
+        except Exception as e:
+            attempts = record.attempts + 1
+
+            if attempts >= self.MAX_ATTEMPTS:
+                logger.warning(
+                    f"Outbox event failed permanently: {record.event_type} "
+                    f"(id={record.id}, attempts={attempts})"
+                )
+                return _Outcome(
+                    OutboxStatus.FAILED, attempts, record.scheduled_at, str(e)
+                )
+
+            delay = (2**attempts) * 10
+            logger.debug(
+                f"Outbox event scheduled for retry: {record.event_type} "
+                f"(id={record.id}, attempt={attempts}, delay={delay}s)"
+            )
+            return _Outcome(
+                OutboxStatus.PENDING,
+                attempts,
+                datetime.now(UTC) + timedelta(seconds=delay),
+                str(e),
+            )
+
+    async def run_forever(self) -> None:
+        """Runs the processor loop indefinitely.
+
+        After an empty batch, waits for the idle interval of the batch
+        controller, or with a listener, until notified at the latest.
+        """
+        logger.info("Outbox processor started")
+        listener_task = None
+        if self._listener is not None:
+            listener_task = asyncio.create_task(self._listener.run_forever())
+        try:
+            while True:
+                count = await self._process_batch()
+                if count > 0:
+                    logger.debug(f"Outbox processed {count} records, continuing...")
+                elif self._listener is not None:
+                    await self._listener.wait(self._batch_controller.idle_interval)
+                else:
+                    await asyncio.sleep(self._batch_controller.idle_interval)
+        finally:
+            if listener_task is not None:
+                listener_task.cancel()
+                try:
+                    await listener_task
+                except asyncio.CancelledError:
+                    pass
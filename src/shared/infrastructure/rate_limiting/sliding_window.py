@@ -0,0 +1,154 @@
+import time
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class _Window:
+    bucket: int
+    current: int = 0
+    previous: int = 0
+    locked_until: float = 0.0
+
+
+@dataclass(frozen=True)
+class LimiterStats:
+    """Snapshot of limiter state."""
+
+    keys: int
+    locked: int
+    lockouts: int
+
+
+class SlidingWindowLimiter:
+    """In-process sliding-window event counter with lockout, per key.
+
+    Uses the sliding window counter approximation: the count of the previous
+    fixed window is weighted by how much of it still overlaps the sliding
+    window, so each key costs a few integers regardless of the event rate.
+    A key whose count exceeds the limit is locked for lockout_seconds.
+
+    Keys are spread over shards. Each shard drops its stale keys at most once
+    per window, when it is next hit, and a full shard drops its oldest
+    unlocked key, so memory stays bounded when keys are sprayed. Lockouts
+    are never dropped to make room: when every key of a full shard is
+    locked, new keys are refused as if over the limit. Not thread-safe;
+    intended for use from the event loop.
+
+    Args:
+        limit: Maximum events per window.
+        window_seconds: Length of the sliding window.
+        lockout_seconds: How long a key stays locked after exceeding the limit.
+        max_keys: Maximum number of tracked keys.
+        shards: Number of shards the keys are spread over.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window_seconds: float,
+        lockout_seconds: float,
+        max_keys: int = 100_000,
+        shards: int = 16,
+    ) -> None:
+        """Initializes the limiter."""
+        self._limit = limit
+        self._window_seconds = window_seconds
+        self._lockout_seconds = lockout_seconds
+        self._shard_size = max(max_keys // shards, 1)
+        self._shards: list[dict[str, _Window]] = [{} for _ in range(shards)]
+        self._pruned_buckets = [0] * shards
+        self._lockouts = 0
+
+    def retry_after(self, key: str) -> float:
+        """Returns the seconds until the key is unlocked, 0 if not locked."""
+        window = self._shard(key).get(key)
+        if window is None:
+            return 0.0
+        return max(window.locked_until - time.monotonic(), 0.0)
+
+    def hit(self, key: str) -> float:
+        """Records an event for the key, locking it if it exceeds the limit.
+
+        Returns:
+            Seconds until the key is unlocked, 0 if the event is allowed.
+        """
+        now = time.monotonic()
+        index = hash(key) % len(self._shards)
+        shard = self._shards[index]
+        if self._pruned_buckets[index] < self._bucket(now):
+            self._prune(index, now)
+
+        window = shard.get(key)
+        if window is None:
+            if len(shard) >= self._shard_size:
+                retry_after = self._evict(shard, now)
+                if retry_after:
+                    return retry_after
+            window = shard[key] = _Window(bucket=self._bucket(now))
+        if window.locked_until > now:
+            return window.locked_until - now
+
+        self._roll(window, now)
+        window.current += 1
+        if self._estimate(window, now) > self._limit:
+            window.locked_until = now + self._lockout_seconds
+            self._lockouts += 1
+            return self._lockout_seconds
+        return 0.0
+
+    def reset(self, key: str) -> None:
+        """Forgets the events and lockout of the key."""
+        self._shard(key).pop(key, None)
+
+    def stats(self) -> LimiterStats:
+        """Returns the current counters."""
+        now = time.monotonic()
+        return LimiterStats(
+            keys=sum(len(shard) for shard in self._shards),
+            locked=sum(
+                window.locked_until > now
+                for shard in self._shards
+                for window in shard.values()
+            ),
+            lockouts=self._lockouts,
+        )
+
+    def _shard(self, key: str) -> dict[str, _Window]:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _bucket(self, now: float) -> int:
+        return int(now // self._window_seconds)
+
+    def _roll(self, window: _Window, now: float) -> None:
+        bucket = self._bucket(now)
+        if bucket != window.bucket:
+            window.previous = window.current if bucket == window.bucket + 1 else 0
+            window.current = 0
+            window.bucket = bucket
+
+    def _estimate(self, window: _Window, now: float) -> float:
+        elapsed = (now % self._window_seconds) / self._window_seconds
+        return window.previous * (1 - elapsed) + window.current
+
+    def _evict(self, shard: dict[str, _Window], now: float) -> float:
+        """Drops the oldest unlocked key of a full shard.
+
+        Returns:
+            Seconds until the first key unlocks if all are locked, else 0.
+        """
+        for key, window in shard.items():
+            if window.locked_until <= now:
+                del shard[key]
+                return 0.0
+        return min(window.locked_until for window in shard.values()) - now
+
+    def _prune(self, index: int, now: float) -> None:
+        shard = self._shards[index]
+        self._pruned_buckets[index] = self._bucket(now)
+        stale = self._bucket(now) - 1
+        for key in [
+            key
+            for key, window in shard.items()
+            if window.bucket < stale and window.locked_until <= now
+        ]:
+            del shard[key]